@@ -25,3 +25,53 @@ class DigitalFilter:
       The filtered value result.
     """
     raise NotImplementedError('`filter` method is not implemented in abstract class `DigitalFilter`')
+
+  def filter_many(self, samples, out = None, round_values = False):
+    """
+    Generic batch filter interface that filters a whole buffer of values in a single call.
+
+    The default implementation invokes `filter` once per value.
+    Classes derived from `DigitalFilter` should override it to avoid per value method dispatch.
+
+    Args:
+      samples: The buffer of values to be filtered, such as an `array('H')`, `bytearray`, or `memoryview` of raw ADC samples.
+      out: The optional buffer that filtered values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether to round filtered values to the nearest int before writing them into `out`. Required when `out` is an integer buffer and filtered values may be floats. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the filtered values.
+    """
+    if out is None:
+      out = samples
+
+    filter_value = self.filter
+    for i in range(len(samples)):
+      value = filter_value(samples[i])
+      out[i] = round(value) if round_values else value
+
+    return out
+
+  def fuse(self, next_filter: 'DigitalFilter') -> 'DigitalFilter | None':
+    """
+    Attempts to merge this filter with the `next_filter` that directly follows it in a filter chain
+    into a single equivalent `DigitalFilter`. Used by `CompoundDigitalFilter.compile` to remove stages.
+
+    Classes derived from `DigitalFilter` should override this when they can be merged with an adjacent filter.
+    Stateful filters must keep the state of the original filters up to date while the merged filter is used
+    (e.g. by sharing it), since a changed chain is merged again from the original filters.
+
+    Args:
+      next_filter: The `DigitalFilter` that directly follows this filter.
+
+    Returns:
+      The merged `DigitalFilter`, or `None` if the filters cannot be merged. Defaults to `None`.
+    """
+    return None
+
+  def reset(self):
+    """
+    Resets the filter to its initial state so that the next filtered value is treated as the first.
+
+    Classes derived from `DigitalFilter` that keep additional state should extend this method.
+    """
+    self._value = None
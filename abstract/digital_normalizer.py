@@ -25,3 +25,43 @@ class DigitalNormalizer:
       The normalized value result.
     """
     raise NotImplementedError('`normalize` method is not implemented in abstract class `DigitalNormalizer`.')
+
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Generic batch normalize interface that normalizes a whole buffer of values in a single call.
+
+    The default implementation invokes `normalize` once per value.
+    Classes derived from `DigitalNormalizer` should override it to avoid per value method dispatch.
+
+    Args:
+      samples: The buffer of values to be normalized, such as an `array('H')`, `bytearray`, or `memoryview` of raw ADC samples.
+      out: The optional buffer that normalized values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether to round normalized values to the nearest int before writing them into `out`. Required when `out` is an integer buffer such as `array('H')`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the normalized values.
+    """
+    if out is None:
+      out = samples
+
+    normalize_value = self.normalize
+    for i in range(len(samples)):
+      value = normalize_value(samples[i])
+      out[i] = round(value) if round_values else value
+
+    return out
+
+  def fuse(self, next_normalizer: 'DigitalNormalizer') -> 'DigitalNormalizer | None':
+    """
+    Attempts to merge this normalizer with the `next_normalizer` that directly follows it in a normalizer chain
+    into a single equivalent `DigitalNormalizer`. Used by `CompoundDigitalNormalizer.compile` to remove stages.
+
+    Classes derived from `DigitalNormalizer` should override this when they can be merged with an adjacent normalizer.
+
+    Args:
+      next_normalizer: The `DigitalNormalizer` that directly follows this normalizer.
+
+    Returns:
+      The merged `DigitalNormalizer`, or `None` if the normalizers cannot be merged. Defaults to `None`.
+    """
+    return None
@@ -0,0 +1,56 @@
+from array import array
+from random import getrandbits
+from utils.benchmark import per_call_us
+from utils.deadband_filter import DeadbandFilter
+from utils.exp_moving_average_filter import ExpMovingAverageFilter
+from utils.kalman_filter import KalmanFilter
+from utils.median_filter import MedianFilter
+from utils.moving_avergage_filter import MovingAverageFilter
+
+# Compares each filter's per-sample cost, its latency in following a step (e.g. a turned Potentiometer dial),
+# and its residual noise once settled, for a noisy u16 signal that steps from `LOW` to `HIGH`.
+
+SAMPLE_COUNT = 1000
+STEP_IDX = SAMPLE_COUNT // 2
+LOW = 20000
+HIGH = 40000
+NOISE_AMPLITUDE = 100 # Approximately normal noise with a standard deviation of about `NOISE_AMPLITUDE / 2`.
+
+def noise() -> int:
+  """ Sums 4 uniform random values to approximate normal noise without `random.gauss` (missing on MicroPython). """
+  total = 0
+  for _ in range(4):
+    total += getrandbits(8)
+  return (total - 510) * NOISE_AMPLITUDE // 255
+
+samples = array('H', ((LOW if i < STEP_IDX else HIGH) + noise() for i in range(SAMPLE_COUNT)))
+
+filters = {
+  'DeadbandFilter(750)': lambda: DeadbandFilter(750),
+  'ExpMovingAverageFilter(0.1)': lambda: ExpMovingAverageFilter(0.1),
+  'ExpMovingAverageFilter(0.1, fixed)': lambda: ExpMovingAverageFilter(0.1, True),
+  'MovingAverageFilter(16)': lambda: MovingAverageFilter(16),
+  'MedianFilter(5)': lambda: MedianFilter(5),
+  'KalmanFilter()': lambda: KalmanFilter(),
+  'KalmanFilter(adaptive)': lambda: KalmanFilter(adaptive = True),
+}
+
+print(f"{'filter':<40} {'us/sample':>10} {'step latency':>14} {'noise (rms)':>12}")
+
+for name, create_filter in filters.items():
+  digital_filter = create_filter()
+  outputs = [digital_filter.filter(sample) for sample in samples]
+
+  # Number of samples after the step until the output first gets within 10% of the step size from `HIGH`.
+  latency = 0
+  while STEP_IDX + latency < SAMPLE_COUNT and abs(outputs[STEP_IDX + latency] - HIGH) > (HIGH - LOW) // 10:
+    latency += 1
+
+  # RMS deviation of the settled output from the true value, over the last quarter of the samples.
+  settled = outputs[SAMPLE_COUNT * 3 // 4:]
+  noise_rms = (sum((output - HIGH) ** 2 for output in settled) / len(settled)) ** 0.5
+
+  digital_filter = create_filter()
+  cost_us = per_call_us(digital_filter.filter, samples)
+
+  print(f"{name:<40} {cost_us:>10.3f} {latency:>6} samples {noise_rms:>12.1f}")
@@ -0,0 +1,48 @@
+from array import array
+from random import getrandbits
+from utils.benchmark import per_call_us, report
+from utils.exp_moving_average_filter import ExpMovingAverageFilter
+
+SAMPLE_COUNT = 1000
+
+samples = array('H', (getrandbits(16) for _ in range(SAMPLE_COUNT)))
+out = array('H', (0 for _ in range(SAMPLE_COUNT)))
+
+# A full-scale step up and back down, which maximizes the effect of rounding and of the fixed-point multiplier.
+step_samples = array('H', (65535 if SAMPLE_COUNT // 10 <= i < SAMPLE_COUNT // 2 else 0 for i in range(SAMPLE_COUNT)))
+
+def max_difference(smoothing_factor: float, fixed_point: bool, values) -> float:
+  """
+  Measures the largest difference between a filter's output and the exact (unrounded) exponential moving average.
+
+  Args:
+    smoothing_factor: The smoothing factor of the filter.
+    fixed_point: Whether the filter uses fixed-point arithmetic.
+    values: The values to filter.
+
+  Returns:
+    The largest absolute difference, in LSB.
+  """
+  ema = ExpMovingAverageFilter(smoothing_factor, fixed_point)
+  exact = None
+  difference = 0.0
+  for value in values:
+    exact = value if exact is None else exact + smoothing_factor * (value - exact)
+    difference = max(difference, abs(ema.filter(value) - exact))
+  return difference
+
+for smoothing_factor in (0.1, 0.125, 0.01):
+  for fixed_point in (False, True):
+    name = f"EMA({smoothing_factor}, {'fixed' if fixed_point else 'float'})"
+
+    ema = ExpMovingAverageFilter(smoothing_factor, fixed_point)
+    report(f"{name}.filter", per_call_us(ema.filter, samples))
+
+    ema = ExpMovingAverageFilter(smoothing_factor, fixed_point)
+    report(f"{name}.filter_many", per_call_us(lambda buf: ema.filter_many(buf, out, True), [samples]) / SAMPLE_COUNT)
+
+    print(
+      f"{name} max difference from exact EMA: "
+      f"{max_difference(smoothing_factor, fixed_point, samples):.2f} LSB (random), "
+      f"{max_difference(smoothing_factor, fixed_point, step_samples):.2f} LSB (step)"
+    )
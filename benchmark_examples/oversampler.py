@@ -0,0 +1,16 @@
+from machine import ADC
+from utils.oversampler import Oversampler
+
+# Reports the ADC throughput of each oversampling configuration on the Potentiometer ADC pin.
+
+SAMPLE_COUNT = 200
+
+adc = ADC(28)
+
+for (burst_size, mode) in ((1, Oversampler.AVERAGE), (4, Oversampler.AVERAGE), (16, Oversampler.AVERAGE), (16, Oversampler.BIT_GROWTH), (64, Oversampler.BIT_GROWTH)):
+  oversampler = Oversampler(burst_size, mode)
+  for _ in range(SAMPLE_COUNT):
+    oversampler.read(adc)
+
+  name = f"Oversampler({burst_size}, '{mode}')"
+  print(f"{name:<36} {oversampler.effective_bits:>3} bits {oversampler.raw_samples_per_sec:>10.0f} reads/s {oversampler.samples_per_sec:>10.0f} samples/s")
@@ -0,0 +1,18 @@
+from array import array
+from random import getrandbits
+from utils.benchmark import per_call_us, report
+from utils.sorted_window import SortedWindow
+
+# Reports the cost of a `SortedWindow` push by window size, which grows linearly once the list shifts of its sorted index
+# outweigh the interpreted binary searches, to check that the window sizes in use are below that point.
+
+SAMPLE_COUNT = 2000
+
+samples = array('H', (getrandbits(16) for _ in range(SAMPLE_COUNT)))
+
+for size in (5, 7, 15, 31, 63, 127, 255, 511, 1023):
+  window = SortedWindow(size)
+  for sample in samples[:size]: # Fill the window, so that every measured push also evicts a value.
+    window.push(sample)
+
+  report(f"SortedWindow({size}).push", per_call_us(window.push, samples))
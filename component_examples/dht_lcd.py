@@ -25,7 +25,8 @@ def toggle_temperature_unit():
 @InterruptMutex(discard_duplicates = True)
 def output_dht():
   """ Output DHT sensor data to the LCD display. """
-  text = f"T: {dht.temperature()} {dht.temperature_unit}\nH: {dht.humidity()} %"
+  stale_marker = ' *' if dht.stale else ''
+  text = f"T: {dht.temperature()} {dht.temperature_unit}{stale_marker}\nH: {dht.humidity()} %"
   lcd.message(text)
 
 MainLoop.run(output_dht, 1000, cleanup = lcd.clear)
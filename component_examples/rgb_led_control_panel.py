@@ -11,12 +11,22 @@ pot_frequency = Potentiometer(28, digital_normalizer = LinearNormalizer((0, 6553
 buttons = RadioButtonArray([13, 14, 15])
 led = RgbLED(18, 17, 16)
 
-def process_controls():
-  """ Processes the LED control inputs and configures LED intensity and frequency outputs. """
+def print_controls():
+  """ Prints the current LED intensity and frequency outputs. """
+  print("\r", f"Intensity: {led.intensity}    Frequency: {led.freq}", end='               ')
+
+@pot_intensity.change_handler()
+def process_intensity(value: int):
+  """ Configures the selected LED intensity output whenever the intensity control input changes. """
   if buttons.sel_idx is not None:
-    led.color_intensity_u16(buttons.sel_idx, pot_intensity.value)
-    led.color_frequency(buttons.sel_idx, pot_frequency.value)
+    led.color_intensity_u16(buttons.sel_idx, value)
+    print_controls()
 
-  print("\r", f"Intensity: {led.intensity}    Frequency: {led.freq}", end='               ')
+@pot_frequency.change_handler(min_interval_ms = 100)
+def process_frequency(value: int):
+  """ Configures the selected LED frequency output whenever the frequency control input changes. """
+  if buttons.sel_idx is not None:
+    led.color_frequency(buttons.sel_idx, value)
+    print_controls()
 
-MainLoop.run(process_controls, setup = led.on, cleanup = led.off)
+MainLoop.run(lambda: None, 1000, setup = led.on, cleanup = led.off)
@@ -1,29 +1,101 @@
-from machine import Pin
+from machine import Pin, Timer
+from utime import ticks_diff, ticks_us
 from utils.interrupt_listener import InterruptListener
+from utils.pin_debouncer import PinDebouncer
 
 class Button():
   """
   A press Button controlled by Pin input with internal pull up resistor.
   Keeps track of the 'toggle' state based on the sequence of previous button presses.
+
+  The button Pin is debounced by a `PinDebouncer` integrator, sampled from the shared `SamplingScheduler` by default,
+  or, if given a `debounce_ms` time window, by a single Pin IRQ on both edges that ignores edges within the window.
+  Each accepted transition is timestamped with `ticks_us` and runs a small, allocation free state machine, which emits press, release, long press, repeat, and double click events.
+  Every event is queued, in order, on a single `event_listener` (the only one that dispatches in the given `dispatch` mode),
+  which then triggers the event's own `InterruptListener` on the main context, so handlers observe events in the order they occurred
+  even across event types. The `event_code` of each event's own listener holds the event's measured duration in milliseconds:
+  - press: `0`.
+  - release: How long the button was held down.
+  - long press: How long the button has been held down, once it reaches `long_press_ms`.
+  - repeat: How long the button has been held down, every `repeat_ms` after a long press.
+  - double click: The time between the release of the previous click and this press, which is within `double_click_ms`.
   """
 
-  def __init__(self, pin_id, init_toggle_state = False):
+  # Event types, encoded into the low bits of the `event_listener`'s `event_code`, above which is the duration in milliseconds.
+  __PRESS = 0
+  __RELEASE = 1
+  __LONG_PRESS = 2
+  __REPEAT = 3
+  __DOUBLE_CLICK = 4
+  __EVENT_TYPE_BITS = 3
+
+  def __init__(
+    self,
+    pin_id,
+    init_toggle_state = False,
+    debounce_ms: int | None = None,
+    long_press_ms = 800,
+    repeat_ms = 200,
+    double_click_ms = 300,
+    dispatch = InterruptListener.SCHEDULE,
+    debouncer: PinDebouncer | None = None,
+  ):
     """
     Args:
       pin_id: The ID of the Pin that will record the toggle state of the button.
       init_toggle_state: The optional initial toggle state of the button; defaults to `False`.
+      debounce_ms: The optional number of milliseconds after an accepted edge during which further edges are ignored, which handles the button Pin with a Pin IRQ instead of a `PinDebouncer`. Defaults to `None` for a `PinDebouncer`. Not used with a `debouncer`.
+      long_press_ms: The optional number of milliseconds the button must be held down to emit a long press event. Defaults to `800`. If `0`, long press and repeat events are disabled.
+      repeat_ms: The optional period in milliseconds of repeat events while the button is held down after a long press. Defaults to `200`. If `0`, repeat events are disabled.
+      double_click_ms: The optional maximum number of milliseconds between a release and the next press to emit a double click event. Defaults to `300`. If `0`, double click events are disabled.
+      dispatch: The optional dispatch mode of the `event_listener`. See `InterruptListener`. Defaults to `'schedule'`, which keeps the IRQ allocation free.
+      debouncer: The optional `PinDebouncer` that samples the button Pin and confirms its transitions. Defaults to `PinDebouncer.default()` unless given a `debounce_ms`.
     """
     self.__button_pin = Pin(pin_id, Pin.IN, Pin.PULL_UP)
     self.__toggle_state = init_toggle_state
 
+    self.__event_listener = InterruptListener(dispatch = dispatch)
+    self.__event_listener.register_handler(self.__dispatch_event)
     self.__press_listener = InterruptListener()
-    self.__release_listener = InterruptListener(self.toggle)
+    self.__release_listener = InterruptListener()
+    self.__release_listener.register_handler(self.toggle)
+    self.__long_press_listener = InterruptListener()
+    self.__repeat_listener = InterruptListener()
+    self.__double_click_listener = InterruptListener()
+    self.__listeners = ( # Indexed by event type.
+      self.__press_listener,
+      self.__release_listener,
+      self.__long_press_listener,
+      self.__repeat_listener,
+      self.__double_click_listener,
+    )
+
+    self.__debounce_us = (debounce_ms or 0) * 1000
+    self.__long_press_ms = long_press_ms
+    self.__repeat_ms = repeat_ms
+    self.__double_click_us = double_click_ms * 1000
 
-    self.__button_pin.irq(self.__press_listener.listen(), Pin.IRQ_FALLING)
-    self.__button_pin.irq(self.__release_listener.listen(), Pin.IRQ_RISING)
+    self.__pressed = self.__button_pin.value() == 0
+    self.__edge_us = ticks_us()
+    self.__press_us = self.__edge_us
+    self.__release_us = self.__edge_us
+    self.__clicked = False # Whether the last release may begin a double click.
+    self.__long_pressed = False
+    self.__timer = Timer(-1)
+    self.__timer_callback = self.__handle_hold
+
+    if debouncer or debounce_ms is None:
+      self.__level_callback = self.__handle_level
+      (debouncer if debouncer else PinDebouncer.default()).register(self.__button_pin, self.__level_callback)
+    else:
+      self.__edge_callback = self.__handle_edge
+      self.__button_pin.irq(self.__edge_callback, Pin.IRQ_FALLING | Pin.IRQ_RISING)
 
     self.press_handler = self.__press_listener.handler
     self.release_handler = self.__release_listener.handler
+    self.long_press_handler = self.__long_press_listener.handler
+    self.repeat_handler = self.__repeat_listener.handler
+    self.double_click_handler = self.__double_click_listener.handler
 
   @property
   def pressed(self) -> bool:
@@ -39,6 +111,39 @@ class Button():
   def toggle_state(self, value: bool):
     self.__toggle_state = value
 
+  @property
+  def event_listener(self) -> InterruptListener:
+    """
+    The listener that queues every event, in order, and triggers each event's own listener when dispatched.
+    In `'async'` dispatch mode, run its `dispatch_async` coroutine to dispatch the events.
+    """
+    return self.__event_listener
+
+  @property
+  def press_listener(self) -> InterruptListener:
+    """ The listener of press events. """
+    return self.__press_listener
+
+  @property
+  def release_listener(self) -> InterruptListener:
+    """ The listener of release events, whose `event_code` is how long the button was held down in milliseconds. """
+    return self.__release_listener
+
+  @property
+  def long_press_listener(self) -> InterruptListener:
+    """ The listener of long press events, whose `event_code` is how long the button has been held down in milliseconds. """
+    return self.__long_press_listener
+
+  @property
+  def repeat_listener(self) -> InterruptListener:
+    """ The listener of repeat events, whose `event_code` is how long the button has been held down in milliseconds. """
+    return self.__repeat_listener
+
+  @property
+  def double_click_listener(self) -> InterruptListener:
+    """ The listener of double click events, whose `event_code` is the time in milliseconds between the previous release and this press. """
+    return self.__double_click_listener
+
   def toggle(self) -> bool:
     """
     Toggles the button toggle state.
@@ -48,3 +153,79 @@ class Button():
     """
     self.__toggle_state = not self.__toggle_state
     return self.__toggle_state
+
+  def __handle_edge(self, _):
+    """ Handles both edges of the button Pin within the IRQ, ignoring edges within `debounce_ms` of the last accepted edge. """
+    now = ticks_us()
+    pressed = self.__button_pin.value() == 0
+    if pressed != self.__pressed and ticks_diff(now, self.__edge_us) >= self.__debounce_us:
+      self.__handle_transition(pressed, now)
+
+  def __handle_level(self, level: int):
+    """
+    Handles a transition of the button Pin confirmed by the `PinDebouncer`.
+
+    Args:
+      level: The new debounced level of the button Pin.
+    """
+    self.__handle_transition(level == 0, ticks_us())
+
+  def __handle_transition(self, pressed: bool, now: int):
+    """
+    Advances the button state machine upon an accepted transition, emitting press, release, and double click events.
+
+    Args:
+      pressed: Whether the button is now pressed.
+      now: The `ticks_us` timestamp of the transition.
+    """
+    self.__pressed = pressed
+    self.__edge_us = now
+
+    if pressed:
+      self.__press_us = now
+      self.__long_pressed = False
+      self.__queue_event(Button.__PRESS, 0)
+
+      release_gap_us = ticks_diff(now, self.__release_us)
+      if self.__clicked and release_gap_us <= self.__double_click_us:
+        self.__clicked = False # A third click begins a new double click rather than completing another one.
+        self.__queue_event(Button.__DOUBLE_CLICK, release_gap_us // 1000)
+      else:
+        self.__clicked = self.__double_click_us > 0
+
+      if self.__long_press_ms > 0:
+        self.__timer.init(mode = Timer.ONE_SHOT, period = self.__long_press_ms, callback = self.__timer_callback)
+    else:
+      self.__timer.deinit()
+      self.__release_us = now
+      self.__queue_event(Button.__RELEASE, ticks_diff(now, self.__press_us) // 1000)
+
+  def __handle_hold(self, _):
+    """ Handles the hold Timer while the button is held down, emitting a long press event and then repeat events. """
+    if not self.__pressed:
+      return
+
+    held_ms = ticks_diff(ticks_us(), self.__press_us) // 1000
+    if not self.__long_pressed:
+      self.__long_pressed = True
+      self.__clicked = False # A long press does not begin a double click.
+      self.__queue_event(Button.__LONG_PRESS, held_ms)
+      if self.__repeat_ms > 0:
+        self.__timer.init(mode = Timer.PERIODIC, period = self.__repeat_ms, callback = self.__timer_callback)
+    else:
+      self.__queue_event(Button.__REPEAT, held_ms)
+
+  def __queue_event(self, event_type: int, duration_ms: int):
+    """
+    Queues an event on the `event_listener`, allocation free.
+
+    Args:
+      event_type: The type of the event.
+      duration_ms: The measured duration of the event in milliseconds.
+    """
+    self.__event_listener.trigger((duration_ms << Button.__EVENT_TYPE_BITS) | event_type)
+
+  def __dispatch_event(self):
+    """ Triggers the own listener of the event dispatched by the `event_listener`, with the event's duration as its `event_code`. """
+    event_code = self.__event_listener.event_code
+    self.__listeners[event_code & ((1 << Button.__EVENT_TYPE_BITS) - 1)].trigger(event_code >> Button.__EVENT_TYPE_BITS)
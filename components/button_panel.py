@@ -0,0 +1,163 @@
+from machine import Pin
+from sys import platform
+from utils.interrupt_listener import InterruptListener
+from utils.sampling_scheduler import SamplingScheduler
+
+try:
+  from machine import mem32
+except ImportError:
+  mem32 = None
+
+class ButtonPanel:
+  """
+  A panel of press Buttons controlled by Pin inputs with internal pull up resistors,
+  whose states are all read at once as a bitmask rather than through one IRQ per Button.
+
+  On the RP2040 every Pin level is read with a single read of the SIO `GPIO_IN` register,
+  so sampling 16 to 32 Buttons costs the same as sampling one. On other ports each Pin's `value` is read instead.
+  Changes are found by XOR against the previously accepted mask, and a change is only accepted once the mask has read the same
+  for `stable_samples` consecutive samples. Press and release events are triggered on `InterruptListener`s
+  whose `event_code` is the index of the Button within the panel.
+  """
+
+  SIO_GPIO_IN = 0xd0000004
+
+  def __init__(
+    self,
+    pin_ids: list[int],
+    sample_period_ms = 10,
+    stable_samples = 2,
+    scheduler: SamplingScheduler | None = None,
+    sample_phase_ms = 0,
+    dispatch = InterruptListener.SCHEDULE,
+  ):
+    """
+    Args:
+      pin_ids: The IDs of the GPIO Pins of the Buttons, in panel index order.
+      sample_period_ms: The optional sample period in milliseconds at which all Button states are read. Defaults to `10`.
+      stable_samples: The optional number of consecutive identical mask reads that confirm a change. Defaults to `2`.
+      scheduler: The optional `SamplingScheduler` that periodically reads the Button states. Defaults to `SamplingScheduler.default()`.
+      sample_phase_ms: The optional offset in milliseconds of the sampling ticks within the sample period. Defaults to `0`.
+      dispatch: The optional dispatch mode of the press and release listeners. See `InterruptListener`. Defaults to `'schedule'`.
+
+    Raises:
+      ValueError: If `stable_samples` is less than `1`.
+    """
+    if stable_samples < 1:
+      raise ValueError(f"stable_samples must be an int greater than 0; was given {stable_samples}.")
+
+    self.__use_sio = mem32 is not None and platform == 'rp2'
+    self.__stable_samples = stable_samples
+    self.__press_listener = InterruptListener(dispatch = dispatch)
+    self.__release_listener = InterruptListener(dispatch = dispatch)
+    self.pin_ids = pin_ids
+
+    self.__scheduler = scheduler if scheduler else SamplingScheduler.default()
+    self.__sample_callback = self.sample
+    self.__scheduler.register(self.__sample_callback, sample_period_ms, sample_phase_ms)
+
+    self.press_handler = self.__press_listener.handler
+    self.release_handler = self.__release_listener.handler
+
+  @property
+  def pin_ids(self) -> list[int]:
+    """ The IDs of the GPIO Pins of the Buttons, in panel index order. Setting it starts all Buttons as released. """
+    return list(self.__pin_ids)
+
+  @pin_ids.setter
+  def pin_ids(self, value: list[int]):
+    self.__pin_ids = list(value)
+    self.__pins = [Pin(pin_id, Pin.IN, Pin.PULL_UP) for pin_id in self.__pin_ids]
+    self.__gpio_mask = 0
+    for pin_id in self.__pin_ids:
+      self.__gpio_mask |= 1 << pin_id
+
+    self.__stable_mask = 0 # Pressed GPIO bits.
+    self.__candidate_mask = 0
+    self.__candidate_samples = 0
+    self.__pressed_mask = 0 # Pressed panel index bits.
+
+  @property
+  def len(self) -> int:
+    """ The number of Buttons within the panel. """
+    return len(self.__pin_ids)
+
+  @property
+  def pressed_mask(self) -> int:
+    """ The bitmask of the currently pressed Buttons, where bit `i` is set while the Button at index `i` is pressed. """
+    return self.__pressed_mask
+
+  @property
+  def press_listener(self) -> InterruptListener:
+    """ The listener of press events, whose `event_code` is the index of the pressed Button. """
+    return self.__press_listener
+
+  @property
+  def release_listener(self) -> InterruptListener:
+    """ The listener of release events, whose `event_code` is the index of the released Button. """
+    return self.__release_listener
+
+  @property
+  def scheduler(self) -> SamplingScheduler:
+    """ The `SamplingScheduler` that periodically reads the Button states. """
+    return self.__scheduler
+
+  def pressed(self, idx: int) -> bool:
+    """
+    Gets the pressed state of a Button.
+
+    Args:
+      idx: The 0-based index of the Button within the panel.
+
+    Returns:
+      Whether the Button is currently pressed.
+    """
+    return bool(self.__pressed_mask & (1 << idx))
+
+  def read_mask(self) -> int:
+    """
+    Reads the raw (not debounced) states of all Buttons at once.
+
+    Returns:
+      The bitmask of pressed Buttons by GPIO Pin ID, where bit `n` is set while the Button on GPIO `n` is pressed.
+    """
+    if self.__use_sio:
+      return ~mem32[ButtonPanel.SIO_GPIO_IN] & self.__gpio_mask # Buttons are active low.
+
+    mask = 0
+    pins = self.__pins
+    pin_ids = self.__pin_ids
+    for i in range(len(pins)):
+      if not pins[i].value():
+        mask |= 1 << pin_ids[i]
+    return mask
+
+  def sample(self):
+    """ Reads the states of all Buttons, and triggers press and release events for each confirmed change. """
+    mask = self.read_mask()
+
+    if mask != self.__candidate_mask:
+      self.__candidate_mask = mask
+      self.__candidate_samples = 1
+    elif self.__candidate_samples < self.__stable_samples:
+      self.__candidate_samples += 1
+
+    changed = mask ^ self.__stable_mask
+    if not changed or self.__candidate_samples < self.__stable_samples:
+      return
+
+    self.__stable_mask = mask
+    pin_ids = self.__pin_ids
+    for i in range(len(pin_ids)):
+      bit = 1 << pin_ids[i]
+      if changed & bit:
+        if mask & bit:
+          self.__pressed_mask |= 1 << i
+          self.__press_listener.trigger(i)
+        else:
+          self.__pressed_mask &= ~(1 << i)
+          self.__release_listener.trigger(i)
+
+  def close(self):
+    """ Stops periodically reading the Button states. """
+    self.__scheduler.unregister(self.__sample_callback)
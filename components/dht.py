@@ -1,16 +1,43 @@
-from machine import Timer
+from asyncio import Event, sleep as async_sleep
 from dht import DHT11, DHT22, DHTBase
+from utime import ticks_diff, ticks_ms, ticks_us
+from utils.sampling_scheduler import SamplingScheduler
 
 class DHT(DHTBase):
-  """ A digital humidity and temperature sensor. """
+  """
+  A digital humidity and temperature sensor.
 
-  def __init__(self, version: int, pin_id: int, temperature_unit = 'F', sample_period_ms = 1000):
+  The sensor must not be read more often than its datasheet's minimum interval (`MIN_INTERVAL_MS`),
+  so the time of every physical read attempt is recorded, and a read that would come sooner is skipped
+  in favor of the cached reading (or, in `async_measure`, delayed until the interval has elapsed).
+  """
+
+  MIN_INTERVAL_MS = { 11: 1000, 22: 2000 }
+  LATENCY_TOTAL_LIMIT_US = 1 << 29
+
+  def __init__(
+    self,
+    version: int,
+    pin_id: int,
+    temperature_unit = 'F',
+    sample_period_ms = 1000,
+    scheduler: SamplingScheduler | None = None,
+    sample_phase_ms = 0,
+    max_age_ms = 1000,
+    max_retries = 3,
+    max_backoff_ms = 8000,
+  ):
     """
     Args:
       version: The version of the DHT sensor. Must either be `11` or `22`.
       pin_id: The ID of the GPIO Pin to use for reading DHT sensor values.
       temperature_unit: The optional unit to convert measured temperature values to. Must be either `'F'`, `'C'`, or `'K'`. Defaults to `'F'`.
-      sample_period_ms: The optional sample period in milliseconds, which determines the frequency at which to measure DHT values. Defaults to `1000`. If set to `0` or a negative number, then automatic periodic measurement does not occur, and manual calls to `measure` must be made.
+      sample_period_ms: The optional sample period in milliseconds, which determines the frequency at which to measure DHT values. Clamped to at least the sensor's `MIN_INTERVAL_MS`. Defaults to `1000`. If set to `0` or a negative number, then automatic periodic measurement does not occur, and manual calls to `measure` must be made.
+      scheduler: The optional `SamplingScheduler` that periodically measures DHT values. Defaults to `SamplingScheduler.default()`.
+      sample_phase_ms: The optional offset in milliseconds of the measurement ticks within the sample period, for spreading sampling of several components across scheduler ticks. Defaults to `0`.
+      max_age_ms: The optional maximum age in milliseconds of a cached reading that `async_measure` will return without triggering a new physical measurement. Clamped to at least the sensor's `MIN_INTERVAL_MS`. Defaults to `1000`.
+      max_retries: The optional maximum number of retries after a failed periodic or async measurement. Defaults to `3`.
+      max_backoff_ms: The optional upper bound in milliseconds of the retry delay, which starts at the sensor's minimum interval (`MIN_INTERVAL_MS`) and doubles after each consecutive failure. Defaults to `8000`.
 
     Raises:
       ValueError: If given an invalid `temperature_unit` value. Must be given `'F'`, `'C'`, or `'K'` (case insensitive).
@@ -26,9 +53,95 @@ class DHT(DHTBase):
     else:
       raise ValueError(f"Invalid DHT version. Valid values are 11 or 22; was given {version}.")
 
+    self.__min_interval_ms = DHT.MIN_INTERVAL_MS[version]
+    self.max_age_ms = max_age_ms
+    self.__temperature_c: float = 0.0
+    self.__humidity = 0
+    self.__measured_tick: int | None = None
+    self.__attempt_tick: int | None = None
+    self.__measured_event: Event | None = None
+    self.__measured_error: list[OSError | None] = [None] # The outcome of the shared measurement that `__measured_event` signals.
+    self.__max_retries = max_retries
+    self.__max_backoff_ms = max(max_backoff_ms, self.__min_interval_ms)
+    self.__consecutive_failures = 0
+    self.__stale = True
+    self.reset_stats()
+
+    self.__scheduler = scheduler if scheduler else SamplingScheduler.default()
+    self.__sample_callback = self.__sample
+    self.__sample_period_ms = max(sample_period_ms, self.__min_interval_ms) if sample_period_ms > 0 else sample_period_ms
+    self.__sample_retries = 0
     if sample_period_ms > 0:
-      self.__sampling_timer = Timer(-1) # -1 for lower resource virtual timer
-      self.__sampling_timer.init(period = sample_period_ms, callback = self.measure)
+      self.__scheduler.register(self.__sample_callback, self.__sample_period_ms, sample_phase_ms)
+
+  @property
+  def scheduler(self) -> SamplingScheduler:
+    """ The `SamplingScheduler` that periodically measures DHT values. """
+    return self.__scheduler
+
+  @property
+  def max_age_ms(self) -> int:
+    """
+    The maximum age in milliseconds of a cached reading that `async_measure` will return without triggering a new physical measurement.
+    Clamped to at least the sensor's `MIN_INTERVAL_MS`.
+    """
+    return self.__max_age_ms
+
+  @max_age_ms.setter
+  def max_age_ms(self, value: int):
+    if value < 0:
+      raise ValueError(f"Invalid max_age_ms value. Must be a non-negative number; was given {value}.")
+
+    self.__max_age_ms = max(value, self.__min_interval_ms)
+
+  @property
+  def measured_tick(self) -> int | None:
+    """ The `ticks_ms` timestamp of the cached reading, or `None` if no measurement has been made yet. """
+    return self.__measured_tick
+
+  @property
+  def attempt_tick(self) -> int | None:
+    """ The `ticks_ms` timestamp of the last physical measurement attempt, successful or not, or `None` if none has been made yet. """
+    return self.__attempt_tick
+
+  @property
+  def age_ms(self) -> int | None:
+    """ The age in milliseconds of the cached reading, or `None` if no measurement has been made yet. """
+    return ticks_diff(ticks_ms(), self.__measured_tick) if self.__measured_tick is not None else None
+
+  @property
+  def stale(self) -> bool:
+    """
+    Whether the cached reading is stale, meaning that no measurement has succeeded yet, or the latest measurement failed.
+    While stale, `temperature` and `humidity` keep serving the last good reading.
+    """
+    return self.__stale
+
+  def stats(self) -> dict[str, int]:
+    """
+    Gets the DHT sensor measurement counters since construction or `reset_stats` was called.
+
+    Returns:
+      A dictionary with the number of `successes` and `failures`, the current number of `consecutive_failures`,
+      and the `last_latency_us`, `max_latency_us`, and `mean_latency_us` of measurement attempts in microseconds.
+    """
+    return {
+      'successes': self.__successes,
+      'failures': self.__failures,
+      'consecutive_failures': self.__consecutive_failures,
+      'last_latency_us': self.__last_latency_us,
+      'max_latency_us': self.__max_latency_us,
+      'mean_latency_us': self.__total_latency_us // self.__latency_count if self.__latency_count else 0,
+    }
+
+  def reset_stats(self):
+    """ Resets the DHT sensor measurement counters. """
+    self.__successes = 0
+    self.__failures = 0
+    self.__last_latency_us = 0
+    self.__max_latency_us = 0
+    self.__total_latency_us = 0
+    self.__latency_count = 0
 
   @property
   def version(self) -> int:
@@ -49,16 +162,16 @@ class DHT(DHTBase):
 
   def humidity(self) -> int:
     """
-    Gets the last measured humidity from the DHT sensor.
+    Gets the cached humidity from the last DHT sensor measurement.
 
     Returns:
       The last measured humidity value.
     """
-    return self.__dht_sensor.humidity()
+    return self.__humidity
 
   def temperature(self, unit = '', ndigits = 0) -> float:
     """
-    Gets the last measured temperature from the DHT sensor.
+    Gets the cached temperature from the last DHT sensor measurement.
 
     Args:
       unit: An optional unit conversion for the retrieved temperature. Defaults to the configured `temperature_unit`.
@@ -72,7 +185,7 @@ class DHT(DHTBase):
     """
     unit = unit.upper() if unit else self.temperature_unit
 
-    temperature: float = self.__dht_sensor.temperature()
+    temperature = self.__temperature_c
 
     if unit == 'F':
       temperature = temperature * 1.8 + 32
@@ -83,6 +196,132 @@ class DHT(DHTBase):
 
     return round(temperature, ndigits) if ndigits else int(round(temperature))
 
-  def measure(self, *args, **kwargs):
-    """ Manually triggers a DHT sensor measurement for humidity and temperature. """
-    self.__dht_sensor.measure()
+  def measure(self, *args, **kwargs) -> bool:
+    """
+    Manually triggers a DHT sensor measurement for humidity and temperature, and caches the reading.
+    The measurement is skipped, keeping the cached reading, if the last attempt was less than `MIN_INTERVAL_MS` ago.
+
+    Raises:
+      OSError: If the DHT sensor fails to respond or sends corrupt data. The last good reading is kept, and `stale` is set.
+
+    Returns:
+      Whether a physical measurement was made, or `False` if it was skipped.
+    """
+    if self.__interval_remaining_ms() > 0:
+      return False
+
+    self.__attempt_tick = ticks_ms()
+    start = ticks_us()
+    try:
+      self.__dht_sensor.measure()
+    except OSError:
+      self.__record_latency(start)
+      self.__failures += 1
+      self.__consecutive_failures += 1
+      self.__stale = True
+      raise
+
+    self.__record_latency(start)
+    self.__temperature_c = self.__dht_sensor.temperature()
+    self.__humidity = self.__dht_sensor.humidity()
+    self.__measured_tick = ticks_ms()
+    self.__successes += 1
+    self.__consecutive_failures = 0
+    self.__stale = False
+    return True
+
+  async def async_measure(self, max_age_ms: int | None = None):
+    """
+    Ensures the cached DHT reading is no older than a given max age, measuring the DHT sensor only if it is stale.
+    Concurrent calls share a single physical measurement; those that do not start it wait for it to complete,
+    and every one of them raises the measurement's `OSError` if it fails.
+    If the last physical attempt was less than `MIN_INTERVAL_MS` ago, the measurement waits until the interval has elapsed.
+
+    The bit-banged transfer itself still blocks for a few milliseconds, but it runs on the asyncio event loop
+    instead of inside a Timer callback, and is skipped entirely while the cached reading is fresh.
+    A failed measurement is retried up to `max_retries` times with a bounded exponential backoff.
+
+    Args:
+      max_age_ms: An optional override of the configured `max_age_ms`. Clamped to at least the sensor's `MIN_INTERVAL_MS`.
+
+    Raises:
+      OSError: If the DHT sensor fails every retry, raised to every call sharing the measurement. The last good reading is kept, and `stale` is set.
+    """
+    max_age_ms = self.__max_age_ms if max_age_ms is None else max(max_age_ms, self.__min_interval_ms)
+    age_ms = self.age_ms
+    if age_ms is not None and age_ms < max_age_ms:
+      return
+
+    if self.__measured_event:
+      error = self.__measured_error
+      await self.__measured_event.wait()
+      if error[0]:
+        raise error[0]
+      return
+
+    self.__measured_event = event = Event()
+    self.__measured_error = error = [None]
+    try:
+      # Let other coroutines run and join this measurement before the blocking transfer, for at least the interval remainder.
+      await async_sleep(self.__interval_remaining_ms() / 1000)
+      retries = 0
+      while True:
+        try:
+          self.measure() # Only skipped if another read (e.g. a periodic one) was made meanwhile, which is fresh then.
+          break
+        except OSError as e:
+          if retries >= self.__max_retries:
+            error[0] = e
+            raise
+          retries += 1
+          await async_sleep(self.__retry_delay_ms() / 1000)
+    finally:
+      self.__measured_event = None
+      event.set()
+
+  def __sample(self):
+    """
+    Periodically measures the DHT sensor, without letting failures escape the scheduler's Timer callback.
+    After a failure, sampling is re-registered to retry once the retry delay has elapsed, until a measurement succeeds
+    or `max_retries` is exhausted, and then resumes the sample period counted from the last attempt.
+    """
+    try:
+      self.measure()
+    except OSError:
+      if self.__sample_retries < self.__max_retries:
+        self.__sample_retries += 1
+        retry_delay_ms = self.__retry_delay_ms()
+        self.__scheduler.register(self.__sample_callback, retry_delay_ms, delay_ms = retry_delay_ms)
+        return
+
+    if self.__sample_retries:
+      self.__sample_retries = 0
+      self.__scheduler.register(self.__sample_callback, self.__sample_period_ms, delay_ms = self.__sample_period_ms)
+
+  def __interval_remaining_ms(self) -> int:
+    """ The number of milliseconds until the sensor's minimum interval since the last physical attempt has elapsed, or `0` if it has. """
+    if self.__attempt_tick is None:
+      return 0
+    return max(self.__min_interval_ms - ticks_diff(ticks_ms(), self.__attempt_tick), 0)
+
+  def __retry_delay_ms(self) -> int:
+    """ The delay in milliseconds before the next retry, doubling from the sensor's minimum interval up to `max_backoff_ms`. """
+    shift = min(self.__consecutive_failures - 1, 16)
+    return min(self.__min_interval_ms << shift, self.__max_backoff_ms)
+
+  def __record_latency(self, start: int):
+    """
+    Records the latency of a measurement attempt.
+
+    Args:
+      start: The `ticks_us` timestamp of the start of the measurement attempt.
+    """
+    latency_us = ticks_diff(ticks_us(), start)
+    self.__last_latency_us = latency_us
+    self.__total_latency_us += latency_us
+    self.__latency_count += 1
+    if self.__total_latency_us >= DHT.LATENCY_TOTAL_LIMIT_US: # Halve both to stay within MicroPython's small int range.
+      self.__total_latency_us >>= 1
+      self.__latency_count = (self.__latency_count + 1) >> 1
+    if latency_us > self.__max_latency_us:
+      self.__max_latency_us = latency_us
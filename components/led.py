@@ -1,14 +1,17 @@
 from machine import PWM, Pin
+from utils.gamma_normalizer import GammaNormalizer
 
 class LED:
   """ An LED controlled by PWM (Pulse Width Modulation) Pin output. """
 
-  def __init__(self, pin_id: int, freq = 1000):
+  def __init__(self, pin_id: int, freq = 1000, gamma: GammaNormalizer | None = None):
     """
     Args:
       pin_id: The ID of the Pin that will control the LED.
       freq: The optional PWM frequency (Hz) for the LED; defaults to `1000`.
+      gamma: The optional `GammaNormalizer` that corrects `intensity` values for perceptual brightness. Defaults to `None` for a linear mapping.
     """
+    self.__gamma = gamma
     self.__led_pin = PWM(Pin(pin_id, Pin.OUT))
     self.__led_pin.freq(freq)
     self.__led_pin.duty_u16(0)
@@ -35,16 +38,35 @@ class LED:
       raise ValueError(f"intensity_u16 must be an int in range [0, 65535]; was given {value}.")
     self.__led_pin.duty_u16(value)
 
+  @property
+  def gamma(self) -> GammaNormalizer | None:
+    """ The `GammaNormalizer` that corrects `intensity` values for perceptual brightness, or `None` for a linear mapping. """
+    return self.__gamma
+
+  @gamma.setter
+  def gamma(self, value: GammaNormalizer | None):
+    intensity = self.intensity
+    self.__gamma = value
+    self.intensity = intensity # Keep the perceived intensity.
+
   @property
   def intensity(self) -> int:
-    """ The intensity (PWM duty cycle) of the LED in range `[0, 255]`. """
+    """
+    The intensity (PWM duty cycle) of the LED in range `[0, 255]`.
+    If there is a `gamma` correction, then it is the perceptual brightness of the LED.
+    """
+    if self.__gamma:
+      return self.__gamma.invert(self.intensity_u16)
     return round(self.intensity_u16 / 65535 * 255)
 
   @intensity.setter
   def intensity(self, value: int):
     if value < 0 or value > 255:
       raise ValueError(f"intensity must be an int in range [0, 255]; was given {value}.")
-    self.intensity_u16 = round(value / 255 * 65535)
+    if self.__gamma:
+      self.__led_pin.duty_u16(self.__gamma.table[round(value)]) # Rounded like the linear mapping, so float intensities work too.
+    else:
+      self.intensity_u16 = round(value / 255 * 65535)
 
   def on(self, intensity = 255, freq = 1000):
     """
@@ -1,18 +1,29 @@
 from machine import ADC, Timer
+from utime import ticks_diff, ticks_ms, ticks_us
 from abstract.digital_filter import DigitalFilter
 from abstract.digital_normalizer import DigitalNormalizer
 from utils.deadband_filter import DeadbandFilter
+from utils.irq_timing import IrqTiming
 from utils.linear_normalizer import LinearNormalizer
+from utils.oversampler import Oversampler
+from utils.sampling_scheduler import SamplingScheduler
 
 class Potentiometer:
   """ A Potentiometer (variable resistor dial) for producing and measuring analog voltage input on an ADC Pin. """
 
+  ADAPTIVE_IDLE_SAMPLES = 10
+
   def __init__(
     self,
     pin_id: int,
     sample_period_ms = 100,
     digital_filter: DigitalFilter | None = None,
     digital_normalizer: DigitalNormalizer | None = None,
+    oversampler: Oversampler | None = None,
+    scheduler: SamplingScheduler | None = None,
+    sample_phase_ms = 0,
+    max_sample_period_ms: int | None = None,
+    timing: IrqTiming | None = None,
   ):
     """
     Args:
@@ -20,45 +31,271 @@ class Potentiometer:
       sample_period_ms: The optional sample period in milliseconds, which determines the frequency at which to sample Potentiometer values. Defaults to `100`. If set to `0` or a negative number, then sampling does not occur, and the voltage value is read directly on each value property read.
       digital_filter: The optional `DigitalFilter` to apply to the sample voltage values. Defaults to a `DeadbandFilter(750, (1000, 64535))`. Supply `IdentityFilter` if no filtering should be applied.
       digital_normalizer: The optional `DigitalNormalizer` to apply to the sample voltage values after any filtering is performed. Defaults to `LinearNormalizer((0, 65535), (0, 100))`. Supply `IdentityNormalizer` if no normalization should be applied.
+      oversampler: The optional `Oversampler` that bursts several ADC reads per sample and decimates them into one sample voltage value before any filtering is performed. Defaults to `None` for a single ADC read per sample.
+      scheduler: The optional `SamplingScheduler` that periodically samples Potentiometer values. Defaults to `SamplingScheduler.default()`.
+      sample_phase_ms: The optional offset in milliseconds of the sampling ticks within the sample period, for spreading sampling of several components across scheduler ticks. Defaults to `0`.
+      max_sample_period_ms: The optional maximum sample period in milliseconds for adaptive sampling. If given, the sample period doubles (up to this maximum) after every `ADAPTIVE_IDLE_SAMPLES` consecutive samples whose filtered value did not change, and drops back to `sample_period_ms` as soon as it changes. Defaults to `None` for a fixed sample period.
+      timing: The optional `IrqTiming` that records the latency (from scheduler tick entry) and duration of each `sample_value` call. Defaults to `None` for no instrumentation.
     """
     self.__pot_pin = ADC(pin_id)
     self.__value_u16 = 0
     self.__value = 0
     self.__digital_filter = digital_filter if digital_filter else DeadbandFilter(750, (1000, 64535))
     self.__digital_normalizer = digital_normalizer if digital_normalizer else LinearNormalizer((0, 65535), (0, 100))
-    if sample_period_ms > 0:
-      self.__sampling_timer = Timer(-1) # -1 for lower resource virtual timer
-      self.__sampling_timer.init(period = sample_period_ms, callback = self.sample_value)
+    self.__oversampler = oversampler
+    self.timing = timing
+    self.__scheduler = scheduler if scheduler else SamplingScheduler.default()
+    self.__sample_callback = self.sample_value # Keep a single bound method to register and unregister.
+    self.__sample_phase_ms = sample_phase_ms
+    self.__sampling = False
+    self.__registered_change_handlers: list[list] = [] # [handler, min_delta, min_interval_ms, last value, last tick]
+    self.__sample_period_ms = sample_period_ms
+    self.__max_sample_period_ms = max_sample_period_ms
+    self.__configure_sampling()
     self.sample_value()
 
   @property
   def value(self) -> int:
     """ The most recent filtered sample value with normalization applied. """
-    if self.__sampling_timer is None: # If no periodic sampling, then use polling.
+    if not self.__sampling: # If no periodic sampling, then use polling.
       self.sample_value()
     return self.__value
 
   @property
   def value_u16(self) -> int:
     """ The most recent filtered sample value in range `[0, 65535]`. """
-    if self.__sampling_timer is None: # If no periodic sampling, then use polling.
+    if not self.__sampling: # If no periodic sampling, then use polling.
       self.sample_value()
     return self.__value_u16
 
+  @property
+  def timing(self) -> IrqTiming | None:
+    """
+    The `IrqTiming` that records the latency (from the entry of the scheduler tick that invoked it) and duration
+    of each `sample_value` call, or `None` for no instrumentation.
+    """
+    return self.__timing
+
+  @timing.setter
+  def timing(self, value: IrqTiming | None):
+    self.__timing = value
+
+  @property
+  def oversampler(self) -> Oversampler | None:
+    """ The `Oversampler` that bursts several ADC reads per sample, or `None` for a single ADC read per sample. """
+    return self.__oversampler
+
+  @property
+  def sample_period_ms(self) -> int:
+    """
+    The sample period in milliseconds, which determines the frequency at which to sample Potentiometer values.
+    If `0` or a negative number, then sampling does not occur, and the voltage value is read directly on each value property read.
+    """
+    return self.__sample_period_ms
+
+  @sample_period_ms.setter
+  def sample_period_ms(self, value: int):
+    self.__sample_period_ms = value
+    self.__configure_sampling()
+
+  @property
+  def max_sample_period_ms(self) -> int | None:
+    """
+    The maximum sample period in milliseconds for adaptive sampling, or `None` for a fixed sample period.
+    When adaptive, the sample period doubles (up to this maximum) after every `ADAPTIVE_IDLE_SAMPLES` consecutive samples
+    whose filtered value did not change, and drops back to `sample_period_ms` as soon as it changes.
+    """
+    return self.__max_sample_period_ms
+
+  @max_sample_period_ms.setter
+  def max_sample_period_ms(self, value: int | None):
+    self.__max_sample_period_ms = value
+    self.__configure_sampling()
+
+  @property
+  def current_sample_period_ms(self) -> int:
+    """ The sample period in milliseconds currently in use, which differs from `sample_period_ms` while adaptive sampling has slowed down. """
+    return self.__sample_periods[self.__sample_period_idx] if self.__sampling else self.__sample_period_ms
+
+  def sampling_stats(self) -> dict[int, int]:
+    """
+    Gets the time spent sampling at each sample period since sampling was configured or `reset_sampling_stats` was called.
+
+    Returns:
+      A dictionary mapping each sample period in milliseconds to the total number of milliseconds spent sampling at it.
+    """
+    if not self.__sampling:
+      return {}
+
+    self.__record_sampling_time()
+    return dict(zip(self.__sample_periods, self.__sample_period_times_ms))
+
+  def reset_sampling_stats(self):
+    """ Resets the time spent sampling at each sample period. """
+    self.__sample_period_times_ms = [0] * len(self.__sample_periods)
+    self.__sample_period_tick = ticks_ms()
+
+  @property
+  def scheduler(self) -> SamplingScheduler:
+    """ The `SamplingScheduler` that periodically samples Potentiometer values. """
+    return self.__scheduler
+
+  @property
+  def sample_rate_hz(self) -> float:
+    """ The effective rate in Hz at which (decimated) Potentiometer values are currently sampled, or `0` if not periodically sampled. """
+    return 1000 / self.current_sample_period_ms if self.__sampling else 0.0
+
   def sample_value(self, _: Timer | None = None) -> int:
     """
     Manually samples the current voltage value, filters it using the
     configured `DigitalFilter`, and normalizes it using the configured `DigitalNormalizer`.
 
+    Periodic sampling is driven by the `SamplingScheduler`, which invokes this without arguments.
+    The optional `Timer` argument is ignored; it is only still accepted so that existing code using this as its own `Timer` callback keeps working.
+
+    Args:
+      _: The optional `Timer` whose callback invoked this, which is ignored. Defaults to `None`.
+
     Returns:
       The filtered and normalized sample value.
     """
+    timing = self.__timing
+    if timing is not None:
+      start_us = ticks_us()
+
+    prev_value_u16 = self.__value_u16
+    value_u16 = self.__oversampler.read(self.__pot_pin) if self.__oversampler else self.__pot_pin.read_u16()
+
     if self.__digital_filter:
-      self.__value_u16 = round(self.__digital_filter.filter(self.__pot_pin.read_u16()))
+      self.__value_u16 = round(self.__digital_filter.filter(value_u16))
     else:
-      self.__value_u16 = self.__pot_pin.read_u16()
+      self.__value_u16 = value_u16
 
     if self.__digital_normalizer:
       self.__value = round(self.__digital_normalizer.normalize(self.__value_u16))
 
+    if self.__registered_change_handlers:
+      self.__notify_change_handlers()
+
+    if self.__sampling and len(self.__sample_periods) > 1:
+      self.__adapt_sample_period(self.__value_u16 != prev_value_u16)
+
+    if timing is not None:
+      entry_us = self.__scheduler.tick_start_us
+      timing.record(start_us if entry_us is None else entry_us, start_us, ticks_us())
+
     return self.__value
+
+  def change_handler(self, min_delta = 1, min_interval_ms = 0):
+    """
+    Generates a function decorator that can be used to register a change handler function
+    that will be invoked each time the filtered and normalized sample value changes.
+
+    Args:
+      min_delta: The optional minimum change from the last value the handler was invoked with that invokes the handler again. Defaults to `1`.
+      min_interval_ms: The optional minimum number of milliseconds between handler invocations. Defaults to `0`.
+
+    Returns:
+      The function decorator for marking a decorated function as a change handler.
+    """
+    return lambda handler: self.register_change_handler(handler, min_delta, min_interval_ms)
+
+  def register_change_handler(self, handler, min_delta = 1, min_interval_ms = 0):
+    """
+    Registers a change handler function that will be invoked each time the filtered and normalized sample value changes.
+
+    The handler is invoked with the new value only if it differs by at least `min_delta` from the value the handler
+    was last invoked with, and at least `min_interval_ms` have elapsed since then. A change held back by `min_interval_ms`
+    is delivered by the first sample after the interval elapses, so the handler always ends up with the latest value.
+
+    Args:
+      handler: The change handler function to register. Takes a single argument, the new value.
+      min_delta: The optional minimum change from the last value the handler was invoked with that invokes the handler again. Defaults to `1`.
+      min_interval_ms: The optional minimum number of milliseconds between handler invocations. Defaults to `0`.
+
+    Returns:
+      The registered change handler function.
+    """
+    self.unregister_change_handler(handler)
+    self.__registered_change_handlers.append([handler, max(min_delta, 1), min_interval_ms, self.__value, ticks_ms()])
+    return handler
+
+  def unregister_change_handler(self, handler):
+    """
+    Unregisters a change handler function so that it will no longer be invoked upon value changes.
+
+    Args:
+      handler: The change handler function to unregister.
+    """
+    for registration in self.__registered_change_handlers:
+      if registration[0] == handler:
+        self.__registered_change_handlers.remove(registration)
+        break
+
+  def __notify_change_handlers(self):
+    """ Invokes all registered change handlers whose change and rate limit conditions are met by the current value. """
+    value = self.__value
+    now = ticks_ms()
+
+    for registration in self.__registered_change_handlers:
+      if abs(value - registration[3]) >= registration[1] and ticks_diff(now, registration[4]) >= registration[2]:
+        registration[3] = value
+        registration[4] = now
+        registration[0](value)
+
+  def __configure_sampling(self):
+    """ (Re-)registers periodic sampling with the scheduler and resets adaptive sampling to its fastest sample period. """
+    self.__sampling = self.__sample_period_ms > 0
+    self.__sample_periods = [self.__sample_period_ms]
+    self.__sample_period_idx = 0
+    self.__idle_samples = 0
+
+    if self.__sampling and self.__max_sample_period_ms:
+      while self.__sample_periods[-1] < self.__max_sample_period_ms:
+        self.__sample_periods.append(min(self.__sample_periods[-1] * 2, self.__max_sample_period_ms))
+
+    self.reset_sampling_stats()
+
+    if self.__sampling:
+      self.__scheduler.register(self.__sample_callback, self.__sample_period_ms, self.__sample_phase_ms)
+    else:
+      self.__scheduler.unregister(self.__sample_callback)
+
+  def __adapt_sample_period(self, changed: bool):
+    """
+    Adapts the sample period to the latest sample, dropping to the fastest period upon a change,
+    and doubling it after every `ADAPTIVE_IDLE_SAMPLES` consecutive unchanged samples.
+
+    Args:
+      changed: Whether the filtered value of the latest sample changed.
+    """
+    if changed:
+      self.__idle_samples = 0
+      if self.__sample_period_idx:
+        self.__set_sample_period_idx(0)
+    elif self.__sample_period_idx < len(self.__sample_periods) - 1:
+      self.__idle_samples += 1
+      if self.__idle_samples >= Potentiometer.ADAPTIVE_IDLE_SAMPLES:
+        self.__idle_samples = 0
+        self.__set_sample_period_idx(self.__sample_period_idx + 1)
+
+  def __set_sample_period_idx(self, idx: int):
+    """
+    Switches to another adaptive sample period, and re-registers sampling with the scheduler at it.
+    Slower periods are counted from the sample that switched to them, while the fastest period returns to `sample_phase_ms`.
+
+    Args:
+      idx: The index of the adaptive sample period to switch to.
+    """
+    self.__record_sampling_time()
+    self.__sample_period_idx = idx
+    if idx:
+      self.__scheduler.register(self.__sample_callback, self.__sample_periods[idx], delay_ms = self.__sample_periods[idx])
+    else:
+      self.__scheduler.register(self.__sample_callback, self.__sample_period_ms, self.__sample_phase_ms)
+
+  def __record_sampling_time(self):
+    """ Adds the time elapsed since it was last recorded to the current sample period's total. """
+    now = ticks_ms()
+    self.__sample_period_times_ms[self.__sample_period_idx] += ticks_diff(now, self.__sample_period_tick)
+    self.__sample_period_tick = now
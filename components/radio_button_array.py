@@ -1,29 +1,32 @@
-from components.button import Button
+from components.button_panel import ButtonPanel
 
 class RadioButtonArray:
   """
   An array of radio buttons where only one button can be toggled on at a time
 
+  All buttons are read together by a single `ButtonPanel`, and a button is selected upon its release.
+
   Args:
-    pin_ids: A list containing Pin IDs from which to initialize `Button` objects
+    pin_ids: A list containing Pin IDs from which to initialize the buttons
+    **kwargs: Optional keyword arguments passed on to the `ButtonPanel` (e.g. `sample_period_ms` or `scheduler`)
   """
 
-  def __init__(self, pin_ids: list[int]):
-    self.__buttons = list(map(Button, pin_ids))
+  def __init__(self, pin_ids: list[int], **kwargs):
+    self.__panel = ButtonPanel(pin_ids, **kwargs)
     self.__registered_sel_handlers = []
     self.__sel_idx = None
 
-    for i, button in enumerate(self.__buttons):
-      button.release_interrupt.handler(
-        lambda button_idx = i: # capture current value of i
-          self.__handle_button_release(button_idx))
+    self.__panel.release_listener.register_handler(self.__handle_button_release)
 
-    self.register_sel_handler(self.__handle_button_release)
+  @property
+  def panel(self) -> ButtonPanel:
+    """ The `ButtonPanel` that reads all buttons of the array """
+    return self.__panel
 
   @property
   def len(self) -> int:
     """ The length of the button array """
-    return len(self.__buttons)
+    return self.__panel.len
 
   @property
   def sel_idx(self) -> int | None:
@@ -44,7 +47,7 @@ class RadioButtonArray:
     Args:
       pin_id: The Pin ID from which to initialize the new button.
     """
-    self.__buttons.append(Button(pin_id))
+    self.__panel.pin_ids = self.__panel.pin_ids + [pin_id]
 
   def insert(self, pin_id: int, idx: int):
     """
@@ -54,7 +57,11 @@ class RadioButtonArray:
       pin_id: The Pin ID from which to initialize the new button.
       idx: The index at which to insert the new button.
     """
-    self.__buttons.insert(idx, Button(pin_id))
+    pin_ids = self.__panel.pin_ids
+    pin_ids.insert(idx, pin_id)
+    self.__panel.pin_ids = pin_ids
+    if self.sel_idx is not None and self.sel_idx >= idx:
+      self.__sel_idx = self.sel_idx + 1
 
   def remove(self, idx: int):
     """
@@ -64,9 +71,13 @@ class RadioButtonArray:
     Args:
       idx: The index at which to remove the button.
     """
-    self.__buttons.remove(self.__buttons[idx])
+    pin_ids = self.__panel.pin_ids
+    pin_ids.pop(idx)
+    self.__panel.pin_ids = pin_ids
     if self.sel_idx == idx:
       self.reset()
+    elif self.sel_idx is not None and self.sel_idx > idx:
+      self.__sel_idx = self.sel_idx - 1
 
   def reset(self):
     """ Resets the button array by unselecting any selected button """
@@ -97,13 +108,9 @@ class RadioButtonArray:
     if handler in self.__registered_sel_handlers:
       self.__registered_sel_handlers.remove(handler)
 
-  def __handle_button_release(self, idx: int):
-    """
-    Internally handles button release hardware interrupt events.
-
-    Args:
-      idx: The 0-based index of the button that was released.
-    """
+  def __handle_button_release(self):
+    """ Internally handles button release events, whose `event_code` is the 0-based index of the button that was released. """
+    idx = self.__panel.release_listener.event_code
     if self.sel_idx != idx:
       self.sel_idx = idx
       for handler in self.__registered_sel_handlers:
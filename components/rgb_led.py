@@ -1,4 +1,5 @@
 from components.led import LED
+from utils.gamma_normalizer import GammaNormalizer
 
 class RgbLED:
   """ An RGB LED controlled by PWM Pin output across 3 channels. """
@@ -10,16 +11,17 @@ class RgbLED:
   GREEN = COLOR_CODES[1]
   BLUE = COLOR_CODES[2]
 
-  def __init__(self, red_pin_id: int, green_pin_id: int, blue_pin_id: int):
+  def __init__(self, red_pin_id: int, green_pin_id: int, blue_pin_id: int, gamma: GammaNormalizer | None = None):
     """
     Args:
       red_pin_id: The ID of the Pin that will control the red LED.
       green_pin_id: The ID of the Pin that will control the green LED.
       blue_pin_id: The ID of the Pin that will control the blue LED.
+      gamma: The optional `GammaNormalizer` shared by all color LEDs to correct intensity values for perceptual brightness. Defaults to `None` for a linear mapping.
     """
-    self.__red_led = LED(red_pin_id)
-    self.__green_led = LED(green_pin_id)
-    self.__blue_led = LED(blue_pin_id)
+    self.__red_led = LED(red_pin_id, gamma = gamma)
+    self.__green_led = LED(green_pin_id, gamma = gamma)
+    self.__blue_led = LED(blue_pin_id, gamma = gamma)
 
   @property
   def freq(self) -> tuple[int, int, int]:
@@ -35,6 +37,17 @@ class RgbLED:
       self.__blue_led.freq,
     )
 
+  @property
+  def gamma(self) -> GammaNormalizer | None:
+    """ The `GammaNormalizer` shared by all color LEDs to correct intensity values for perceptual brightness, or `None` for a linear mapping. """
+    return self.__red_led.gamma
+
+  @gamma.setter
+  def gamma(self, value: GammaNormalizer | None):
+    self.__red_led.gamma = value
+    self.__green_led.gamma = value
+    self.__blue_led.gamma = value
+
   @property
   def intensity(self) -> tuple[int, int, int]:
     """
@@ -1,12 +1,45 @@
+from array import array
+from json import dump, load
 from machine import ADC, Pin
+from utils.oversampler import Oversampler
 
 class Thermometer:
-  """ A thermometer sensor that measures temperature using `ADC` voltage readings. """
+  """
+  A thermometer sensor that measures temperature using `ADC` voltage readings.
 
-  def __init__(self, adc_pin: ADC | Pin | int, temperature_unit = 'F'):
+  The sensor measures the Vbe voltage of a biased bipolar diode, which is linear in temperature,
+  so every conversion (including calibration and unit conversion) is precomputed into a single `scale` and `offset` per unit,
+  and a read costs one multiply-add on the raw `read_u16` value.
+  """
+
+  # Typically, Vbe = 0.706V at 27 degrees C, with a slope of -1.721mV (0.001721) per degree.
+  VBE_27C = 0.706
+  VBE_SLOPE = -0.001721
+  VREF = 3.3
+
+  def __init__(
+    self,
+    adc_pin: ADC | Pin | int,
+    temperature_unit = 'F',
+    oversampler: Oversampler | None = None,
+    calibration: tuple[float, float] = (1.0, 0.0),
+  ):
+    """
+    Args:
+      adc_pin: The `ADC`, `Pin`, or ID of the ADC Pin (or channel) that is connected to the temperature sensor.
+      temperature_unit: The optional unit to convert measured temperature values to. Must be either `'F'`, `'C'`, or `'K'`. Defaults to `'F'`.
+      oversampler: The optional `Oversampler` that averages a burst of ADC reads into each reading, which reduces noise. Defaults to `None` for a single read.
+      calibration: The optional `(gain, offset)` calibration applied to measured Celsius temperatures, as produced by `calibrate`. Defaults to `(1.0, 0.0)`.
+
+    Raises:
+      ValueError: If given an invalid `temperature_unit` value. Must be given `'F'`, `'C'`, or `'K'` (case insensitive).
+    """
     self.__sensor_pin = adc_pin if isinstance(adc_pin, ADC) else ADC(adc_pin)
+    self.__oversampler = oversampler
     self.__temperature_unit = 'F'
-    self.__temperature_unit = temperature_unit
+    self.temperature_unit = temperature_unit
+    self.__coefficients: dict[str, tuple[float, float]] = {}
+    self.calibration = calibration
 
   @property
   def temperature_unit(self) -> str:
@@ -18,7 +51,91 @@ class Thermometer:
     if value.strip().upper() not in ['F', 'C', 'K']:
       raise ValueError(f"Invalid temperature_unit value. Must be either 'F', 'C', or 'K'; was given '{value}'.")
 
-    self.__temperature_unit = value.upper()
+    self.__temperature_unit = value.strip().upper()
+
+  @property
+  def oversampler(self) -> Oversampler | None:
+    """ The `Oversampler` that averages a burst of ADC reads into each reading, or `None` for a single read. """
+    return self.__oversampler
+
+  @property
+  def calibration(self) -> tuple[float, float]:
+    """
+    The `(gain, offset)` calibration applied to measured Celsius temperatures, where `calibrated = gain * measured + offset`.
+    Can be stored and later restored by setting it, or with `save_calibration` and `load_calibration`.
+    """
+    return self.__calibration
+
+  @calibration.setter
+  def calibration(self, value: tuple[float, float]):
+    gain, offset = value
+    self.__calibration = (float(gain), float(offset))
+
+    # Fold u16 -> volts -> uncalibrated C -> calibrated C -> unit into one scale and offset per unit.
+    scale_c = gain * Thermometer.VREF / 65535 / Thermometer.VBE_SLOPE
+    offset_c = gain * (27 - Thermometer.VBE_27C / Thermometer.VBE_SLOPE) + offset
+    self.__coefficients = {
+      'C': (scale_c, offset_c),
+      'F': (scale_c * 1.8, offset_c * 1.8 + 32),
+      'K': (scale_c, offset_c + 273.15),
+    }
+
+  def calibrate(self, measured_1: float, actual_1: float, measured_2: float, actual_2: float, unit = ''):
+    """
+    Sets a two-point `calibration` from two temperatures measured by this thermometer and their reference (actual) values.
+    The two points should be as far apart as practical.
+
+    Args:
+      measured_1: The first temperature measured by this thermometer, under its current calibration.
+      actual_1: The reference temperature for `measured_1`.
+      measured_2: The second temperature measured by this thermometer, under its current calibration.
+      actual_2: The reference temperature for `measured_2`.
+      unit: An optional unit of the given temperatures. Defaults to the configured `temperature_unit`.
+
+    Raises:
+      ValueError: If `unit` is not '', `F`, `C`, or `K` (case insensitive).
+      ValueError: If `measured_1` equals `measured_2`.
+    """
+    scale, offset = self.__unit_coefficients(unit)
+    if measured_1 == measured_2:
+      raise ValueError(f"measured_1 and measured_2 must differ; was given {measured_1} for both.")
+
+    # Convert back to raw u16 readings, which are independent of the current calibration.
+    raw_1 = (measured_1 - offset) / scale
+    raw_2 = (measured_2 - offset) / scale
+    actual_1 = self.__to_celsius(actual_1, unit)
+    actual_2 = self.__to_celsius(actual_2, unit)
+
+    scale_c = Thermometer.VREF / 65535 / Thermometer.VBE_SLOPE
+    offset_c = 27 - Thermometer.VBE_27C / Thermometer.VBE_SLOPE
+    uncalibrated_1 = raw_1 * scale_c + offset_c
+    uncalibrated_2 = raw_2 * scale_c + offset_c
+
+    gain = (actual_2 - actual_1) / (uncalibrated_2 - uncalibrated_1)
+    self.calibration = (gain, actual_1 - gain * uncalibrated_1)
+
+  def save_calibration(self, path: str):
+    """
+    Stores the `calibration` in a JSON file.
+
+    Args:
+      path: The path of the file to store the calibration in.
+    """
+    with open(path, 'w') as file:
+      dump(self.__calibration, file)
+
+  def load_calibration(self, path: str):
+    """
+    Restores the `calibration` from a JSON file written by `save_calibration`.
+
+    Args:
+      path: The path of the file to restore the calibration from.
+
+    Raises:
+      OSError: If the file cannot be read.
+    """
+    with open(path) as file:
+      self.calibration = load(file)
 
   def temperature(self, unit = '') -> float:
     """
@@ -33,19 +150,71 @@ class Thermometer:
     Returns:
       The temperature value in the specified `unit`.
     """
-    unit = unit.upper() if unit else self.temperature_unit
-    conversion_factor = 3.3 / (65535)
-    reading = self.__sensor_pin.read_u16() * conversion_factor
+    scale, offset = self.__unit_coefficients(unit)
+    reading = self.__oversampler.read(self.__sensor_pin) if self.__oversampler else self.__sensor_pin.read_u16()
+    return reading * scale + offset
 
-    # The temperature sensor measures the Vbe voltage of a biased bipolar diode, connected to the fifth ADC channel
-    # Typically, Vbe = 0.706V at 27 degrees C, with a slope of -1.721mV (0.001721) per degree.
-    temperature = 27 - (reading - 0.706) / 0.001721
+  def temperatures(self, n: int, unit = '', out: array | None = None) -> array:
+    """
+    Measures a batch of temperatures back to back, e.g. for logging.
 
-    if unit == 'F':
-      temperature = temperature * 9 / 5 + 32
-    elif unit == 'K':
-      temperature = temperature + 273.15
-    elif unit != 'C':
+    Args:
+      n: The number of temperatures to measure.
+      unit: An optional unit conversion for the retrieved temperatures. Defaults to the configured `temperature_unit`.
+      out: An optional preallocated float `array` of at least `n` length to write the temperatures into. Defaults to a new `array('f')`.
+
+    Raises:
+      ValueError: If `unit` is not '', `F`, `C`, or `K` (case insensitive).
+
+    Returns:
+      The `out` array (or a new array) holding the temperature values in the specified `unit`.
+    """
+    scale, offset = self.__unit_coefficients(unit)
+    if out is None:
+      out = array('f', (0.0 for _ in range(n)))
+
+    sensor_pin = self.__sensor_pin
+    oversampler = self.__oversampler
+    for i in range(n):
+      reading = oversampler.read(sensor_pin) if oversampler else sensor_pin.read_u16()
+      out[i] = reading * scale + offset
+
+    return out
+
+  def __unit_coefficients(self, unit: str) -> tuple[float, float]:
+    """
+    Gets the precomputed `(scale, offset)` that converts raw u16 readings to calibrated temperatures in a given unit.
+
+    Args:
+      unit: The temperature unit, or '' for the configured `temperature_unit`.
+
+    Raises:
+      ValueError: If `unit` is not '', `F`, `C`, or `K` (case insensitive).
+
+    Returns:
+      The `(scale, offset)` coefficients.
+    """
+    unit = unit.upper() if unit else self.__temperature_unit
+    coefficients = self.__coefficients.get(unit)
+    if coefficients is None:
       raise ValueError(f"Invalid (temperature) unit value. Must be either 'F', 'C', or 'K'; was given '{unit}'")
 
+    return coefficients
+
+  def __to_celsius(self, temperature: float, unit: str) -> float:
+    """
+    Converts a temperature to Celsius.
+
+    Args:
+      temperature: The temperature value.
+      unit: The unit of the temperature, or '' for the configured `temperature_unit`.
+
+    Returns:
+      The temperature value in Celsius.
+    """
+    unit = unit.upper() if unit else self.__temperature_unit
+    if unit == 'F':
+      return (temperature - 32) / 1.8
+    if unit == 'K':
+      return temperature - 273.15
     return temperature
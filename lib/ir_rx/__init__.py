@@ -6,7 +6,7 @@
 
 from machine import Timer, Pin
 from array import array
-from utime import ticks_us
+from utime import ticks_add, ticks_us
 
 # Save RAM
 # from micropython import alloc_emergency_exception_buf
@@ -44,6 +44,7 @@ class IR_RX():
         self.edge = 0
         self.tim = Timer(-1)  # Software timer
         self.cb = self.decode
+        self._timing = None
 
     # Pin interrupt. Save time of each edge for later decode.
     def _cb_pin(self, line):
@@ -65,6 +66,19 @@ class IR_RX():
     def error_function(self, func):
         self._errf = func
 
+    # Opt-in decode timing. timing is an IrqTiming (or any object with a
+    # record(entry_us, start_us, end_us) method), or None to disable it.
+    # Latency is measured from when the block timer was due to fire.
+    def instrument(self, timing):
+        self._timing = timing
+        self.cb = self.decode if timing is None else self._timed_decode
+
+    def _timed_decode(self, tim):
+        t = ticks_us()
+        due = ticks_add(self._times[0], self._tblock * 1000)
+        self.decode(tim)
+        self._timing.record(due, t, ticks_us())
+
     def close(self):
         self._pin.irq(handler = None)
         self.tim.deinit()
@@ -0,0 +1,138 @@
+"""
+Host (CPython) test setup, which installs minimal fakes of the MicroPython modules that the code under test imports.
+
+The fake clock only advances when a test calls `utime.sleep_ms` or `utime.sleep_us`,
+and fake `Timer` callbacks only fire when a test calls `fire` on the timer.
+"""
+
+import asyncio
+import sys
+from os.path import dirname
+from types import ModuleType
+
+sys.path.insert(0, dirname(dirname(__file__)))
+
+_now_us = [0]
+
+utime = ModuleType('utime')
+utime.ticks_us = lambda: _now_us[0]
+utime.ticks_ms = lambda: _now_us[0] // 1000
+utime.ticks_diff = lambda end, start: end - start
+utime.ticks_add = lambda ticks, delta: ticks + delta
+utime.sleep_us = lambda us: _now_us.__setitem__(0, _now_us[0] + us)
+utime.sleep_ms = lambda ms: _now_us.__setitem__(0, _now_us[0] + ms * 1000)
+sys.modules['utime'] = utime
+
+class Timer:
+  """ A fake `machine.Timer`, whose callback is fired manually. """
+  ONE_SHOT = 0
+  PERIODIC = 1
+  instances = []
+
+  def __init__(self, timer_id = -1):
+    self.callback = None
+    self.period = 0
+    Timer.instances.append(self)
+
+  def init(self, mode = PERIODIC, period = 0, callback = None):
+    self.period = period
+    self.callback = callback
+
+  def deinit(self):
+    self.callback = None
+
+  def fire(self):
+    utime.sleep_ms(self.period)
+    if self.callback:
+      self.callback(self)
+
+class Pin:
+  """ A fake `machine.Pin`, whose level is set manually. """
+  IN = 0
+  OUT = 1
+  PULL_UP = 2
+  IRQ_FALLING = 4
+  IRQ_RISING = 8
+
+  def __init__(self, pin_id, *args, **kwargs):
+    self.id = pin_id
+    self.level = 1
+    self.handler = None
+
+  def value(self, level = None):
+    if level is None:
+      return self.level
+    self.level = level
+
+  def irq(self, handler = None, trigger = None):
+    self.handler = handler
+
+class PWM:
+  """ A fake `machine.PWM`, which only keeps its frequency and duty cycle. """
+
+  def __init__(self, pin):
+    self.pin = pin
+    self.__freq = 0
+    self.__duty_u16 = 0
+
+  def freq(self, value = None):
+    if value is None:
+      return self.__freq
+    self.__freq = value
+
+  def duty_u16(self, value = None):
+    if value is None:
+      return self.__duty_u16
+    self.__duty_u16 = value
+
+class ADC:
+  """ A fake `machine.ADC`, whose raw value is set manually. """
+
+  def __init__(self, pin_id):
+    self.id = pin_id
+    self.value_u16 = 0
+    self.reads = 0
+
+  def read_u16(self):
+    self.reads += 1
+    return self.value_u16
+
+machine = ModuleType('machine')
+machine.Timer = Timer
+machine.Pin = Pin
+machine.PWM = PWM
+machine.ADC = ADC
+sys.modules['machine'] = machine
+
+micropython = ModuleType('micropython')
+micropython.const = lambda value: value
+micropython.schedule = lambda func, arg: func(arg)
+sys.modules['micropython'] = micropython
+
+class DHTBase:
+  """ A fake `dht.DHTBase`, whose measurements fail `failures` times before succeeding. """
+
+  def __init__(self, pin):
+    self.failures = 0
+    self.measure_ticks_ms = []
+
+  def measure(self):
+    self.measure_ticks_ms.append(utime.ticks_ms())
+    if self.failures:
+      self.failures -= 1
+      raise OSError(110)
+
+  def temperature(self):
+    return 21.0
+
+  def humidity(self):
+    return 40
+
+dht = ModuleType('dht')
+dht.DHTBase = DHTBase
+dht.DHT11 = type('DHT11', (DHTBase,), {})
+dht.DHT22 = type('DHT22', (DHTBase,), {})
+sys.modules['dht'] = dht
+
+if not hasattr(asyncio, 'ThreadSafeFlag'):
+  asyncio.ThreadSafeFlag = asyncio.Event
@@ -0,0 +1,72 @@
+from math import cos, hypot, pi, sin
+import pytest
+from utils.biquad_filter import BiquadFilter, bandpass_coefficients, highpass_coefficients, lowpass_coefficients, notch_coefficients
+
+SAMPLE_RATE_HZ = 1000
+FREQ_HZ = 100 # A period of 10 samples.
+OFFSET = 2048 # 12-bit values, as recommended in fixed-point mode.
+AMPLITUDE = 1000
+SETTLE_SAMPLES = 2000
+MEASURE_SAMPLES = 1000 # Whole periods at both `FREQ_HZ` and the Nyquist frequency.
+
+# (design helper, DC gain, gain at `FREQ_HZ`, Nyquist gain)
+DESIGNS = [
+  (lowpass_coefficients, 1.0, 0.7071, 0.0),
+  (highpass_coefficients, 0.0, 0.7071, 1.0),
+  (notch_coefficients, 1.0, 0.0, 1.0),
+  (bandpass_coefficients, 0.0, 1.0, 0.0),
+]
+
+def dc_gain(section, fixed_point: bool) -> float:
+  biquad = BiquadFilter([section], fixed_point)
+  for _ in range(SETTLE_SAMPLES):
+    output = biquad.filter(OFFSET)
+  return output / OFFSET
+
+def gain_at(section, fixed_point: bool, period_samples: int) -> float:
+  """ Measures the gain of a section for a cosine around `OFFSET` by projecting the settled output onto it. """
+  biquad = BiquadFilter([section], fixed_point)
+  (cos_sum, sin_sum, cos_energy, sin_energy) = (0.0, 0.0, 0.0, 0.0)
+
+  for n in range(SETTLE_SAMPLES + MEASURE_SAMPLES):
+    phase = 2 * pi * n / period_samples
+    value = OFFSET + AMPLITUDE * cos(phase)
+    output = biquad.filter(round(value) if fixed_point else value)
+    if n >= SETTLE_SAMPLES:
+      cos_sum += output * cos(phase)
+      sin_sum += output * sin(phase)
+      cos_energy += cos(phase) ** 2
+      sin_energy += sin(phase) ** 2
+
+  # There is no sine component at the Nyquist frequency, where every sample falls on a peak of the cosine.
+  sin_amplitude = sin_sum / sin_energy if sin_energy > 1e-6 else 0.0
+  return hypot(cos_sum / cos_energy, sin_amplitude) / AMPLITUDE
+
+# Q14 coefficient rounding limits the accuracy of fixed-point sections, e.g. the notch only reaches about -42 dB.
+@pytest.mark.parametrize('fixed_point, tolerance', [(False, 1e-3), (True, 1e-2)])
+@pytest.mark.parametrize('design, expected_dc, expected_at_freq, expected_nyquist', DESIGNS)
+def test_design_helper_gains(design, expected_dc, expected_at_freq, expected_nyquist, fixed_point, tolerance):
+  section = design(SAMPLE_RATE_HZ, FREQ_HZ)
+
+  assert dc_gain(section, fixed_point) == pytest.approx(expected_dc, abs = tolerance)
+  assert gain_at(section, fixed_point, SAMPLE_RATE_HZ // FREQ_HZ) == pytest.approx(expected_at_freq, abs = tolerance)
+  assert gain_at(section, fixed_point, 2) == pytest.approx(expected_nyquist, abs = tolerance)
+
+@pytest.mark.parametrize('design', [lowpass_coefficients, highpass_coefficients, notch_coefficients, bandpass_coefficients])
+def test_design_helpers_validate_the_frequency(design):
+  for freq_hz in (0, -1, SAMPLE_RATE_HZ / 2, SAMPLE_RATE_HZ):
+    with pytest.raises(ValueError):
+      design(SAMPLE_RATE_HZ, freq_hz)
+
+def test_output_starts_at_the_first_value_scaled_by_the_dc_gain():
+  for fixed_point in (False, True):
+    biquad = BiquadFilter([lowpass_coefficients(SAMPLE_RATE_HZ, FREQ_HZ), highpass_coefficients(SAMPLE_RATE_HZ, 5)], fixed_point)
+    assert biquad.filter(OFFSET) == pytest.approx(0, abs = 1)
+
+    lowpass = BiquadFilter([lowpass_coefficients(SAMPLE_RATE_HZ, FREQ_HZ)], fixed_point)
+    assert lowpass.filter(OFFSET) == pytest.approx(OFFSET, abs = 1)
+    assert lowpass.filter(OFFSET) == pytest.approx(OFFSET, abs = 1)
+
+def test_sections_are_required():
+  with pytest.raises(ValueError):
+    BiquadFilter([])
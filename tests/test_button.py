@@ -0,0 +1,51 @@
+from machine import Timer
+from utime import sleep_ms
+import utils.interrupt_listener
+from components.button import Button
+from utils.interrupt_listener import InterruptListener
+from utils.pin_debouncer import PinDebouncer
+from utils.sampling_scheduler import SamplingScheduler
+
+def test_events_are_dispatched_in_order_across_event_types(monkeypatch):
+  scheduled = []
+  monkeypatch.setattr(utils.interrupt_listener, 'schedule', lambda func, arg: scheduled.append((func, arg)))
+
+  button = Button(15, debounce_ms = 20)
+  pin = button._Button__button_pin
+  events = []
+  button.press_listener.register_handler(lambda: events.append('press'))
+  button.release_listener.register_handler(lambda: events.append(('release', button.release_listener.event_code)))
+  button.double_click_listener.register_handler(lambda: events.append(('double click', button.double_click_listener.event_code)))
+
+  for level in (0, 1, 0, 1): # Two quick clicks, all handled by the IRQ before any dispatch.
+    sleep_ms(50)
+    pin.value(level)
+    pin.handler(pin)
+
+  while scheduled:
+    func, arg = scheduled.pop(0)
+    func(arg)
+
+  assert events == ['press', ('release', 50), 'press', ('double click', 50), ('release', 50)]
+  assert not button.toggle_state # Toggled by both releases.
+
+def test_button_is_debounced_by_the_default_pin_debouncer():
+  button = Button(16)
+  pin = button._Button__button_pin
+
+  assert PinDebouncer.default().level(pin) == 1
+
+def test_debounced_button_emits_press_and_release():
+  scheduler = SamplingScheduler(10)
+  button = Button(17, debouncer = PinDebouncer(10, 3, scheduler), dispatch = InterruptListener.DIRECT)
+  pin = button._Button__button_pin
+  timer = Timer.instances[-1]
+  events = []
+  button.press_listener.register_handler(lambda: events.append('press'))
+  button.release_listener.register_handler(lambda: events.append(('release', button.release_listener.event_code)))
+
+  for level in (0, 1, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1):
+    pin.value(level)
+    timer.fire()
+
+  assert events == ['press', ('release', 70)]
@@ -0,0 +1,125 @@
+import pytest
+import components.button_panel
+from components.button_panel import ButtonPanel
+from components.radio_button_array import RadioButtonArray
+from utils.interrupt_listener import InterruptListener
+from utils.sampling_scheduler import SamplingScheduler
+
+def make_panel(pin_ids: list[int], **kwargs) -> tuple[ButtonPanel, list]:
+  panel = ButtonPanel(pin_ids, scheduler = SamplingScheduler(10), dispatch = InterruptListener.DIRECT, **kwargs)
+  events = []
+  panel.press_listener.register_handler(lambda: events.append(('press', panel.press_listener.event_code)))
+  panel.release_listener.register_handler(lambda: events.append(('release', panel.release_listener.event_code)))
+  return (panel, events)
+
+def test_changes_are_confirmed_after_stable_samples():
+  (panel, events) = make_panel([2, 5, 7], stable_samples = 3)
+  pin = panel._ButtonPanel__pins[1]
+
+  for level in (0, 1, 0, 0): # A bounce, then two samples of the pressed level.
+    pin.value(level)
+    panel.sample()
+  assert not events
+  assert not panel.pressed(1)
+
+  panel.sample()
+  assert events == [('press', 1)]
+  assert panel.pressed_mask == 0b010
+
+  for _ in range(5): # A held Button is not pressed again.
+    panel.sample()
+  assert events == [('press', 1)]
+
+def test_simultaneous_changes_trigger_events_in_panel_order():
+  (panel, events) = make_panel([9, 3, 4], stable_samples = 1)
+  pins = panel._ButtonPanel__pins
+
+  pins[0].value(0)
+  pins[2].value(0)
+  panel.sample()
+  assert events == [('press', 0), ('press', 2)]
+  assert panel.read_mask() == (1 << 9) | (1 << 4)
+
+  # Only the changed bits of the XOR against the accepted mask trigger events.
+  pins[0].value(1)
+  pins[1].value(0)
+  panel.sample()
+  assert events[2:] == [('release', 0), ('press', 1)]
+  assert panel.pressed_mask == 0b110
+
+def test_pin_values_are_read_without_mem32():
+  (panel, events) = make_panel([1, 2], stable_samples = 1)
+
+  assert not panel._ButtonPanel__use_sio
+  panel._ButtonPanel__pins[1].value(0)
+  assert panel.read_mask() == 1 << 2
+
+def test_rp2_reads_all_pins_from_the_sio_register(monkeypatch):
+  gpio_in = {ButtonPanel.SIO_GPIO_IN: 0xffffffff}
+  monkeypatch.setattr(components.button_panel, 'mem32', gpio_in)
+  monkeypatch.setattr(components.button_panel, 'platform', 'rp2')
+  (panel, events) = make_panel([1, 2, 30], stable_samples = 1)
+
+  gpio_in[ButtonPanel.SIO_GPIO_IN] = ~((1 << 30) | (1 << 5)) & 0xffffffff # GPIO 5 is not in the panel.
+  assert panel.read_mask() == 1 << 30
+  panel.sample()
+  assert events == [('press', 2)]
+
+def test_stable_samples_are_validated():
+  with pytest.raises(ValueError):
+    ButtonPanel([1], stable_samples = 0, scheduler = SamplingScheduler(10))
+
+def click(array: RadioButtonArray, idx: int):
+  pin = array.panel._ButtonPanel__pins[idx]
+  for level in (0, 1):
+    pin.value(level)
+    array.panel.sample()
+    array.panel.sample()
+
+def test_radio_button_array_selects_on_release():
+  array = RadioButtonArray([10, 11, 12], scheduler = SamplingScheduler(10))
+  selected = []
+  array.register_sel_handler(selected.append)
+
+  pin = array.panel._ButtonPanel__pins[1]
+  pin.value(0)
+  array.panel.sample()
+  array.panel.sample()
+  assert array.sel_idx is None
+
+  pin.value(1)
+  array.panel.sample()
+  array.panel.sample()
+  assert array.sel_idx == 1
+
+  click(array, 1) # Already selected.
+  click(array, 2)
+  assert selected == [1, 2]
+
+  array.unregister_sel_handler(selected.append)
+  click(array, 0)
+  assert array.sel_idx == 0
+  assert selected == [1, 2]
+
+def test_radio_button_array_keeps_the_selection_when_buttons_change():
+  array = RadioButtonArray([10, 11], scheduler = SamplingScheduler(10))
+  click(array, 1)
+
+  array.insert(13, 0)
+  assert array.panel.pin_ids == [13, 10, 11]
+  assert array.sel_idx == 2
+
+  array.append(14)
+  assert array.len == 4
+  assert array.sel_idx == 2
+
+  array.remove(0)
+  assert array.sel_idx == 1
+  click(array, 2)
+  assert array.panel.pin_ids[array.sel_idx] == 14
+
+  array.remove(2)
+  assert array.sel_idx is None
+
+  with pytest.raises(IndexError):
+    array.sel_idx = 3
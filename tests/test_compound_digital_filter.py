@@ -0,0 +1,49 @@
+from array import array
+from utils.biquad_filter import BiquadFilter, lowpass_coefficients
+from utils.compound_digital_filter import CompoundDigitalFilter
+
+def biquad_chain() -> CompoundDigitalFilter:
+  return CompoundDigitalFilter([
+    BiquadFilter([lowpass_coefficients(100, 5)]),
+    BiquadFilter([lowpass_coefficients(100, 10)]),
+  ])
+
+def test_reset_discards_fused_state():
+  chain = biquad_chain()
+  for _ in range(200):
+    chain.filter(5000)
+
+  chain.reset()
+
+  assert chain.filter(0) == biquad_chain().filter(0)
+
+def test_filter_many_advances_the_compiled_stages():
+  chain = biquad_chain()
+  chain.filter(0)
+  chain.filter_many(array('f', (5000 for _ in range(200))))
+
+  assert abs(chain.filter(5000) - 5000) < 1
+
+def test_changing_the_chain_keeps_fused_state():
+  for fixed_point in (False, True):
+    stages = [BiquadFilter([lowpass_coefficients(100, cutoff_hz)], fixed_point) for cutoff_hz in (5, 10, 20)]
+    chain = CompoundDigitalFilter(stages[:2])
+    references = [BiquadFilter([lowpass_coefficients(100, cutoff_hz)], fixed_point) for cutoff_hz in (5, 10, 20)]
+    samples = [0] * 10 + [4000] * 50 + [1000] * 50
+
+    def filter_both(sample, reference_count):
+      value = sample
+      for reference in references[:reference_count]:
+        value = reference.filter(value)
+      assert abs(chain.filter(sample) - value) < 0.01
+
+    for sample in samples:
+      filter_both(sample, 2)
+
+    chain.add_filter(stages[2])
+    for sample in samples:
+      filter_both(sample, 3)
+
+    chain.remove_filter(stages[2])
+    for sample in samples:
+      filter_both(sample, 2)
@@ -0,0 +1,19 @@
+import utils.debounce
+from utils.debounce import debounce
+
+TICKS_PERIOD = 1 << 30
+
+def test_debounce_survives_ticks_wraparound(monkeypatch):
+  now = [TICKS_PERIOD - 50]
+  monkeypatch.setattr(utils.debounce, 'ticks_ms', lambda: now[0] % TICKS_PERIOD)
+  monkeypatch.setattr(utils.debounce, 'ticks_diff', lambda end, start: ((end - start + TICKS_PERIOD // 2) % TICKS_PERIOD) - TICKS_PERIOD // 2)
+  calls = []
+  debounced = debounce(lambda: calls.append(now[0]), 100)
+
+  debounced() # The first call is always accepted.
+  now[0] += 99 # Wrapped around, but only 99 ms later.
+  debounced()
+  now[0] += 1
+  debounced()
+
+  assert calls == [TICKS_PERIOD - 50, TICKS_PERIOD + 50]
@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from machine import Timer
+from utime import sleep_ms, ticks_ms
+import components.dht
+from components.dht import DHT
+from utils.sampling_scheduler import SamplingScheduler
+
+def test_failed_reads_are_retried_with_backoff():
+  scheduler = SamplingScheduler(10)
+  sensor = DHT(11, 16, sample_period_ms = 5000, scheduler = scheduler, max_retries = 3)
+  fake_sensor = sensor._DHT__dht_sensor
+  fake_sensor.failures = 3
+  timer = Timer.instances[-1]
+
+  for _ in range(2000): # 20 s of 10 ms ticks.
+    timer.fire()
+
+  ticks_ms = fake_sensor.measure_ticks_ms
+  gaps_ms = [ticks_ms[i + 1] - ticks_ms[i] for i in range(len(ticks_ms) - 1)]
+
+  # Three failures retried after 1 s, 2 s, and 4 s, then the 5 s sample period resumes.
+  assert gaps_ms[:4] == [1000, 2000, 4000, 5000]
+  assert all(gap_ms >= DHT.MIN_INTERVAL_MS[11] for gap_ms in gaps_ms)
+  assert not sensor.stale
+  assert sensor.stats()['failures'] == 3
+
+def test_reads_respect_the_minimum_interval():
+  sensor = DHT(22, 16, sample_period_ms = 0, max_age_ms = 500)
+  fake_sensor = sensor._DHT__dht_sensor
+
+  start_ms = ticks_ms()
+  assert sensor.max_age_ms == DHT.MIN_INTERVAL_MS[22]
+  assert sensor.measure()
+  sleep_ms(1999)
+  assert not sensor.measure() # Served from the cache.
+  sleep_ms(1)
+  assert sensor.measure()
+  assert [tick - start_ms for tick in fake_sensor.measure_ticks_ms] == [0, 2000]
+
+def test_sample_period_is_clamped_to_the_minimum_interval():
+  scheduler = SamplingScheduler(10)
+  sensor = DHT(22, 16, sample_period_ms = 1000, scheduler = scheduler)
+  fake_sensor = sensor._DHT__dht_sensor
+  timer = Timer.instances[-1]
+
+  for _ in range(1000): # 10 s of 10 ms ticks.
+    timer.fire()
+
+  ticks_ms = fake_sensor.measure_ticks_ms
+  assert len(ticks_ms) == 5
+  assert all(ticks_ms[i + 1] - ticks_ms[i] == 2000 for i in range(len(ticks_ms) - 1))
+
+def test_async_measure_waits_for_the_minimum_interval(monkeypatch):
+  async def fake_sleep(seconds):
+    sleep_ms(round(seconds * 1000))
+  monkeypatch.setattr(components.dht, 'async_sleep', fake_sleep)
+
+  sensor = DHT(22, 16, sample_period_ms = 0)
+  fake_sensor = sensor._DHT__dht_sensor
+  fake_sensor.failures = 1
+  start_ms = ticks_ms()
+  with pytest.raises(OSError):
+    sensor.measure()
+  sleep_ms(500)
+
+  asyncio.run(sensor.async_measure(max_age_ms = 0))
+
+  assert [tick - start_ms for tick in fake_sensor.measure_ticks_ms] == [0, 2000]
+
+def test_async_measure_failure_is_raised_to_every_waiter(monkeypatch):
+  async def fake_sleep(seconds):
+    sleep_ms(round(seconds * 1000))
+    await asyncio.sleep(0)
+  monkeypatch.setattr(components.dht, 'async_sleep', fake_sleep)
+
+  sensor = DHT(11, 16, sample_period_ms = 0, max_retries = 1)
+  fake_sensor = sensor._DHT__dht_sensor
+  fake_sensor.failures = 2
+
+  async def main():
+    return await asyncio.gather(*(sensor.async_measure() for _ in range(3)), return_exceptions = True)
+
+  results = asyncio.run(main())
+
+  assert len(fake_sensor.measure_ticks_ms) == 2 # One shared measurement and its retry.
+  assert all(isinstance(result, OSError) for result in results)
+  assert sensor.stale
@@ -0,0 +1,20 @@
+from array import array
+from utils.exp_moving_average_filter import ExpMovingAverageFilter
+
+def test_fixed_point_tracks_exact_average():
+  samples = [0] * 10 + [65535] * 2000 + [1000] * 2000 + [1003] * 500
+
+  for smoothing_factor in (0.3, 0.1, 0.125, 0.01):
+    ema = ExpMovingAverageFilter(smoothing_factor, fixed_point = True)
+    exact = None
+    for value in samples:
+      exact = value if exact is None else exact + smoothing_factor * (value - exact)
+      assert abs(ema.filter(value) - exact) < 1.2
+
+    # Small steps are not lost to rounding.
+    assert ema.value == 1003
+
+    batch = ExpMovingAverageFilter(smoothing_factor, fixed_point = True)
+    out = array('H', (0 for _ in samples))
+    batch.filter_many(array('H', samples), out)
+    assert batch.value == ema.value
@@ -0,0 +1,29 @@
+from utils.exponential_normalizer import ExponentialNormalizer
+
+def test_interpolate_clamps_below_src_min():
+  normalizer = ExponentialNormalizer(16, (0, 1000), (0, 1000), interpolate = True)
+  lowest = normalizer.normalize(0)
+  highest = normalizer.normalize(1000)
+
+  for value in (-1000, -62.5, -30, -0.5):
+    assert normalizer.normalize(value) == lowest
+  for value in (1000.5, 1030, 2000):
+    assert normalizer.normalize(value) == highest
+  assert lowest < normalizer.normalize(30) < normalizer.normalize(62.5)
+
+def test_default_output_follows_the_continuous_curve():
+  normalizer = ExponentialNormalizer(50, (0, 65535))
+  base = 65535 ** (1 / 50)
+  outputs = set()
+
+  for value in range(0, 65536, 97):
+    output = normalizer.normalize(value)
+    outputs.add(output)
+    exact = base ** (value / 65535 * 50)
+    assert abs(output - exact) <= exact * 0.01 + 0.5
+
+  assert len(outputs) > 51 # Not snapped to the `exp_steps + 1` data points.
+
+def test_snapping_is_opt_in():
+  normalizer = ExponentialNormalizer(50, (0, 65535), interpolate = False)
+  assert len({normalizer.normalize(value) for value in range(0, 65536, 97)}) <= 51
@@ -0,0 +1,17 @@
+from utils.gamma_normalizer import GammaNormalizer
+
+def test_invert_returns_first_intensity_of_each_duty():
+  for gamma in (GammaNormalizer(), GammaNormalizer(cie_lightness = True)):
+    table = gamma.table
+    for i in range(256):
+      assert gamma.invert(table[i]) == table.index(table[i])
+
+def test_invert_resolves_to_nearest_intensity_with_ties_low():
+  gamma = GammaNormalizer()
+  table = gamma.table
+  assert gamma.invert(0) == 0
+  for i in range(1, 256):
+    if table[i] - table[i - 1] > 2:
+      assert gamma.invert(table[i] - 1) == i
+      assert gamma.invert(table[i - 1] + 1) == table.index(table[i - 1])
+  assert gamma.invert(65535) == 255
@@ -0,0 +1,26 @@
+import sys
+import pytest
+from utime import sleep_us, ticks_ms
+import utils.debounce
+from utils.interrupt_listener import InterruptListener
+from utils.irq_timing import IrqTiming
+
+def test_direct_latency_is_measured_from_irq_entry(monkeypatch):
+  # The debounce check takes 5 us, and the handler 30 us.
+  monkeypatch.setattr(utils.debounce, 'ticks_ms', lambda: sleep_us(5) or ticks_ms())
+  timing = IrqTiming()
+  listener = InterruptListener(timing = timing)
+  listener.register_handler(lambda: sleep_us(30))
+
+  listener.listen(debounce_ms = 0)(None)
+
+  assert timing.latency.max_us == 5
+  assert timing.duration.max_us == 30
+
+def test_only_async_dispatch_imports_asyncio(monkeypatch):
+  monkeypatch.setitem(sys.modules, 'asyncio', None) # Any import of asyncio now raises ImportError.
+
+  InterruptListener(dispatch = InterruptListener.DIRECT)
+  InterruptListener(dispatch = InterruptListener.SCHEDULE)
+  with pytest.raises(ImportError):
+    InterruptListener(dispatch = InterruptListener.ASYNC)
@@ -0,0 +1,86 @@
+import pytest
+from utils.interrupt_mutex import InterruptMutex
+
+def bound_recorder(mutex: InterruptMutex, name: str, calls: list):
+  return mutex.bind(lambda *args: calls.append((name, *args)))
+
+def test_blocked_calls_run_in_order_on_unlock():
+  mutex = InterruptMutex()
+  calls = []
+  first = bound_recorder(mutex, 'first', calls)
+  second = bound_recorder(mutex, 'second', calls)
+
+  with mutex:
+    first(1)
+    second(2)
+    first(3)
+    assert calls == []
+    assert mutex.pending == 3
+
+  assert calls == [('first', 1), ('second', 2), ('first', 3)]
+  assert not mutex.locked
+  assert mutex.pending == 0
+
+def test_duplicate_calls_are_coalesced_per_function():
+  mutex = InterruptMutex(discard_duplicates = True)
+  calls = []
+  first = bound_recorder(mutex, 'first', calls)
+  second = bound_recorder(mutex, 'second', calls)
+
+  with mutex:
+    first(1)
+    second(2)
+    first(3) # Keeps its arguments, in the first call's place.
+    second(4)
+
+  assert calls == [('first', 3), ('second', 4)]
+
+def test_drop_newest_keeps_the_oldest_calls():
+  mutex = InterruptMutex(capacity = 2, overflow = InterruptMutex.DROP_NEWEST)
+  calls = []
+  record = bound_recorder(mutex, 'call', calls)
+
+  with mutex:
+    for i in range(5):
+      record(i)
+    assert mutex.overflows == 3
+
+  assert calls == [('call', 0), ('call', 1)]
+
+def test_drop_oldest_keeps_the_newest_calls():
+  mutex = InterruptMutex(capacity = 2, overflow = InterruptMutex.DROP_OLDEST)
+  calls = []
+  record = bound_recorder(mutex, 'call', calls)
+
+  with mutex:
+    for i in range(5):
+      record(i)
+    assert mutex.overflows == 3
+
+  assert calls == [('call', 3), ('call', 4)]
+
+def test_fifo_order_holds_after_wraparound():
+  mutex = InterruptMutex(capacity = 3)
+  calls = []
+  record = bound_recorder(mutex, 'call', calls)
+
+  for batch in range(4): # Each batch starts at a different ring offset.
+    with mutex:
+      for i in range(batch % 3 + 1):
+        record(batch, i)
+    assert calls[-(batch % 3 + 1):] == [('call', batch, i) for i in range(batch % 3 + 1)]
+
+  with mutex:
+    record('a')
+    record('b')
+    mutex.unlock() # Drains at the ring's current head, which has wrapped around.
+    mutex.lock()
+    record('c')
+  assert calls[-3:] == [('call', 'a'), ('call', 'b'), ('call', 'c')]
+  assert mutex.overflows == 0
+
+def test_invalid_arguments_are_rejected():
+  with pytest.raises(ValueError):
+    InterruptMutex(capacity = 0)
+  with pytest.raises(ValueError):
+    InterruptMutex(overflow = 'drop_all')
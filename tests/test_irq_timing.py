@@ -0,0 +1,30 @@
+from utils.irq_timing import IrqTiming, TimingHistogram
+
+def test_histogram_buckets_and_percentiles():
+  histogram = TimingHistogram(8)
+  for duration_us in (0, 1, 3, 3, 100, 1000):
+    histogram.record(duration_us)
+
+  assert histogram.count == 6
+  assert histogram.max_us == 1000
+  assert dict(histogram.buckets()) == { 0: 1, 1: 1, 2: 2, 4: 0, 8: 0, 16: 0, 32: 0, 64: 2 }
+  assert histogram.percentile_us(50) == 4
+  assert histogram.percentile_us(100) == 1000
+
+def test_mean_total_stays_within_small_int_range():
+  histogram = TimingHistogram()
+  for _ in range(100000):
+    histogram.record(20000)
+
+  assert histogram._TimingHistogram__total_us < TimingHistogram.MEAN_TOTAL_LIMIT_US
+  assert abs(histogram.mean_us - 20000) < 1
+  assert histogram.count == 100000
+
+def test_irq_timing_records_latency_and_duration():
+  timing = IrqTiming()
+  timing.record(100, 105, 135)
+
+  summary = timing.summary()
+  assert summary['count'] == 1
+  assert summary['latency_max_us'] == 5
+  assert summary['duration_max_us'] == 30
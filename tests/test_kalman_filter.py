@@ -0,0 +1,80 @@
+from random import Random
+from utils.kalman_filter import KalmanFilter
+
+def noisy(rng: Random, value: int, sigma: float) -> int:
+  return value + round(rng.gauss(0, sigma))
+
+def test_steps_are_followed_without_lag():
+  rng = Random(1)
+  kalman = KalmanFilter(measurement_noise = 2500)
+  for _ in range(200):
+    kalman.filter(noisy(rng, 20000, 50))
+  assert kalman.steps == 0
+  assert abs(kalman.value - 20000) < 30
+
+  assert kalman.filter(40000) == 40000
+  assert kalman.steps == 1
+  assert kalman.variance == kalman.measurement_noise
+
+def test_noise_within_step_sigmas_is_smoothed():
+  rng = Random(2)
+  kalman = KalmanFilter(measurement_noise = 2500)
+  outputs = [kalman.filter(noisy(rng, 30000, 50)) for _ in range(2000)]
+
+  settled = outputs[1000:]
+  rms = (sum((output - 30000) ** 2 for output in settled) / len(settled)) ** 0.5
+  assert rms < 15 # Versus 50 for the raw values.
+  assert kalman.steps <= 1
+
+def test_step_detection_can_be_disabled():
+  kalman = KalmanFilter(measurement_noise = 2500, step_sigmas = 0)
+  for _ in range(200):
+    kalman.filter(20000)
+
+  assert kalman.filter(40000) < 21000 # Slowly converges instead of jumping.
+  assert kalman.steps == 0
+
+def test_adaptive_measurement_noise_converges_to_the_true_variance():
+  rng = Random(3)
+  for initial_noise in (100, 20000):
+    kalman = KalmanFilter(measurement_noise = initial_noise, adaptive = True)
+    estimates = []
+    for i in range(6000):
+      kalman.filter(noisy(rng, 10000, 50))
+      if i >= 3000:
+        estimates.append(kalman.measurement_noise)
+
+    mean_estimate = sum(estimates) / len(estimates)
+    assert 2500 * 0.75 < mean_estimate < 2500 * 1.25
+
+def test_fixed_measurement_noise_is_not_adapted():
+  rng = Random(4)
+  kalman = KalmanFilter(measurement_noise = 100)
+  for _ in range(500):
+    kalman.filter(noisy(rng, 10000, 5))
+
+  assert kalman.measurement_noise == 100
+
+def test_reset_discards_the_adaptive_estimate():
+  rng = Random(5)
+  kalman = KalmanFilter(measurement_noise = 100, adaptive = True)
+  for _ in range(500):
+    kalman.filter(noisy(rng, 10000, 50))
+  kalman.filter(60000)
+  assert kalman.measurement_noise != 100
+  assert kalman.steps
+
+  kalman.reset()
+  assert kalman.value is None
+  assert kalman.measurement_noise == 100
+  assert kalman.steps == 0
+  assert kalman.filter(123) == 123
+
+def test_values_stay_within_small_int_range():
+  kalman = KalmanFilter(process_noise = 1 << 20, measurement_noise = 1 << 20, adaptive = True)
+  assert kalman.process_noise == KalmanFilter.VARIANCE_MAX
+
+  for value in (0, 65535, 0, 65535, 32768, 1):
+    kalman.filter(value)
+    assert kalman.variance <= KalmanFilter.VARIANCE_MAX
+    assert kalman.measurement_noise <= KalmanFilter.VARIANCE_MAX
@@ -0,0 +1,24 @@
+from components.led import LED
+from utils.gamma_normalizer import GammaNormalizer
+
+def test_float_intensity_is_rounded_with_and_without_gamma():
+  gamma = GammaNormalizer()
+  gamma_led = LED(2, gamma = gamma)
+  linear_led = LED(3)
+
+  gamma_led.intensity = 127.6
+  linear_led.intensity = 127.6
+
+  assert gamma_led.intensity_u16 == gamma.table[128]
+  assert gamma_led.intensity == 128
+  assert linear_led.intensity == 128
+
+def test_toggle_turns_a_gamma_corrected_led_on_and_off():
+  led = LED(2, gamma = GammaNormalizer())
+
+  led.toggle()
+  assert led.intensity == 255
+  led.toggle()
+  assert led.intensity == 0
+  led.toggle()
+  assert led.intensity == 255
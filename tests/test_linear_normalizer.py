@@ -0,0 +1,18 @@
+from array import array
+from utils.linear_normalizer import LinearNormalizer
+
+def test_fixed_point_matches_rounded_float_mapping():
+  for (src_range, dest_range) in (((1000, 64535), (100, 0)), ((0, 65535), (-40, 125)), ((0, 2047), (0, 65535))):
+    fixed = LinearNormalizer(src_range, dest_range, fixed_point = True)
+    exact = LinearNormalizer(src_range, dest_range)
+    samples = array('H', range(0, 65536, 7))
+    out = fixed.normalize_many(samples, array('i', (0 for _ in samples)))
+
+    for i in range(len(samples)):
+      assert out[i] == fixed.normalize(samples[i])
+      assert abs(out[i] - exact.normalize(samples[i])) < 1
+
+def test_fixed_point_bits_are_maximized_within_small_int_range():
+  assert LinearNormalizer((1000, 64535), (100, 0), fixed_point = True).fixed_point_bits == 22
+  assert LinearNormalizer((0, 65535), (0, 255), fixed_point = True).fixed_point_bits == 24
+  assert LinearNormalizer((0, 2047), (0, 65535), fixed_point = True).fixed_point_bits == 16
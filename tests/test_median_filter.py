@@ -0,0 +1,89 @@
+from fractions import Fraction
+from random import Random
+import pytest
+from utils.hampel_filter import HampelFilter
+from utils.median_filter import MedianFilter
+from utils.sorted_window import SortedWindow
+
+def exact_median(values: list) -> Fraction:
+  values = sorted(values)
+  half = len(values) >> 1
+  return Fraction(values[half]) if len(values) & 1 else Fraction(values[half - 1] + values[half], 2)
+
+def test_sorted_window_matches_sorting_the_window():
+  rng = Random(4)
+  for size in (1, 2, 5, 8, 33):
+    window = SortedWindow(size)
+    recent = []
+    for _ in range(300):
+      value = rng.randrange(-50, 50) # Many duplicates.
+      window.push(value)
+      recent = (recent + [value])[-size:]
+
+      assert window.count == len(recent)
+      assert window.sorted_values[:window.count] == sorted(recent)
+      assert window.median() == exact_median(recent) // 1
+
+    window.reset()
+    assert window.count == 0
+    assert window.median() is None
+
+def test_sorted_window_size_is_validated():
+  with pytest.raises(ValueError):
+    SortedWindow(0)
+
+def test_median_filter_rejects_spikes():
+  median = MedianFilter(5)
+  outputs = [median.filter(value) for value in (100, 101, 5000, 99, 100, -3000, 102, 100)]
+
+  assert 5000 not in outputs and -3000 not in outputs
+  assert outputs[-4:] == [100, 100, 100, 100]
+
+def test_median_filter_floors_even_windows():
+  median = MedianFilter(4)
+
+  assert median.filter(10.9) == 10 # Values are truncated to ints.
+  assert median.filter(13) == 11
+  assert median.value == 11
+
+  median.reset()
+  assert median.value is None
+  assert median.filter(7) == 7
+
+def test_hampel_filter_matches_exact_mad_threshold():
+  rng = Random(7)
+  for (window_size, n_sigmas) in ((7, 3.0), (8, 2.0), (5, 1.5), (16, 3.0)):
+    hampel = HampelFilter(window_size, n_sigmas)
+    threshold = Fraction(round(n_sigmas * HampelFilter.MAD_SCALE * 256), 256)
+    recent = []
+    outliers = 0
+
+    for i in range(500):
+      value = 1000 + rng.randrange(-20, 21)
+      if i % 11 == 0:
+        value += rng.choice((-1, 1)) * rng.randrange(30, 500)
+      recent = (recent + [value])[-window_size:]
+
+      median = exact_median(recent)
+      mad = exact_median([abs(other - median) for other in recent])
+      if abs(value - median) > threshold * mad:
+        outliers += 1
+        expected = median // 1
+      else:
+        expected = value
+
+      assert hampel.filter(value) == expected
+
+    assert hampel.outliers == outliers > 0
+
+def test_hampel_filter_passes_constant_signals_and_resets():
+  hampel = HampelFilter(5)
+
+  assert [hampel.filter(value) for value in (3, 3, 3, 3)] == [3, 3, 3, 3]
+  assert hampel.filter(4) == 3 # Any deviation is an outlier while the MAD is 0.
+  assert hampel.outliers == 1
+
+  hampel.reset()
+  assert hampel.outliers == 0
+  assert hampel.value is None
+  assert hampel.filter(4) == 4
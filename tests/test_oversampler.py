@@ -0,0 +1,75 @@
+from itertools import cycle
+import pytest
+from machine import ADC
+from utime import sleep_ms, sleep_us
+from utils.oversampler import Oversampler
+
+def adc_reading(values_12_bit: list[int], read_us = 0) -> ADC:
+  """ Makes a fake 12-bit `ADC` that cycles through the given values, scaled to u16 like `read_u16`. """
+  adc = ADC(26)
+  values = cycle(values_12_bit)
+
+  def read_u16():
+    sleep_us(read_us)
+    return next(values) << 4
+
+  adc.read_u16 = read_u16
+  return adc
+
+def test_average_rounds_the_mean_of_the_burst():
+  oversampler = Oversampler(4)
+
+  assert oversampler.read(adc_reading([100, 101, 101, 101])) == round(100.75 * 16)
+  assert oversampler.read(adc_reading([0, 4095, 4095, 4095])) == (4095 * 3 * 16 + 2) // 4
+  assert oversampler.effective_bits == 12
+
+@pytest.mark.parametrize('burst_size, effective_bits', [(4, 13), (16, 14), (256, 16), (1024, 17)])
+def test_bit_growth_adds_a_bit_per_factor_of_4(burst_size, effective_bits):
+  oversampler = Oversampler(burst_size, Oversampler.BIT_GROWTH)
+
+  # The mean of 1001.5 steps is representable from 13 effective bits on, and is aligned to u16 either way.
+  assert oversampler.read(adc_reading([1000, 1001, 1003, 1002])) == round(1001.5 * 16)
+  assert oversampler.effective_bits == effective_bits
+
+def test_bit_growth_of_a_single_read_is_the_native_value():
+  oversampler = Oversampler(1, Oversampler.BIT_GROWTH)
+
+  assert oversampler.read(adc_reading([1001, 1003])) == 1001 << 4
+  assert oversampler.effective_bits == 12
+
+def test_bit_growth_resolves_values_between_adc_steps():
+  oversampler = Oversampler(16, Oversampler.BIT_GROWTH)
+
+  # Dithered between 12-bit steps 1000 and 1001, a quarter of the time at 1001.
+  value = oversampler.read(adc_reading([1000, 1000, 1000, 1001]))
+
+  assert value == (1000 << 4) + 4
+  assert oversampler.read(adc_reading([4095])) == 4095 << 4
+
+def test_throughput_is_measured():
+  oversampler = Oversampler(4)
+  adc = adc_reading([0], read_us = 5)
+
+  for _ in range(11):
+    oversampler.read(adc)
+    sleep_ms(1)
+
+  assert oversampler.raw_samples_per_sec == 200000
+  assert oversampler.samples_per_sec == pytest.approx(1000000 / 1020)
+
+  oversampler.reset_stats()
+  assert oversampler.raw_samples_per_sec == 0
+  assert oversampler.samples_per_sec == 0
+
+def test_configuration_is_validated():
+  with pytest.raises(ValueError):
+    Oversampler(4, 'median')
+  with pytest.raises(ValueError):
+    Oversampler(0)
+  with pytest.raises(ValueError):
+    Oversampler(8, Oversampler.BIT_GROWTH)
+
+  oversampler = Oversampler(8)
+  with pytest.raises(ValueError):
+    oversampler.burst_size = 0
+  assert oversampler.burst_size == 8
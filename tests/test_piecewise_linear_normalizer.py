@@ -0,0 +1,65 @@
+from array import array
+import pytest
+from utils.piecewise_linear_normalizer import PiecewiseLinearNormalizer
+
+BREAKPOINTS = [(0, 0.0), (32768, 100.0), (65535, -1000.0)] # Segments end on table points for `lut_bits <= 15`.
+
+def test_lookup_table_matches_binary_search_on_every_u16_value():
+  exact = PiecewiseLinearNormalizer(BREAKPOINTS)
+  for lut_bits in (4, 8, 15, 16):
+    lut = PiecewiseLinearNormalizer(BREAKPOINTS, lut_bits)
+
+    for value in range(65536):
+      assert lut.normalize(value) == pytest.approx(exact.normalize(value), abs = 1e-3)
+
+def test_final_lookup_table_cell_ends_at_65535():
+  lut = PiecewiseLinearNormalizer(BREAKPOINTS, 8)
+
+  # The final table point is the value at 65535, so the final cell must be interpolated over 255 values, not 256.
+  assert lut.normalize(65535) == pytest.approx(-1000.0)
+  assert lut.normalize(65535 - 255) == pytest.approx(-1000.0 + 1100.0 * 255 / 32767, abs = 1e-3)
+  assert lut.normalize(65535 - 100) == pytest.approx(-1000.0 + 1100.0 * 100 / 32767, abs = 1e-3)
+
+def test_lookup_table_matches_binary_search_when_extrapolating():
+  breakpoints = [(60000, 50.0), (4096, 10.0)]
+  exact = PiecewiseLinearNormalizer(breakpoints, extrapolate = True)
+  lut = PiecewiseLinearNormalizer(breakpoints, 6, extrapolate = True)
+
+  for value in range(0, 65536, 7):
+    assert lut.normalize(value) == pytest.approx(exact.normalize(value), abs = 1e-3)
+  assert lut.normalize(65535) == pytest.approx(exact.normalize(65535), abs = 1e-3)
+
+def test_values_outside_the_lookup_table_use_binary_search():
+  breakpoints = [(100, 1.0), (200, 2.0)]
+  lut = PiecewiseLinearNormalizer(breakpoints, 4)
+
+  assert lut.normalize(150.5) == pytest.approx(1.505)
+  assert lut.normalize(-5) == 1.0
+  assert lut.normalize(70000) == 2.0
+
+@pytest.mark.parametrize('lut_bits', [None, 8])
+def test_normalize_many_matches_normalize(lut_bits):
+  normalizer = PiecewiseLinearNormalizer(BREAKPOINTS, lut_bits)
+  samples = array('H', range(0, 65536, 13))
+
+  out = normalizer.normalize_many(samples, array('f', (0.0 for _ in samples)))
+  rounded = normalizer.normalize_many(samples, array('i', (0 for _ in samples)), round_values = True)
+
+  for i in range(len(samples)):
+    assert out[i] == pytest.approx(normalizer.normalize(samples[i]), abs = 1e-3)
+    assert rounded[i] == round(normalizer.normalize(samples[i]))
+
+def test_normalize_many_handles_floats_in_place():
+  normalizer = PiecewiseLinearNormalizer([(0, 0.0), (65535, 655.35)], 8)
+  samples = [2.5, -1.0, 5, 70000.0] # Only the int is looked up in the table.
+
+  assert normalizer.normalize_many(samples) is samples
+  assert samples == pytest.approx([0.025, 0.0, 0.05, 655.35], abs = 1e-4)
+
+def test_breakpoints_are_validated():
+  with pytest.raises(ValueError):
+    PiecewiseLinearNormalizer([(0, 0.0)])
+  with pytest.raises(ValueError):
+    PiecewiseLinearNormalizer([(0, 0.0), (0, 1.0)])
+  with pytest.raises(ValueError):
+    PiecewiseLinearNormalizer([(0, 0.0), (1, 1.0)], lut_bits = 17)
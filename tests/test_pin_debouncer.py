@@ -0,0 +1,48 @@
+from machine import Pin, Timer
+from utils.pin_debouncer import PinDebouncer
+from utils.sampling_scheduler import SamplingScheduler
+
+def sample_levels(levels, stable_samples = 3):
+  scheduler = SamplingScheduler(1)
+  debouncer = PinDebouncer(1, stable_samples, scheduler)
+  pin = Pin(5)
+  accepted = []
+  debouncer.register(pin, accepted.append)
+  timer = Timer.instances[-1]
+
+  for level in levels:
+    pin.value(level)
+    timer.fire()
+
+  return (accepted, debouncer, pin)
+
+def test_transition_is_accepted_once_the_integrator_reaches_its_limit():
+  (accepted, debouncer, pin) = sample_levels([0, 0])
+  assert accepted == []
+  assert debouncer.level(pin) == 1
+
+  (accepted, debouncer, pin) = sample_levels([0, 0, 0])
+  assert accepted == [0]
+  assert debouncer.level(pin) == 0
+
+def test_bounce_only_delays_acceptance():
+  # Each bounce back to high undoes one low sample, rather than restarting the count.
+  (accepted, _, _) = sample_levels([0, 1, 0, 0, 1, 0])
+  assert accepted == []
+  (accepted, _, _) = sample_levels([0, 1, 0, 0, 1, 0, 0])
+  assert accepted == [0]
+
+def test_release_needs_the_integrator_to_climb_back_to_its_limit():
+  (accepted, _, _) = sample_levels([0, 0, 0, 1, 1, 0, 1, 1, 1])
+  assert accepted == [0, 1]
+
+def test_sampling_is_driven_by_the_scheduler_and_stops_when_empty():
+  scheduler = SamplingScheduler(10)
+  debouncer = PinDebouncer(scheduler = scheduler)
+  pin = Pin(5)
+  debouncer.register(pin, lambda level: None)
+  assert scheduler.running
+
+  debouncer.unregister(pin)
+  assert not scheduler.running
+  assert debouncer.level(pin) is None
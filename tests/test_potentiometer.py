@@ -0,0 +1,113 @@
+from machine import Timer
+from components.potentiometer import Potentiometer
+from utils.identity_filter import IdentityFilter
+from utils.identity_normalizer import IdentityNormalizer
+from utils.sampling_scheduler import SamplingScheduler
+
+def make_potentiometer(**kwargs) -> tuple[Potentiometer, object]:
+  pot = Potentiometer(
+    26,
+    sample_period_ms = 10,
+    digital_filter = IdentityFilter(),
+    digital_normalizer = IdentityNormalizer(),
+    scheduler = SamplingScheduler(10),
+    **kwargs,
+  )
+  return (pot, pot._Potentiometer__pot_pin)
+
+def fire(pot: Potentiometer, ticks = 1):
+  for _ in range(ticks):
+    pot.scheduler._SamplingScheduler__timer.fire()
+
+def test_change_handlers_respect_min_delta():
+  (pot, adc) = make_potentiometer()
+  values = []
+  pot.register_change_handler(values.append, min_delta = 100)
+
+  for value in (50, 99, 100, 150, 199, 200, 101, 0):
+    adc.value_u16 = value
+    fire(pot)
+
+  # Deltas are measured from the value the handler was last invoked with, not from the previous sample.
+  assert values == [100, 200, 0]
+
+def test_change_handlers_respect_min_interval():
+  (pot, adc) = make_potentiometer()
+  values = []
+  pot.register_change_handler(values.append, min_interval_ms = 30)
+
+  for value in (1, 2, 3, 3, 3, 3, 3):
+    adc.value_u16 = value
+    fire(pot)
+
+  # Changes within the interval are held back, and the latest one is delivered once it elapses.
+  assert values == [3]
+  adc.value_u16 = 4
+  fire(pot, 3)
+  assert values == [3, 4]
+
+def test_unregistered_change_handlers_are_not_invoked():
+  (pot, adc) = make_potentiometer()
+  values = []
+
+  @pot.change_handler()
+  def handler(value):
+    values.append(value)
+
+  adc.value_u16 = 1
+  fire(pot)
+  pot.unregister_change_handler(handler)
+  adc.value_u16 = 2
+  fire(pot)
+
+  assert values == [1]
+
+def test_adaptive_sampling_slows_down_while_idle_and_resets_on_change():
+  (pot, adc) = make_potentiometer(max_sample_period_ms = 40)
+  assert pot.sampling_stats() == {10: 0, 20: 0, 40: 0}
+
+  # The initial sample taken by the constructor counts as the first idle sample.
+  fire(pot, Potentiometer.ADAPTIVE_IDLE_SAMPLES - 1)
+  assert pot.current_sample_period_ms == 20
+
+  reads = adc.reads
+  fire(pot, 2 * Potentiometer.ADAPTIVE_IDLE_SAMPLES)
+  assert adc.reads - reads == Potentiometer.ADAPTIVE_IDLE_SAMPLES
+  assert pot.current_sample_period_ms == 40
+
+  fire(pot, 40)
+  assert pot.current_sample_period_ms == 40
+
+  adc.value_u16 = 1000
+  fire(pot, 4)
+  assert pot.current_sample_period_ms == 10
+  assert pot.value == 1000
+
+  assert pot.sampling_stats() == {10: 90, 20: 200, 40: 440}
+  pot.reset_sampling_stats()
+  assert pot.sampling_stats() == {10: 0, 20: 0, 40: 0}
+
+def test_fixed_sampling_does_not_adapt():
+  (pot, adc) = make_potentiometer()
+
+  fire(pot, 5 * Potentiometer.ADAPTIVE_IDLE_SAMPLES)
+
+  assert pot.current_sample_period_ms == 10
+  assert pot.sampling_stats() == {10: 500}
+
+def test_polling_reads_on_every_value_access():
+  (pot, adc) = make_potentiometer()
+  pot.sample_period_ms = 0
+  assert not pot.scheduler.running
+  assert pot.sampling_stats() == {}
+
+  adc.value_u16 = 1234
+  assert pot.value == 1234
+  assert pot.sample_rate_hz == 0
+
+def test_sample_value_still_accepts_a_timer():
+  (pot, adc) = make_potentiometer()
+  adc.value_u16 = 42
+
+  assert pot.sample_value(Timer()) == 42
+  assert pot.sample_value() == 42
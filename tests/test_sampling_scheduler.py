@@ -0,0 +1,86 @@
+from machine import Timer
+from utime import sleep_us
+from utils.sampling_scheduler import SamplingScheduler
+
+def run_ticks(scheduler: SamplingScheduler, ticks: int, tick_count: list):
+  for _ in range(ticks):
+    tick_count[0] += 1
+    scheduler._SamplingScheduler__timer.fire()
+
+def recorder(name: str, log: list, tick_count: list):
+  return lambda: log.append((tick_count[0], name))
+
+def test_callbacks_with_the_same_period_and_phase_are_grouped():
+  scheduler = SamplingScheduler(10)
+  (log, tick_count) = ([], [0])
+  scheduler.register(recorder('a', log, tick_count), 30)
+  scheduler.register(recorder('b', log, tick_count), 30)
+  scheduler.register(recorder('c', log, tick_count), 20)
+
+  assert len(scheduler._SamplingScheduler__groups) == 2
+
+  run_ticks(scheduler, 6, tick_count)
+  assert log == [(2, 'c'), (3, 'a'), (3, 'b'), (4, 'c'), (6, 'a'), (6, 'b'), (6, 'c')]
+
+def test_phases_are_measured_from_the_shared_tick_count():
+  scheduler = SamplingScheduler(10)
+  (log, tick_count) = ([], [0])
+  scheduler.register(recorder('a', log, tick_count), 50)
+  run_ticks(scheduler, 3, tick_count)
+
+  # Registered on tick 3, but still samples on every tick `t` where `t % 5 == 2`.
+  scheduler.register(recorder('b', log, tick_count), 50, phase_ms = 20)
+  run_ticks(scheduler, 14, tick_count)
+
+  assert log == [(5, 'a'), (7, 'b'), (10, 'a'), (12, 'b'), (15, 'a'), (17, 'b')]
+
+def test_delay_counts_from_registration():
+  scheduler = SamplingScheduler(10)
+  (log, tick_count) = ([], [0])
+  scheduler.register(recorder('a', log, tick_count), 50)
+  run_ticks(scheduler, 3, tick_count)
+
+  scheduler.register(recorder('b', log, tick_count), 50, delay_ms = 30)
+  run_ticks(scheduler, 8, tick_count)
+
+  assert log == [(5, 'a'), (6, 'b'), (10, 'a'), (11, 'b')]
+
+def test_registration_changes_within_a_tick_apply_from_the_next_tick():
+  scheduler = SamplingScheduler(10)
+  (log, tick_count) = ([], [0])
+  late = recorder('late', log, tick_count)
+  removed = recorder('removed', log, tick_count)
+
+  def change_registrations():
+    log.append((tick_count[0], 'change'))
+    scheduler.register(late, 10)
+    scheduler.unregister(change_registrations)
+    scheduler.unregister(removed)
+
+  scheduler.register(change_registrations, 10)
+  scheduler.register(removed, 10)
+  run_ticks(scheduler, 3, tick_count)
+
+  assert log == [(1, 'change'), (1, 'removed'), (2, 'late'), (3, 'late')]
+
+def test_unregistering_the_last_callback_stops_the_timer():
+  scheduler = SamplingScheduler(10)
+  callback = scheduler.register(lambda: None, 10)
+  assert scheduler.running
+
+  scheduler.unregister(callback)
+  assert not scheduler.running
+
+def test_load_is_measured_over_the_load_window():
+  scheduler = SamplingScheduler(10)
+  scheduler.register(lambda: sleep_us(5000), 10)
+  timer = Timer.instances[-1]
+
+  for _ in range(SamplingScheduler.LOAD_WINDOW_TICKS - 1):
+    timer.fire()
+  assert scheduler.load == 0
+
+  timer.fire()
+  assert scheduler.load == 0.5
+  assert scheduler.max_tick_us == 5000
+  assert scheduler.overruns == 0
@@ -0,0 +1,94 @@
+from array import array
+import pytest
+from machine import ADC
+from components.thermometer import Thermometer
+
+def read_at(thermometer: Thermometer, adc: ADC, value_u16: int, unit = '') -> float:
+  adc.value_u16 = value_u16
+  return thermometer.temperature(unit)
+
+def test_uncalibrated_reading_follows_the_vbe_slope():
+  adc = ADC(4)
+  thermometer = Thermometer(adc, 'C')
+
+  raw_27c = Thermometer.VBE_27C / Thermometer.VREF * 65535
+  assert read_at(thermometer, adc, round(raw_27c)) == pytest.approx(27, abs = 0.05)
+  assert read_at(thermometer, adc, round(raw_27c), 'F') == pytest.approx(80.6, abs = 0.1)
+  assert read_at(thermometer, adc, round(raw_27c), 'K') == pytest.approx(300.15, abs = 0.05)
+
+@pytest.mark.parametrize('unit, actual_1, actual_2', [('F', 32.0, 212.0), ('C', 0.0, 100.0), ('K', 273.15, 373.15)])
+def test_two_point_calibration_in_each_unit(unit, actual_1, actual_2):
+  adc = ADC(4)
+  thermometer = Thermometer(adc, unit)
+  (raw_1, raw_2) = (15000, 12000)
+
+  thermometer.calibrate(read_at(thermometer, adc, raw_1), actual_1, read_at(thermometer, adc, raw_2), actual_2)
+
+  assert read_at(thermometer, adc, raw_1) == pytest.approx(actual_1, abs = 1e-6)
+  assert read_at(thermometer, adc, raw_2) == pytest.approx(actual_2, abs = 1e-6)
+  assert read_at(thermometer, adc, raw_1, 'C') == pytest.approx(0.0, abs = 1e-6)
+
+def test_recalibration_measures_under_the_current_calibration():
+  adc = ADC(4)
+  thermometer = Thermometer(adc, 'C', calibration = (1.1, -3.0))
+  (raw_1, raw_2) = (14500, 13500)
+
+  # Measured in Fahrenheit under the initial calibration, while the configured unit is Celsius.
+  thermometer.calibrate(read_at(thermometer, adc, raw_1, 'F'), 68.0, read_at(thermometer, adc, raw_2, 'F'), 86.0, 'F')
+  assert read_at(thermometer, adc, raw_1) == pytest.approx(20.0, abs = 1e-6)
+  assert read_at(thermometer, adc, raw_2) == pytest.approx(30.0, abs = 1e-6)
+
+  # Recalibrating with readings that are already correct keeps the calibration.
+  calibration = thermometer.calibration
+  thermometer.calibrate(read_at(thermometer, adc, raw_1), 20.0, read_at(thermometer, adc, raw_2), 30.0)
+  assert thermometer.calibration == pytest.approx(calibration)
+
+def test_calibration_is_validated():
+  thermometer = Thermometer(4)
+
+  with pytest.raises(ValueError):
+    thermometer.calibrate(20.0, 21.0, 20.0, 30.0)
+  with pytest.raises(ValueError):
+    thermometer.calibrate(20.0, 21.0, 30.0, 31.0, 'X')
+
+def test_calibration_is_saved_and_loaded(tmp_path):
+  path = str(tmp_path / 'calibration.json')
+  adc = ADC(4)
+  thermometer = Thermometer(adc, calibration = (0.95, 1.5))
+  thermometer.save_calibration(path)
+
+  restored = Thermometer(adc)
+  restored.load_calibration(path)
+
+  assert restored.calibration == (0.95, 1.5)
+  assert read_at(restored, adc, 14000) == read_at(thermometer, adc, 14000)
+
+def test_loading_a_missing_calibration_raises(tmp_path):
+  with pytest.raises(OSError):
+    Thermometer(4).load_calibration(str(tmp_path / 'missing.json'))
+
+def test_temperatures_fill_a_preallocated_array():
+  adc = ADC(4)
+  readings = iter((14000, 14100, 14200))
+  adc.read_u16 = lambda: next(readings)
+  thermometer = Thermometer(adc, 'C')
+  out = array('f', [-1.0] * 4)
+
+  result = thermometer.temperatures(3, out = out)
+
+  assert result is out
+  assert out[3] == -1.0
+  adc.read_u16 = lambda: 14100
+  assert out[1] == pytest.approx(thermometer.temperature(), abs = 1e-3)
+  assert out[0] > out[1] > out[2] # Vbe falls as temperature rises.
+
+def test_temperatures_allocate_an_array_by_default():
+  adc = ADC(4)
+  adc.value_u16 = 14000
+  thermometer = Thermometer(adc, 'K')
+
+  result = thermometer.temperatures(5, 'C')
+
+  assert len(result) == 5
+  assert result.typecode == 'f'
+  assert list(result) == pytest.approx([thermometer.temperature('C')] * 5, abs = 1e-3)
@@ -0,0 +1,60 @@
+from utime import sleep_ms, ticks_ms
+from utils.time_series import TimeSeries
+
+def test_samples_roll_up_into_aligned_buckets():
+  series = TimeSeries(10, 10, (1000,))
+  start = ticks_ms()
+  for (offset_ms, value) in ((0, 4), (500, 2), (999, 6), (1000, 10), (2500, 1)):
+    series.record(value, start + offset_ms)
+
+  assert list(series.buckets(1000)) == [(start, 2, 6, 4), (start + 1000, 10, 10, 10), (start + 2000, 1, 1, 1)]
+
+def test_rings_overwrite_the_oldest_entries():
+  series = TimeSeries(3, 2, (1000,))
+  start = ticks_ms()
+  for i in range(5):
+    series.record(i, start + i * 1000)
+
+  assert len(series) == 3
+  assert [value for _, value in series.samples()] == [2, 3, 4]
+  assert [bucket[0] - start for bucket in series.buckets(1000)] == [3000, 4000]
+
+def test_summary_reads_the_finest_rollup_covering_the_span():
+  series = TimeSeries(100, 5, (1000, 10000))
+  start = ticks_ms()
+  for i in range(40):
+    series.record(i, start + i * 1000)
+  sleep_ms(start + 39500 - ticks_ms()) # Now is halfway through the newest 1 s bucket.
+
+  # The 1 s rollup covers 5 s, so a 2 s span reads its newest 3 buckets (rounded out to whole buckets).
+  assert series.summary(2000) == (37, 39, 38)
+  # The 10 s rollup covers 50 s, so a 20 s span reads its buckets starting within 30 s: [10, 40) s.
+  assert series.summary(20000) == (10, 39, 24.5)
+  # No rollup covers 100 s, so the coarsest one is read in full.
+  assert series.summary(100000) == (0, 39, 19.5)
+
+  sleep_ms(1000000)
+  assert series.summary(2000) is None
+
+def test_clear_discards_all_samples_and_buckets():
+  series = TimeSeries(10, 10, (1000,))
+  series.record(1)
+  series.clear()
+
+  assert len(series) == 0
+  assert list(series.samples()) == []
+  assert list(series.buckets(1000)) == []
+  assert series.summary(1000) is None
+
+def test_long_buckets_of_large_samples_keep_an_accurate_mean():
+  series = TimeSeries(10, 2, (3600000,))
+  start = ticks_ms()
+  values = [60000 + (i * 7919) % 5536 for i in range(36000)] # An hour of u16 samples at 10 Hz.
+  for (i, value) in enumerate(values):
+    series.record(value, start + i * 100)
+
+  mean = list(series.buckets(3600000))[-1][3]
+  assert abs(mean - sum(values) / len(values)) < 0.01
+
+def test_nbytes_is_fixed_by_the_capacities():
+  assert TimeSeries(240, 60, (1000, 60000)).nbytes == 240 * 8 + 2 * 60 * 24
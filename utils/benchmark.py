@@ -0,0 +1,43 @@
+try:
+  from time import ticks_us, ticks_diff
+except ImportError: # CPython host, which has no MicroPython ticks functions.
+  from time import perf_counter_ns
+
+  def ticks_us() -> int:
+    return perf_counter_ns() // 1000
+
+  def ticks_diff(ticks1: int, ticks2: int) -> int:
+    return ticks1 - ticks2
+
+def per_call_us(func, samples, repeat = 1) -> float:
+  """
+  Measures the average cost of invoking `func` once per sample.
+
+  Runs on both MicroPython boards and CPython hosts.
+
+  Args:
+    func: The function to benchmark. Takes a single argument, the sample.
+    samples: The samples to invoke `func` with.
+    repeat: The optional number of times to iterate over all `samples`. Defaults to `1`.
+
+  Returns:
+    The average number of microseconds spent per `func` invocation.
+  """
+  start = ticks_us()
+
+  for _ in range(repeat):
+    for sample in samples:
+      func(sample)
+
+  return ticks_diff(ticks_us(), start) / (len(samples) * repeat)
+
+def report(name: str, cost_us: float):
+  """
+  Prints a single benchmark result as a cost per sample and a throughput.
+
+  Args:
+    name: The name of the benchmarked operation.
+    cost_us: The average number of microseconds spent per sample.
+  """
+  samples_per_sec = round(1000000 / cost_us) if cost_us > 0 else float('inf')
+  print(f"{name:<40} {cost_us:>10.3f} us/sample {samples_per_sec:>12} samples/s")
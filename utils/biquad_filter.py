@@ -0,0 +1,271 @@
+from array import array
+from math import cos, pi, sin
+from abstract.digital_filter import DigitalFilter
+
+class BiquadFilter(DigitalFilter):
+  """
+  A cascade of second-order IIR (biquad) filter sections, each evaluated in Direct Form II transposed.
+
+  Each section is given as normalized coefficients `(b0, b1, b2, a1, a2)` (i.e. `a0 == 1`),
+  which can be designed with `lowpass_coefficients`, `highpass_coefficients`, `notch_coefficients`,
+  or `bandpass_coefficients`. Cascading sections gives sharper cutoffs, e.g. a notch for mains hum
+  followed by a low-pass, without the lag of a long moving average.
+
+  Coefficients and section state are kept in preallocated `array('f')` buffers.
+  In `fixed_point` mode they are instead kept as Q14 ints in `array('i')` buffers and all arithmetic is integer,
+  which is suitable for Timer callbacks. Input values are truncated to ints in this mode. To keep intermediate
+  products within MicroPython's small int range, prefer 12-bit input values (e.g. `read_u16() >> 4`).
+  Q14 only resolves coefficients to `1 / 16384` (about `6e-5`), so low-pass sections whose cutoff is below roughly 0.5% of the
+  sample rate (`b0` around `1e-4` or less) lose most of their precision, and their smallest coefficients round down to `0`,
+  which changes the response. Use float mode for such sections.
+
+  The filter state is primed with the first value as its steady state, so the output starts at the first
+  value (scaled by the DC gain) instead of ramping up from `0`.
+
+  Args:
+    sections: The coefficients `(b0, b1, b2, a1, a2)` of each cascaded section, in order.
+    fixed_point: Whether to filter using integer fixed-point arithmetic. Defaults to `False`.
+
+  Raises:
+    ValueError: If no `sections` are given.
+  """
+
+  FIXED_POINT_BITS = 14
+
+  def __init__(self, sections: list[tuple[float, float, float, float, float]], fixed_point = False):
+    super().__init__()
+    if not sections:
+      raise ValueError("sections must contain the coefficients of at least one biquad section.")
+
+    self.__sections = [tuple(section) for section in sections]
+    self.__fixed_point = fixed_point
+
+    if fixed_point:
+      scale = 1 << BiquadFilter.FIXED_POINT_BITS
+      self.__coefficients = array('i', (round(c * scale) for section in self.__sections for c in section))
+      self.__state = array('i', (0 for _ in range(len(sections) * 2)))
+    else:
+      self.__coefficients = array('f', (c for section in self.__sections for c in section))
+      self.__state = array('f', (0 for _ in range(len(sections) * 2)))
+
+    # The `(state start, state end, filter)` of each filter merged into this one by `fuse`, or just this filter.
+    self.__parts = [(0, len(self.__state), self)]
+
+  @property
+  def sections(self) -> list[tuple[float, float, float, float, float]]:
+    """ The coefficients `(b0, b1, b2, a1, a2)` of each cascaded section, in order. """
+    return self.__sections[:]
+
+  @property
+  def fixed_point(self) -> bool:
+    """ Whether the filter uses integer fixed-point arithmetic instead of floats. """
+    return self.__fixed_point
+
+  def filter(self, value: float) -> float:
+    """
+    Applies the cascaded biquad filter sections to a given `value`.
+
+    Args:
+      value: The new value to apply the biquad filter to.
+
+    Returns:
+      The resulting value from the last biquad filter section.
+    """
+    coefficients = self.__coefficients
+    state = self.__state
+
+    if self.__fixed_point:
+      value = int(value)
+      bits = BiquadFilter.FIXED_POINT_BITS
+      half = 1 << (bits - 1)
+      for (start, end, part) in self.__parts:
+        if part._value is None:
+          self.__prime(value, start, end)
+        for s in range(start, end, 2):
+          c = s * 5 // 2
+          output = (coefficients[c] * value + state[s] + half) >> bits
+          state[s] = coefficients[c + 1] * value - coefficients[c + 3] * output + state[s + 1]
+          state[s + 1] = coefficients[c + 2] * value - coefficients[c + 4] * output
+          value = output
+        part._value = value
+    else:
+      for (start, end, part) in self.__parts:
+        if part._value is None:
+          self.__prime(value, start, end)
+        for s in range(start, end, 2):
+          c = s * 5 // 2
+          output = coefficients[c] * value + state[s]
+          state[s] = coefficients[c + 1] * value - coefficients[c + 3] * output + state[s + 1]
+          state[s + 1] = coefficients[c + 2] * value - coefficients[c + 4] * output
+          value = output
+        part._value = value
+
+    self._value = value
+    return value
+
+  def fuse(self, next_filter: DigitalFilter) -> DigitalFilter | None:
+    """
+    Merges this filter with a directly following `BiquadFilter` of the same mode into a single new filter
+    that cascades the sections of both, continuing from their current state.
+
+    The merged filter shares its state with the original filters: their state buffers become views into the merged filter's
+    state buffer, and filtering with the merged filter also updates their `value`s. So the originals never go stale,
+    and merging them again (e.g. when a `CompoundDigitalFilter` is recompiled after `add_filter`) continues seamlessly.
+    Each original that has not filtered any value yet is primed by the merged filter on its first value.
+
+    Args:
+      next_filter: The `DigitalFilter` that directly follows this filter.
+
+    Returns:
+      The merged `BiquadFilter`, or `None` if `next_filter` is not a `BiquadFilter` of the same mode.
+    """
+    if not isinstance(next_filter, BiquadFilter) or next_filter.fixed_point != self.fixed_point:
+      return None
+
+    fused_filter = BiquadFilter(self.sections + next_filter.sections, self.fixed_point)
+    fused_filter._value = next_filter.value
+    fused_state = fused_filter.__state
+    fused_parts = fused_filter.__parts = []
+    offset = 0
+
+    for (start, end, part) in self.__parts + next_filter.__parts:
+      state = part.__state
+      for i in range(end - start):
+        fused_state[offset + i] = state[i]
+      part.__state = memoryview(fused_state)[offset:offset + end - start]
+      fused_parts.append((offset, offset + end - start, part))
+      offset += end - start
+
+    return fused_filter
+
+  def reset(self):
+    """ Resets the filter by clearing the state of all sections, including those of the filters merged into it. """
+    super().reset()
+    for i in range(len(self.__state)):
+      self.__state[i] = 0
+    for (_, _, part) in self.__parts:
+      part._value = None
+
+  def __prime(self, value: float, start: int, end: int):
+    """
+    Primes the state of a range of sections as if `value` had been filtered forever, so there is no start-up transient.
+
+    Args:
+      value: The first value to be filtered by the range of sections.
+      start: The index into the state of the first section to prime.
+      end: The index into the state after the last section to prime.
+    """
+    coefficients = self.__coefficients
+    state = self.__state
+    scale = (1 << BiquadFilter.FIXED_POINT_BITS) if self.__fixed_point else 1
+
+    for s in range(start, end, 2):
+      c = s * 5 // 2
+      (b0, b1, b2, a1, a2) = self.__sections[s // 2]
+      dc_gain = (b0 + b1 + b2) / (1 + a1 + a2) if 1 + a1 + a2 else 0
+      output = round(value * dc_gain) if self.__fixed_point else value * dc_gain
+      state[s] = output * scale - coefficients[c] * value
+      state[s + 1] = coefficients[c + 2] * value - coefficients[c + 4] * output
+      value = output
+
+def lowpass_coefficients(sample_rate_hz: float, cutoff_hz: float, q = 0.7071) -> tuple[float, float, float, float, float]:
+  """
+  Designs the coefficients of a low-pass biquad filter section.
+
+  Args:
+    sample_rate_hz: The rate in Hz at which values are filtered.
+    cutoff_hz: The -3 dB cutoff frequency in Hz. Must be less than half of `sample_rate_hz`.
+    q: The optional quality factor of the section. Defaults to `0.7071` for a maximally flat (Butterworth) response.
+
+  Raises:
+    ValueError: If `cutoff_hz` is not within range `(0, sample_rate_hz / 2)`.
+
+  Returns:
+    The normalized section coefficients `(b0, b1, b2, a1, a2)`.
+  """
+  (cos_w0, alpha) = _design(sample_rate_hz, cutoff_hz, q)
+  return _normalize((1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2, 1 + alpha, -2 * cos_w0, 1 - alpha)
+
+def highpass_coefficients(sample_rate_hz: float, cutoff_hz: float, q = 0.7071) -> tuple[float, float, float, float, float]:
+  """
+  Designs the coefficients of a high-pass biquad filter section.
+
+  Args:
+    sample_rate_hz: The rate in Hz at which values are filtered.
+    cutoff_hz: The -3 dB cutoff frequency in Hz. Must be less than half of `sample_rate_hz`.
+    q: The optional quality factor of the section. Defaults to `0.7071` for a maximally flat (Butterworth) response.
+
+  Raises:
+    ValueError: If `cutoff_hz` is not within range `(0, sample_rate_hz / 2)`.
+
+  Returns:
+    The normalized section coefficients `(b0, b1, b2, a1, a2)`.
+  """
+  (cos_w0, alpha) = _design(sample_rate_hz, cutoff_hz, q)
+  return _normalize((1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2, 1 + alpha, -2 * cos_w0, 1 - alpha)
+
+def notch_coefficients(sample_rate_hz: float, center_hz: float, q = 10.0) -> tuple[float, float, float, float, float]:
+  """
+  Designs the coefficients of a notch (band-stop) biquad filter section, e.g. for rejecting 50/60 Hz mains hum.
+
+  Args:
+    sample_rate_hz: The rate in Hz at which values are filtered.
+    center_hz: The center frequency in Hz to reject. Must be less than half of `sample_rate_hz`.
+    q: The optional quality factor of the section; higher values give a narrower notch. Defaults to `10`.
+
+  Raises:
+    ValueError: If `center_hz` is not within range `(0, sample_rate_hz / 2)`.
+
+  Returns:
+    The normalized section coefficients `(b0, b1, b2, a1, a2)`.
+  """
+  (cos_w0, alpha) = _design(sample_rate_hz, center_hz, q)
+  return _normalize(1, -2 * cos_w0, 1, 1 + alpha, -2 * cos_w0, 1 - alpha)
+
+def bandpass_coefficients(sample_rate_hz: float, center_hz: float, q = 0.7071) -> tuple[float, float, float, float, float]:
+  """
+  Designs the coefficients of a band-pass biquad filter section with a `0 dB` peak gain.
+
+  Args:
+    sample_rate_hz: The rate in Hz at which values are filtered.
+    center_hz: The center frequency in Hz to pass. Must be less than half of `sample_rate_hz`.
+    q: The optional quality factor of the section; higher values give a narrower band. Defaults to `0.7071`.
+
+  Raises:
+    ValueError: If `center_hz` is not within range `(0, sample_rate_hz / 2)`.
+
+  Returns:
+    The normalized section coefficients `(b0, b1, b2, a1, a2)`.
+  """
+  (cos_w0, alpha) = _design(sample_rate_hz, center_hz, q)
+  return _normalize(alpha, 0, -alpha, 1 + alpha, -2 * cos_w0, 1 - alpha)
+
+def _design(sample_rate_hz: float, freq_hz: float, q: float) -> tuple[float, float]:
+  """
+  Computes the intermediate design values shared by all biquad sections.
+
+  Args:
+    sample_rate_hz: The rate in Hz at which values are filtered.
+    freq_hz: The cutoff or center frequency in Hz.
+    q: The quality factor of the section.
+
+  Raises:
+    ValueError: If `freq_hz` is not within range `(0, sample_rate_hz / 2)`.
+
+  Returns:
+    A tuple pair `(cos(w0), alpha)`.
+  """
+  if freq_hz <= 0 or freq_hz >= sample_rate_hz / 2:
+    raise ValueError(f"Frequency must be in range (0, {sample_rate_hz / 2}) for a sample rate of {sample_rate_hz} Hz; was given {freq_hz}.")
+
+  w0 = 2 * pi * freq_hz / sample_rate_hz
+  return (cos(w0), sin(w0) / (2 * q))
+
+def _normalize(b0: float, b1: float, b2: float, a0: float, a1: float, a2: float) -> tuple[float, float, float, float, float]:
+  """
+  Normalizes biquad section coefficients so that `a0 == 1`.
+
+  Returns:
+    The normalized section coefficients `(b0, b1, b2, a1, a2)`.
+  """
+  return (b0 / a0, b1 / a0, b2 / a0, a1 / a0, a2 / a0)
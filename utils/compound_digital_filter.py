@@ -1,7 +1,14 @@
 from abstract.digital_filter import DigitalFilter
 
 class CompoundDigitalFilter(DigitalFilter):
-  """ A `DigitalFilter` that combines several other `DigitalFilter` instances into a single one. """
+  """
+  A `DigitalFilter` that combines several other `DigitalFilter` instances into a single one.
+
+  The chain of filters is compiled into a single specialized callable on first use (or via `compile`),
+  which merges adjacent filters where possible via `DigitalFilter.fuse` and then invokes the remaining
+  filters without iterating over the chain. The compiled callable is discarded automatically whenever
+  the chain is changed via `add_filter`, `remove_filter`, or `clear`, and whenever it is `reset`.
+  """
 
   def __init__(self, digital_filters: list[DigitalFilter] | None = None):
     """
@@ -10,6 +17,8 @@ class CompoundDigitalFilter(DigitalFilter):
     """
     super().__init__()
     self.__digital_filters = digital_filters if digital_filters else []
+    self.__stages: list[DigitalFilter] | None = None
+    self.__compiled = None
 
   def add_filter(self, digital_filter):
     """
@@ -22,6 +31,7 @@ class CompoundDigitalFilter(DigitalFilter):
       This `CompoundDigitalFilter` instance for chaining method calls.
     """
     self.__digital_filters.append(digital_filter)
+    self.__stages = self.__compiled = None
     return self
 
   def remove_filter(self, digital_filter):
@@ -35,15 +45,66 @@ class CompoundDigitalFilter(DigitalFilter):
       This `CompoundDigitalFilter` instance for chaining method calls.
     """
     self.__digital_filters.remove(digital_filter)
+    self.__stages = self.__compiled = None
     return self
 
   def clear(self):
     """ Clears all `DigitalFilter` instances found within this `CompoundDigitalFilter`. """
     self.__digital_filters.clear()
+    self.__stages = self.__compiled = None
+
+  def compile(self):
+    """
+    Compiles the chain of contained `DigitalFilter` instances into a single specialized callable.
+
+    Adjacent filters are first merged wherever `DigitalFilter.fuse` allows it. The remaining filters'
+    `filter` methods are then bound once and invoked directly in sequence by the callable,
+    which avoids iterating over the chain and looking up each `filter` method per value.
+
+    Merged filters are replaced by the result of `fuse`, which must keep the merged filters' state up to date
+    (e.g. by sharing it), so that recompiling after the chain is changed continues from the current state.
+    `filter`, `filter_many`, and `reset` all act upon the compiled stages, so they stay consistent with each other.
+
+    Returns:
+      The compiled callable, which takes the value to filter and returns the filtered value.
+    """
+    stages = []
+    for digital_filter in self.__digital_filters:
+      fused_filter = stages[-1].fuse(digital_filter) if stages else None
+      if fused_filter is not None:
+        stages[-1] = fused_filter
+      else:
+        stages.append(digital_filter)
+
+    self.__stages = stages
+    stage_funcs = tuple(stage.filter for stage in stages)
+
+    if not stage_funcs:
+      compiled = lambda value: value
+    elif len(stage_funcs) == 1:
+      compiled = stage_funcs[0]
+    elif len(stage_funcs) == 2:
+      (filter_0, filter_1) = stage_funcs
+      compiled = lambda value: filter_1(filter_0(value))
+    elif len(stage_funcs) == 3:
+      (filter_0, filter_1, filter_2) = stage_funcs
+      compiled = lambda value: filter_2(filter_1(filter_0(value)))
+    elif len(stage_funcs) == 4:
+      (filter_0, filter_1, filter_2, filter_3) = stage_funcs
+      compiled = lambda value: filter_3(filter_2(filter_1(filter_0(value))))
+    else:
+      def compiled(value):
+        for stage_func in stage_funcs:
+          value = stage_func(value)
+        return value
+
+    self.__compiled = compiled
+    return compiled
 
   def filter(self, value: float) -> float:
     """
-    Invokes all contained `DigitalFilter` instances in the order that they were added.
+    Invokes all contained `DigitalFilter` instances in the order that they were added
+    by way of the compiled filter chain. Compiles the chain first if needed.
 
     Args:
       value: The value to filter.
@@ -51,9 +112,48 @@ class CompoundDigitalFilter(DigitalFilter):
     Returns:
       The filtered value.
     """
-    filtered_value = value
+    compiled = self.__compiled if self.__compiled else self.compile()
+    self._value = compiled(value)
+    return self._value
 
-    for digital_filter in self.__digital_filters:
-      filtered_value = digital_filter.filter(filtered_value)
+  def filter_many(self, samples, out = None, round_values = False):
+    """
+    Invokes the batch `filter_many` of all compiled filter stages in order. Compiles the chain first if needed.
+    The first stage reads from `samples`, and every stage after it filters `out` in place.
+
+    Args:
+      samples: The buffer of values to filter, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that filtered values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether each contained filter should round its values to the nearest int before writing them into `out`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the filtered values.
+    """
+    if out is None:
+      out = samples
+
+    if self.__compiled is None:
+      self.compile()
 
-    return filtered_value
+    src = samples
+    for stage in self.__stages:
+      stage.filter_many(src, out, round_values)
+      src = out
+
+    if src is not out: # No contained filters, so perform identity filtering.
+      for i in range(len(samples)):
+        out[i] = round(samples[i]) if round_values else samples[i]
+
+    if len(samples):
+      self._value = out[len(samples) - 1]
+    return out
+
+  def reset(self):
+    """
+    Resets this filter and all contained `DigitalFilter` instances.
+    Discards the compiled chain, so that any fused stages are re-fused from the reset filters on next use.
+    """
+    super().reset()
+    for digital_filter in self.__digital_filters:
+      digital_filter.reset()
+    self.__stages = self.__compiled = None
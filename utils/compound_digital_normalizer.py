@@ -1,7 +1,16 @@
 from abstract.digital_normalizer import DigitalNormalizer
+from utils.identity_normalizer import IdentityNormalizer
 
 class CompoundDigitalNormalizer(DigitalNormalizer):
-  """ A `DigitalNormalizer` that combines several other `DigitalNormalizer` instances into a single one. """
+  """
+  A `DigitalNormalizer` that combines several other `DigitalNormalizer` instances into a single one.
+
+  The chain of normalizers is compiled into a single specialized callable on first use (or via `compile`),
+  which merges adjacent normalizers where possible via `DigitalNormalizer.fuse` (e.g. any run of consecutive
+  `LinearNormalizer` instances collapses into one affine mapping) and then invokes the remaining normalizers
+  without iterating over the chain. The compiled callable is discarded automatically whenever the chain is
+  changed via `add_normalizer`, `remove_normalizer`, or `clear`.
+  """
 
   def __init__(self, digital_normalizers: list[DigitalNormalizer] | None = None):
     """
@@ -10,6 +19,8 @@ class CompoundDigitalNormalizer(DigitalNormalizer):
     """
     super().__init__()
     self.__digital_normalizers = digital_normalizers if digital_normalizers else []
+    self.__stages: list[DigitalNormalizer] | None = None
+    self.__compiled = None
 
   def add_normalizer(self, digital_normalizer):
     """
@@ -22,6 +33,7 @@ class CompoundDigitalNormalizer(DigitalNormalizer):
       This `CompoundDigitalNormalizer` instance for chaining method calls.
     """
     self.__digital_normalizers.append(digital_normalizer)
+    self.__stages = self.__compiled = None
     return self
 
   def remove_normalizer(self, digital_normalizer):
@@ -35,15 +47,62 @@ class CompoundDigitalNormalizer(DigitalNormalizer):
       This `CompoundDigitalNormalizer` instance for chaining method calls.
     """
     self.__digital_normalizers.remove(digital_normalizer)
+    self.__stages = self.__compiled = None
     return self
 
   def clear(self):
     """ Clears all `DigitalNormalizer` instances found within this `CompoundDigitalNormalizer`. """
     self.__digital_normalizers.clear()
+    self.__stages = self.__compiled = None
+
+  def compile(self):
+    """
+    Compiles the chain of contained `DigitalNormalizer` instances into a single specialized callable.
+
+    `IdentityNormalizer` instances are first dropped, and adjacent normalizers are then merged wherever
+    `DigitalNormalizer.fuse` allows it, so a chain of N `LinearNormalizer` instances costs a single multiply-add
+    per value. The remaining normalizers' `normalize` methods are then bound once and invoked directly in sequence.
+
+    Returns:
+      The compiled callable, which takes the value to normalize and returns the normalized value.
+    """
+    stages = []
+    for digital_normalizer in self.__digital_normalizers:
+      if isinstance(digital_normalizer, IdentityNormalizer):
+        continue # Has no effect, and would otherwise keep its neighbors from being merged.
+
+      fused_normalizer = stages[-1].fuse(digital_normalizer) if stages else None
+      if fused_normalizer is not None:
+        stages[-1] = fused_normalizer
+      else:
+        stages.append(digital_normalizer)
+
+    stage_funcs = tuple(stage.normalize for stage in stages)
+
+    if not stage_funcs:
+      compiled = lambda value: value
+    elif len(stage_funcs) == 1:
+      compiled = stage_funcs[0]
+    elif len(stage_funcs) == 2:
+      (normalize_0, normalize_1) = stage_funcs
+      compiled = lambda value: normalize_1(normalize_0(value))
+    elif len(stage_funcs) == 3:
+      (normalize_0, normalize_1, normalize_2) = stage_funcs
+      compiled = lambda value: normalize_2(normalize_1(normalize_0(value)))
+    else:
+      def compiled(value):
+        for stage_func in stage_funcs:
+          value = stage_func(value)
+        return value
+
+    self.__stages = stages
+    self.__compiled = compiled
+    return compiled
 
   def normalize(self, value: float) -> float:
     """
-    Invokes all contained `DigitalNormalizer` instances in the order that they were added.
+    Invokes all contained `DigitalNormalizer` instances in the order that they were added
+    by way of the compiled normalizer chain. Compiles the chain first if needed.
 
     Args:
       value: The value to normalize.
@@ -51,9 +110,36 @@ class CompoundDigitalNormalizer(DigitalNormalizer):
     Returns:
       The normalized value.
     """
-    normalized_value = value
+    compiled = self.__compiled if self.__compiled else self.compile()
+    return compiled(value)
 
-    for digital_normalizer in self.__digital_normalizers:
-      normalized_value = digital_normalizer.normalize(normalized_value)
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Invokes the batch `normalize_many` of all contained `DigitalNormalizer` instances in the order that they were added,
+    after merging adjacent normalizers the same way as `compile`.
+    The first normalizer reads from `samples`, and every normalizer after it normalizes `out` in place.
+
+    Args:
+      samples: The buffer of values to normalize, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that normalized values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether each contained normalizer should round its values to the nearest int before writing them into `out`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the normalized values.
+    """
+    if out is None:
+      out = samples
+
+    if self.__stages is None:
+      self.compile()
+
+    src = samples
+    for digital_normalizer in self.__stages or []:
+      digital_normalizer.normalize_many(src, out, round_values)
+      src = out
+
+    if src is not out: # No contained normalizers, so perform identity normalization.
+      for i in range(len(samples)):
+        out[i] = round(samples[i]) if round_values else samples[i]
 
-    return normalized_value
+    return out
@@ -29,3 +29,31 @@ class DeadbandFilter(DigitalFilter):
     if outside_apply_range or self._value is None or abs(value - self._value) > self.deadband:
       self._value = value
     return self._value
+
+  def filter_many(self, samples, out = None, round_values = False):
+    """
+    Applies a deadband (low-pass) filter to a whole buffer of values.
+
+    Args:
+      samples: The buffer of values to apply the deadband filter to, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that filtered values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether to round filtered values to the nearest int before writing them into `out`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the filtered values.
+    """
+    if out is None:
+      out = samples
+
+    deadband = self.deadband
+    (range_min, range_max) = self.apply_range
+    current = self._value
+
+    for i in range(len(samples)):
+      value = samples[i]
+      if value < range_min or value > range_max or current is None or abs(value - current) > deadband:
+        current = value
+      out[i] = round(current) if round_values else current
+
+    self._value = current
+    return out
@@ -1,10 +1,12 @@
-from utime import ticks_ms
+from utime import ticks_diff, ticks_ms
 
 def debounce(func, delay_ms: int):
   """
   Produces a debounced version of the function `func` that will only be invoked
   after `delay_ms` milliseconds have passed since the last time it was invoked.
 
+  For confirming that a Pin level has actually settled, prefer the sampling `PinDebouncer`.
+
   Args:
     func: The function that shall be debounced.
     delay_ms: The debounce delay in milliseconds.
@@ -12,12 +14,13 @@ def debounce(func, delay_ms: int):
   Returns:
     The debounce version of the input function.
   """
-  last_called = 0
+  last_called: int | None = None
 
   def wrapper(*args, **kwargs):
     nonlocal last_called
-    if ticks_ms() - last_called >= delay_ms:
-      last_called = ticks_ms()
+    now = ticks_ms()
+    if last_called is None or ticks_diff(now, last_called) >= delay_ms:
+      last_called = now
       return func(*args, **kwargs)
 
   return wrapper
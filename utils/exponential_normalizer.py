@@ -1,3 +1,4 @@
+from array import array
 from abstract.digital_normalizer import DigitalNormalizer
 
 class ExponentialNormalizer(DigitalNormalizer):
@@ -5,43 +6,67 @@ class ExponentialNormalizer(DigitalNormalizer):
   A `DigitalNormalizer` that performs exponential mappings of sample values
   from their linear position to their position on an exponential curve with
   Y-axis bounded by `dest_range`.
+
+  The `exp_steps + 1` data points of the curve are precomputed into an `array` lookup table whenever
+  `exp_steps`, `src_range`, or `dest_range` change. By default, normalizing a value linearly interpolates between
+  the two nearest data points, so the output stays a continuous curve; with `interpolate` disabled it is a single table index
+  that snaps to the nearest of the `exp_steps + 1` levels. Values outside of `src_range` are clamped to it.
   """
 
   def __init__(
     self,
     exp_steps: int,
     src_range: tuple[float, float],
-    dest_range: tuple[float, float] | None = None
+    dest_range: tuple[float, float] | None = None,
+    interpolate = True,
   ):
     """
     Args:
       exp_steps: The number of mapped data points evenly spaced on the X-axis of the exponential curve.
       src_range: The range bounding Y;-axis values on the source linear curve.
       dest_range: The optional range bounding Y-axis values on the destination exponential curve. Defaults to `src_range`.
+      interpolate: Whether to linearly interpolate between the two nearest data points instead of snapping to the nearest one, which is cheaper but quantizes the output to `exp_steps + 1` levels. Defaults to `True`.
     """
     super().__init__()
     self.__exp_steps = exp_steps
     self.__src_range = src_range
     self.__dest_range = dest_range if dest_range else src_range
+    self.interpolate = interpolate
+    self.__build_lut()
 
   @property
   def exp_steps(self):
     """ The number of mapped data points evenly spaced on the X-axis of the exponential curve. """
     return self.__exp_steps
 
+  @exp_steps.setter
+  def exp_steps(self, value: int):
+    self.__exp_steps = value
+    self.__build_lut()
+
   @property
   def src_range(self):
     """ The range bounding Y-axis values on the source linear curve. """
     return self.__src_range
 
+  @src_range.setter
+  def src_range(self, value: tuple[float, float]):
+    self.__src_range = value
+    self.__build_lut()
+
   @property
   def dest_range(self):
     """ The range bounding Y-axis values on the destination exponential curve. """
     return self.__dest_range
 
+  @dest_range.setter
+  def dest_range(self, value: tuple[float, float]):
+    self.__dest_range = value
+    self.__build_lut()
+
   def normalize(self, value: float) -> float:
     """
-    Normalizes given values on a linear curve to one of `exp_step` data points
+    Normalizes given values on a linear curve to their position (or, without `interpolate`, the nearest of `exp_step` data points)
     on an exponential curve that fits within the configured `dest_range`.
 
     Args:
@@ -50,9 +75,65 @@ class ExponentialNormalizer(DigitalNormalizer):
     Returns:
       The normalized value.
     """
-    src_scale = self.src_range[1] - self.src_range[0]
-    dest_scale = self.dest_range[1] - self.dest_range[0]
+    position = (value - self.__src_min) * self.__index_scale
+
+    if self.interpolate:
+      if position <= 0: # Checked before `int`, which truncates positions in `(-1, 0)` up to `0`.
+        return self.__lut[0]
+      if position >= self.__exp_steps:
+        return self.__lut[self.__exp_steps]
+      idx = int(position)
+      return self.__lut[idx] + (self.__lut[idx + 1] - self.__lut[idx]) * (position - idx)
+
+    idx = int(position + 0.5)
+    if idx < 0:
+      idx = 0
+    elif idx > self.__exp_steps:
+      idx = self.__exp_steps
+    return self.__lut[idx]
+
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Normalizes a whole buffer of values on a linear curve to their position (or, without `interpolate`, the nearest of `exp_step` data points)
+    on an exponential curve that fits within the configured `dest_range`.
+
+    Args:
+      samples: The buffer of values to normalize, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that normalized values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether to round normalized values to the nearest int before writing them into `out`. Required when `out` is an integer buffer. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the normalized values.
+    """
+    if out is None:
+      out = samples
+
+    if self.interpolate:
+      normalize_value = self.normalize
+      for i in range(len(samples)):
+        value = normalize_value(samples[i])
+        out[i] = round(value) if round_values else value
+      return out
+
+    lut = self.__lut
+    src_min = self.__src_min
+    index_scale = self.__index_scale
+    exp_steps = self.__exp_steps
+
+    for i in range(len(samples)):
+      idx = int((samples[i] - src_min) * index_scale + 0.5)
+      value = lut[0 if idx < 0 else exp_steps if idx > exp_steps else idx]
+      out[i] = round(value) if round_values else value
+
+    return out
+
+  def __build_lut(self):
+    """ Precomputes the `exp_steps + 1` data points of the exponential curve into the lookup table. """
+    (src_min, src_max) = self.__src_range
+    (dest_min, dest_max) = self.__dest_range
+    exp_steps = self.__exp_steps
 
-    base = dest_scale ** (1 / self.exp_steps)
-    exp = (value - self.src_range[0]) / src_scale * self.exp_steps
-    return (base ** exp) + self.dest_range[0]
\ No newline at end of file
+    base = (dest_max - dest_min) ** (1 / exp_steps)
+    self.__lut = array('f', ((base ** step) + dest_min for step in range(exp_steps + 1)))
+    self.__src_min = src_min
+    self.__index_scale = exp_steps / (src_max - src_min)
@@ -0,0 +1,125 @@
+from array import array
+from abstract.digital_normalizer import DigitalNormalizer
+
+class GammaNormalizer(DigitalNormalizer):
+  """
+  A `DigitalNormalizer` that performs perceptual brightness correction of LED intensity values in range `[0, 255]`
+  to PWM duty cycle values in range `[0, 65535]`, so that equal intensity steps look like equal brightness steps.
+
+  The correction follows either a power-law `gamma` curve or the CIE 1931 lightness curve, and is precomputed
+  into a 256 entry `array('H')` table, so each correction is a single table index. Share one instance
+  between LEDs (e.g. all channels of an `RgbLED`) to share its table.
+  """
+
+  def __init__(self, gamma = 2.2, cie_lightness = False):
+    """
+    Args:
+      gamma: The optional exponent of the power-law correction curve. Ignored if `cie_lightness` is set. Defaults to `2.2`.
+      cie_lightness: Whether to use the CIE 1931 lightness curve instead of a power-law curve. Defaults to `False`.
+    """
+    super().__init__()
+    self.__gamma = gamma
+    self.__cie_lightness = cie_lightness
+
+    if cie_lightness:
+      self.__table = array('H', (round(GammaNormalizer.__cie_luminance(intensity / 255 * 100) * 65535) for intensity in range(256)))
+    else:
+      self.__table = array('H', (round((intensity / 255) ** gamma * 65535) for intensity in range(256)))
+
+  @property
+  def gamma(self) -> float:
+    """ The exponent of the power-law correction curve. Ignored if `cie_lightness` is set. """
+    return self.__gamma
+
+  @property
+  def cie_lightness(self) -> bool:
+    """ Whether the CIE 1931 lightness curve is used instead of a power-law curve. """
+    return self.__cie_lightness
+
+  @property
+  def table(self) -> array:
+    """
+    The precomputed table of PWM duty cycle values in range `[0, 65535]` indexed by intensity values in range `[0, 255]`.
+
+    Must not be modified.
+    """
+    return self.__table
+
+  def normalize(self, value: float) -> float:
+    """
+    Corrects a given intensity `value` into a PWM duty cycle value.
+
+    Args:
+      value: The intensity value in range `[0, 255]` to correct. Rounded down to an int.
+
+    Returns:
+      The corrected PWM duty cycle value in range `[0, 65535]`.
+    """
+    return self.__table[int(value)]
+
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Corrects a whole buffer of intensity values into PWM duty cycle values.
+
+    Args:
+      samples: The buffer of intensity values in range `[0, 255]` to correct, such as a `bytearray`.
+      out: The optional buffer that PWM duty cycle values are written into in place, such as an `array('H')`. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Unused since PWM duty cycle values are always ints. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the PWM duty cycle values.
+    """
+    if out is None:
+      out = samples
+
+    table = self.__table
+    for i in range(len(samples)):
+      out[i] = table[int(samples[i])]
+
+    return out
+
+  def invert(self, duty_u16: int) -> int:
+    """
+    Finds the intensity value whose corrected PWM duty cycle value is closest to a given `duty_u16`.
+    Ties (including equal table entries, such as the leading zeros) resolve to the lowest intensity value,
+    so that `invert(table[i])` is the first intensity value with that PWM duty cycle value, e.g. `0` for an off LED.
+
+    Args:
+      duty_u16: The PWM duty cycle value in range `[0, 65535]`.
+
+    Returns:
+      The intensity value in range `[0, 255]`.
+    """
+    table = self.__table
+    lo = 0
+    hi = 255
+
+    # Find the lowest intensity value whose PWM duty cycle value is at least `duty_u16`.
+    while lo < hi:
+      mid = (lo + hi) >> 1
+      if table[mid] < duty_u16:
+        lo = mid + 1
+      else:
+        hi = mid
+
+    if lo and duty_u16 - table[lo - 1] <= table[lo] - duty_u16:
+      lo -= 1
+      while lo and table[lo - 1] == table[lo]:
+        lo -= 1
+
+    return lo
+
+  @staticmethod
+  def __cie_luminance(lightness: float) -> float:
+    """
+    Converts a CIE 1931 lightness value to a relative luminance.
+
+    Args:
+      lightness: The lightness value in range `[0, 100]`.
+
+    Returns:
+      The relative luminance in range `[0, 1]`.
+    """
+    if lightness <= 8:
+      return lightness / 903.3
+    return ((lightness + 16) / 116) ** 3
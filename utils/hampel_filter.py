@@ -0,0 +1,120 @@
+from abstract.digital_filter import DigitalFilter
+from utils.sorted_window import SortedWindow
+
+class HampelFilter(DigitalFilter):
+  """
+  A Hampel (outlier rejection) filter that replaces any value lying more than `n_sigmas` estimated standard deviations
+  from the median of the last `window_size` values with that median. All other values pass through untouched.
+
+  The standard deviation is estimated as `1.4826 * MAD`, where MAD is the median absolute deviation from the median.
+  The window is kept sorted with a `SortedWindow`, so both the median and the MAD are found via binary search
+  instead of sorting the window for each new value. Values are truncated to ints, and all arithmetic stays integer.
+
+  Args:
+    window_size: The optional size of the window, or the number of recent values the median and MAD are taken over. Defaults to `7`.
+    n_sigmas: The optional number of estimated standard deviations a value may lie from the median before being rejected as an outlier. Defaults to `3`.
+
+  Raises:
+    ValueError: If `window_size` is less than `1`.
+  """
+
+  MAD_SCALE = 1.4826
+
+  def __init__(self, window_size = 7, n_sigmas = 3.0):
+    super().__init__()
+    self.__window = SortedWindow(window_size)
+    self.__n_sigmas = n_sigmas
+    self.__threshold_q8 = round(n_sigmas * HampelFilter.MAD_SCALE * 256) # Q8 fixed-point rejection threshold.
+    self.__outliers = 0
+
+  @property
+  def window_size(self) -> int:
+    """ The size of the window, or the number of recent values the median and MAD are taken over. """
+    return self.__window.size
+
+  @property
+  def n_sigmas(self) -> float:
+    """ The number of estimated standard deviations a value may lie from the median before being rejected as an outlier. """
+    return self.__n_sigmas
+
+  @property
+  def outliers(self) -> int:
+    """ The number of values that have been rejected as outliers since construction or the last `reset`. """
+    return self.__outliers
+
+  def filter(self, value: float) -> float:
+    """
+    Applies a Hampel filter to a given `value`.
+
+    Args:
+      value: The new value to apply the Hampel filter to.
+
+    Returns:
+      The given `value` if it is not an outlier, or the window median otherwise.
+    """
+    value = int(value)
+    window = self.__window
+    window.push(value)
+
+    sorted_values = window.sorted_values
+    count = window.count
+    half = count >> 1
+
+    # Work in units of 1/2 so that the median of an even window stays an exact int.
+    median2 = sorted_values[half] << 1 if count & 1 else sorted_values[half - 1] + sorted_values[half]
+
+    # MAD in units of 1/4, so that the median of an even number of deviations also stays exact.
+    if count & 1:
+      mad4 = self.__kth_deviation(median2, half) << 1
+    else:
+      mad4 = self.__kth_deviation(median2, half - 1) + self.__kth_deviation(median2, half)
+
+    deviation4 = abs((value << 1) - median2) << 1
+    if (deviation4 << 8) > self.__threshold_q8 * mad4:
+      self.__outliers += 1
+      self._value = median2 >> 1
+    else:
+      self._value = value
+
+    return self._value
+
+  def reset(self):
+    """ Resets the filter by emptying its window and outlier count. """
+    super().reset()
+    self.__window.reset()
+    self.__outliers = 0
+
+  def __kth_deviation(self, median2: int, k: int) -> int:
+    """
+    Finds the `k`-th smallest absolute deviation (in units of 1/2) of the window values from the median in O(log n).
+
+    Values below the middle of the sorted window, walked downwards, and values from the middle upwards
+    form two already sorted deviation sequences, so the `k`-th smallest of their union is found
+    by binary searching how many deviations to take from the lower sequence.
+
+    Args:
+      median2: The window median in units of 1/2.
+      k: The 0-based rank of the deviation to find.
+
+    Returns:
+      The `k`-th smallest absolute deviation in units of 1/2.
+    """
+    sorted_values = self.__window.sorted_values
+    half = self.__window.count >> 1
+    upper_len = self.__window.count - half
+
+    # Lower deviations: `median2 - 2 * sorted_values[half - 1 - i]`; upper deviations: `2 * sorted_values[half + j] - median2`.
+    lo = k + 1 - upper_len if k + 1 > upper_len else 0
+    hi = k + 1 if k + 1 < half else half
+
+    while lo < hi:
+      i = (lo + hi) >> 1 # Number of deviations taken from the lower sequence.
+      if median2 - (sorted_values[half - 1 - i] << 1) < (sorted_values[half + k - i] << 1) - median2:
+        lo = i + 1
+      else:
+        hi = i
+
+    j = k + 1 - lo # Number of deviations taken from the upper sequence.
+    lower = median2 - (sorted_values[half - lo] << 1) if lo > 0 else -1
+    upper = (sorted_values[half + j - 1] << 1) - median2 if j > 0 else -1
+    return lower if lower > upper else upper
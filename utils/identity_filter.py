@@ -6,7 +6,7 @@ class IdentityFilter(DigitalFilter):
   where the input value is returned as the filtered output value.
   """
 
-  def normalize(self, value: float) -> float:
+  def filter(self, value: float) -> float:
     """
     Performs identity filtering where the input value is the filter output value.
 
@@ -16,4 +16,41 @@ class IdentityFilter(DigitalFilter):
     Returns:
       The input `value`.
     """
+    self._value = value
     return value
+
+  def filter_many(self, samples, out = None, round_values = False):
+    """
+    Performs identity filtering on a whole buffer of values by copying them into `out`.
+
+    Args:
+      samples: The buffer of values to filter.
+      out: The optional buffer that the values are copied into. Must be at least as long as `samples`. Defaults to `samples`, in which case no copy is made.
+      round_values: Whether to round values to the nearest int before copying them into `out`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the input values.
+    """
+    if out is None:
+      out = samples
+
+    count = len(samples)
+    if out is not samples or round_values:
+      for i in range(count):
+        out[i] = round(samples[i]) if round_values else samples[i]
+
+    if count:
+      self._value = out[count - 1]
+    return out
+
+  def fuse(self, next_filter: DigitalFilter) -> DigitalFilter | None:
+    """
+    Merges this filter with the `next_filter` that directly follows it by dropping this filter.
+
+    Args:
+      next_filter: The `DigitalFilter` that directly follows this filter.
+
+    Returns:
+      The `next_filter`.
+    """
+    return next_filter
@@ -17,3 +17,24 @@ class IdentityNormalizer(DigitalNormalizer):
       The input `value`.
     """
     return value
+
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Performs identity normalization on a whole buffer of values by copying them into `out`.
+
+    Args:
+      samples: The buffer of values to normalize.
+      out: The optional buffer that the values are copied into. Must be at least as long as `samples`. Defaults to `samples`, in which case no copy is made.
+      round_values: Whether to round values to the nearest int before copying them into `out`. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the input values.
+    """
+    if out is None:
+      out = samples
+
+    if out is not samples or round_values:
+      for i in range(len(samples)):
+        out[i] = round(samples[i]) if round_values else samples[i]
+
+    return out
@@ -1,21 +1,67 @@
+from array import array
+from micropython import schedule
+from utime import ticks_diff, ticks_ms, ticks_us
 from utils.debounce import debounce
 from utils.interrupt_mutex import InterruptMutex
+from utils.irq_timing import IrqTiming
 
 class InterruptListener:
   """
   A hardware interrupt listener that listens for interrupts and invokes all registered handlers using a debounce delay.
 
   Also, optionally enforces only one execution of a handler function at a time using an `InterruptMutex`.
+
+  In `'direct'` dispatch mode, handlers are invoked within the hardware IRQ itself.
+  In the deferred `'schedule'` and `'async'` dispatch modes, the IRQ only writes an event code and `ticks_us` timestamp
+  into a preallocated ring buffer (without allocating), and wakes a single drain that invokes the handlers on the main context,
+  either via `micropython.schedule` or via the `dispatch_async` coroutine awaiting an asyncio `ThreadSafeFlag`.
+  Events that arrive while the ring buffer is full are dropped and counted in `overflows`.
   """
 
-  def __init__(self, handler = None):
+  DIRECT = 'direct'
+  SCHEDULE = 'schedule'
+  ASYNC = 'async'
+
+  def __init__(self, handler = None, dispatch = DIRECT, queue_size = 16, timing: IrqTiming | None = None):
     """
     Args:
       handler: An optional default handler function for the hardware interrupt. Takes no arguments.
+      dispatch: The optional dispatch mode. Either `'direct'`, `'schedule'`, or `'async'`. Defaults to `'direct'`.
+      queue_size: The optional number of pending events the ring buffer holds in a deferred dispatch mode. Defaults to `16`.
+      timing: The optional `IrqTiming` that records the latency and duration of each dispatch to the handlers. Defaults to `None` for no instrumentation.
+
+    Raises:
+      ValueError: If given an invalid `dispatch` value.
+      ValueError: If `queue_size` is less than `1`.
     """
+    if dispatch not in (InterruptListener.DIRECT, InterruptListener.SCHEDULE, InterruptListener.ASYNC):
+      raise ValueError(
+        f"Invalid dispatch value. Must be either '{InterruptListener.DIRECT}', '{InterruptListener.SCHEDULE}', "
+        f"or '{InterruptListener.ASYNC}'; was given '{dispatch}'."
+      )
+    if queue_size < 1:
+      raise ValueError(f"queue_size must be an int greater than 0; was given {queue_size}.")
+
     self.__registered_interrupt_handlers = []
     self.__mutex = InterruptMutex()
 
+    self.__dispatch = dispatch
+    self.__queue_len = queue_size + 1 # One slot is kept free to tell a full ring from an empty one.
+    self.__event_codes = array('i', (0 for _ in range(self.__queue_len)))
+    self.__event_ticks_us = array('i', (0 for _ in range(self.__queue_len)))
+    self.__queue_head = 0 # Only advanced by the drain.
+    self.__queue_tail = 0 # Only advanced by the IRQ.
+    self.__overflows = 0
+    self.__drain_pending = False
+    self.__drain_callback = self.__drain
+    self.__flag = None
+    if dispatch == InterruptListener.ASYNC:
+      from asyncio import ThreadSafeFlag # Imported lazily, so that other dispatch modes do not load asyncio.
+      self.__flag = ThreadSafeFlag()
+    self.__event_code = 0
+    self.__event_tick_us = 0
+    self.timing = timing
+
     if handler:
       self.handler(handler)
 
@@ -38,7 +84,39 @@ class InterruptListener:
     """
     return self.__mutex
 
-  def listen(self, debounce_ms = 150):
+  @property
+  def dispatch(self) -> str:
+    """ The dispatch mode. Either `'direct'`, `'schedule'`, or `'async'`. """
+    return self.__dispatch
+
+  @property
+  def timing(self) -> IrqTiming | None:
+    """
+    The `IrqTiming` that records the latency (from the event's IRQ timestamp) and duration of each dispatch to the handlers,
+    or `None` for no instrumentation. In `'direct'` dispatch mode, latency is measured from IRQ entry, before debouncing.
+    """
+    return self.__timing
+
+  @timing.setter
+  def timing(self, value: IrqTiming | None):
+    self.__timing = value
+
+  @property
+  def overflows(self) -> int:
+    """ The number of events dropped because the ring buffer was full in a deferred dispatch mode. """
+    return self.__overflows
+
+  @property
+  def event_code(self) -> int:
+    """ The code of the event whose handlers are being invoked, as given to `listen` (deferred dispatch modes only) or `trigger`. """
+    return self.__event_code
+
+  @property
+  def event_tick_us(self) -> int:
+    """ The `ticks_us` timestamp of the event whose handlers are being invoked, taken within the IRQ in a deferred dispatch mode. """
+    return self.__event_tick_us
+
+  def listen(self, debounce_ms = 150, event_code = 0):
     """
     Generates an interrupt listener callback function that
     should be bound to a specific hardware component's interrupt signal.
@@ -48,15 +126,24 @@ class InterruptListener:
 
     Args:
       debounce_ms: An optional number of milliseconds to debounce handling of the hardware interrupt. The hardware interrupt will only be handled once `debounce_ms` has elapsed since the last interrupt. Defaults to `150`.
+      event_code: An optional int code recorded with each event in a deferred dispatch mode, exposed to handlers via `event_code`. Defaults to `0`.
 
     Returns:
       This `HardwareInterrupt` instance.
     """
-    def invoke_registered_handlers(*args, **kwargs):
-      for registered_handler in self.__registered_interrupt_handlers:
-        registered_handler()
+    if self.__dispatch != InterruptListener.DIRECT:
+      return self.__deferred_listener(debounce_ms, event_code)
+
+    def invoke_registered_handlers(entry_us: int | None):
+      self.__invoke_handlers(entry_us)
+
+    debounced = debounce(invoke_registered_handlers, debounce_ms)
+
+    def listen_direct(_ = None):
+      # Timestamp IRQ entry before debouncing (only while instrumented), so that latency includes the debounce check.
+      debounced(ticks_us() if self.__timing is not None else None)
 
-    return debounce(invoke_registered_handlers, debounce_ms)
+    return listen_direct
 
   def handler(self, with_mutex = False):
     """
@@ -102,3 +189,116 @@ class InterruptListener:
     """
     if handler in self.__registered_interrupt_handlers:
       self.__registered_interrupt_handlers.remove(handler)
+
+  def trigger(self, event_code = 0):
+    """
+    Triggers an event without debouncing, e.g. from within a component's own IRQ state machine.
+    Queues the event in a deferred dispatch mode, where it is allocation free and safe to call within an IRQ,
+    or immediately invokes the registered handlers in `'direct'` dispatch mode.
+
+    Args:
+      event_code: An optional int code recorded with the event, exposed to handlers via `event_code`. Defaults to `0`.
+    """
+    if self.__dispatch != InterruptListener.DIRECT:
+      self.__queue_event(event_code)
+      return
+
+    self.__event_code = event_code
+    self.__event_tick_us = ticks_us()
+    self.__invoke_handlers(self.__event_tick_us)
+
+  async def dispatch_async(self):
+    """
+    Drains events queued by the IRQ and invokes the registered handlers, forever, in `'async'` dispatch mode.
+    Should be run on the main asyncio event loop, e.g. by passing it to `MainLoop.run_async`.
+
+    Raises:
+      RuntimeError: If not in `'async'` dispatch mode.
+    """
+    if self.__flag is None:
+      raise RuntimeError(f"dispatch_async requires '{InterruptListener.ASYNC}' dispatch mode; dispatch mode is '{self.__dispatch}'.")
+
+    while True:
+      await self.__flag.wait()
+      self.__drain()
+
+  def __deferred_listener(self, debounce_ms: int, event_code: int):
+    """
+    Generates an allocation free interrupt listener callback function that only queues events for deferred dispatch.
+
+    Args:
+      debounce_ms: The number of milliseconds to debounce handling of the hardware interrupt.
+      event_code: The int code recorded with each event.
+
+    Returns:
+      The interrupt listener callback function.
+    """
+    last_ms = ticks_ms()
+    debouncing = False
+
+    def queue_event(_):
+      nonlocal last_ms, debouncing
+      now = ticks_ms()
+      if debouncing and ticks_diff(now, last_ms) < debounce_ms:
+        return
+      last_ms = now
+      debouncing = True
+      self.__queue_event(event_code)
+
+    return queue_event
+
+  def __queue_event(self, event_code: int):
+    """
+    Writes an event into the ring buffer within the IRQ, and wakes the drain if it is not already pending.
+
+    Args:
+      event_code: The int code of the event.
+    """
+    tail = self.__queue_tail
+    next_tail = tail + 1 if tail + 1 < self.__queue_len else 0
+    if next_tail == self.__queue_head:
+      self.__overflows += 1
+      return
+
+    self.__event_codes[tail] = event_code
+    self.__event_ticks_us[tail] = ticks_us()
+    self.__queue_tail = next_tail
+
+    if not self.__drain_pending:
+      self.__drain_pending = True
+      if self.__flag is not None:
+        self.__flag.set()
+      else:
+        try:
+          schedule(self.__drain_callback, 0)
+        except RuntimeError: # Scheduler queue full; the next event retries.
+          self.__drain_pending = False
+
+  def __drain(self, _ = None):
+    """ Invokes the registered handlers for each event queued by the IRQ, in order, on the main context. """
+    self.__drain_pending = False # Cleared first so an event queued during the drain wakes another drain.
+
+    while self.__queue_head != self.__queue_tail:
+      head = self.__queue_head
+      self.__event_code = self.__event_codes[head]
+      self.__event_tick_us = self.__event_ticks_us[head]
+      self.__queue_head = head + 1 if head + 1 < self.__queue_len else 0
+      self.__invoke_handlers(self.__event_tick_us)
+
+  def __invoke_handlers(self, entry_us: int | None = None):
+    """
+    Invokes the registered handlers, recording their timing if instrumented.
+
+    Args:
+      entry_us: The optional `ticks_us` timestamp of the event's IRQ entry. Defaults to the handler start.
+    """
+    timing = self.__timing
+    if timing is None:
+      for registered_handler in self.__registered_interrupt_handlers:
+        registered_handler()
+      return
+
+    start_us = ticks_us()
+    for registered_handler in self.__registered_interrupt_handlers:
+      registered_handler()
+    timing.record(start_us if entry_us is None else entry_us, start_us, ticks_us())
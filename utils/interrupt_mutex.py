@@ -4,18 +4,44 @@ class InterruptMutex:
   of a function shared by the main event loop and hardware interrupts.
 
   Can be bound to a method via decorator or by manually invoking `bind`.
+
+  Blocked calls are kept in a preallocated ring of `capacity` (function, args, kwargs) slots, so queueing a blocked call
+  does not allocate beyond its own arguments, and `unlock` drains each one in O(1). When the ring is full,
+  the `overflow` policy either drops the new call (`'drop_newest'`) or the oldest queued call (`'drop_oldest'`),
+  and counts it in `overflows`.
   """
 
-  def __init__(self, discard_duplicates = False, manual = False):
+  DROP_NEWEST = 'drop_newest'
+  DROP_OLDEST = 'drop_oldest'
+
+  def __init__(self, discard_duplicates = False, manual = False, capacity = 16, overflow = DROP_NEWEST):
     """
     Args:
-      discard_duplicates: Whether to discard all duplicate blocked calls to the bound function when locked. Only the last call will be kept. Defaults to `False`.
+      discard_duplicates: Whether to coalesce duplicate blocked calls to the same bound function when locked. Only the last call's arguments are kept, in the first call's place in the queue. Defaults to `False`.
       manual: Whether `lock` and `unlock` must be manually called; disables the automatic locking mechanism on the bound function's invocation. Defaults to `False`.
+      capacity: The optional maximum number of blocked calls queued while locked. Defaults to `16`.
+      overflow: The optional policy for a blocked call when the queue is full. Either `'drop_newest'` or `'drop_oldest'`. Defaults to `'drop_newest'`.
+
+    Raises:
+      ValueError: If `capacity` is less than `1`.
+      ValueError: If given an invalid `overflow` value.
     """
+    if capacity < 1:
+      raise ValueError(f"capacity must be an int greater than 0; was given {capacity}.")
+    if overflow not in (InterruptMutex.DROP_NEWEST, InterruptMutex.DROP_OLDEST):
+      raise ValueError(f"Invalid overflow value. Must be either '{InterruptMutex.DROP_NEWEST}' or '{InterruptMutex.DROP_OLDEST}'; was given '{overflow}'.")
+
     self.discard_duplicates = discard_duplicates
     self.manual = manual
+    self.__overflow = overflow
     self.__locked = False
-    self.__blocked_invocations = []
+    self.__capacity = capacity
+    self.__funcs: list = [None] * capacity
+    self.__args: list = [None] * capacity
+    self.__kwargs: list = [None] * capacity
+    self.__head = 0
+    self.__count = 0
+    self.__overflows = 0
 
   def __call__(self, func):
     return self.bind(func)
@@ -33,6 +59,26 @@ class InterruptMutex:
     """ The current locked state of the mutex. """
     return self.__locked
 
+  @property
+  def capacity(self) -> int:
+    """ The maximum number of blocked calls queued while locked. """
+    return self.__capacity
+
+  @property
+  def overflow(self) -> str:
+    """ The policy for a blocked call when the queue is full. Either `'drop_newest'` or `'drop_oldest'`. """
+    return self.__overflow
+
+  @property
+  def overflows(self) -> int:
+    """ The number of blocked calls dropped because the queue was full. """
+    return self.__overflows
+
+  @property
+  def pending(self) -> int:
+    """ The number of blocked calls currently queued. """
+    return self.__count
+
   def bind(self, func, discard_duplicates: bool | None = None, manual: bool | None = None):
     """
     Binds this mutex to a given function.
@@ -47,7 +93,7 @@ class InterruptMutex:
 
     Args:
       func: The function to bind the mutex lock to.
-      discard_duplicates: Whether to discard all duplicate blocked calls to `func` when locked. Only the last call will be kept. Defaults to `self.discard_duplicates`.
+      discard_duplicates: Whether to coalesce duplicate blocked calls to `func` when locked. Only the last call's arguments will be kept. Defaults to `self.discard_duplicates`.
       manual: Whether `lock` and `unlock` must be manually called; disables the automatic locking mechanism on `func` invocation. Defaults to `self.manual`.
 
     Returns:
@@ -60,9 +106,7 @@ class InterruptMutex:
 
     def wrapper(*args, **kwargs):
       if self.locked:
-        if discard_duplicates:
-          self.__blocked_invocations.clear()
-        self.__blocked_invocations.append(lambda: func(*args, **kwargs))
+        self.__block(func, args, kwargs, discard_duplicates)
       elif not manual:
         with self:
           func(*args, **kwargs)
@@ -84,7 +128,49 @@ class InterruptMutex:
     Unlocks this mutex which immediately invokes any blocked function calls to bound functions
     in the order that they occurred while locked.
     """
-    while self.__blocked_invocations:
-      handler = self.__blocked_invocations.pop(0)
-      handler()
+    funcs = self.__funcs
+    while self.__count:
+      head = self.__head
+      func = funcs[head]
+      args = self.__args[head]
+      kwargs = self.__kwargs[head]
+      funcs[head] = self.__args[head] = self.__kwargs[head] = None
+      self.__head = head + 1 if head + 1 < self.__capacity else 0
+      self.__count -= 1
+      func(*args, **kwargs)
     self.__locked = False # Important to do this last so additional interrupts don't interrupt queued blocked invocations during unlock.
+
+  def __block(self, func, args: tuple, kwargs: dict, discard_duplicates: bool):
+    """
+    Queues a blocked call for invocation upon `unlock`.
+
+    Args:
+      func: The blocked function.
+      args: The positional arguments of the blocked call.
+      kwargs: The keyword arguments of the blocked call.
+      discard_duplicates: Whether to coalesce the blocked call with an already queued call to `func`.
+    """
+    capacity = self.__capacity
+    funcs = self.__funcs
+
+    if discard_duplicates:
+      idx = self.__head
+      for _ in range(self.__count):
+        if funcs[idx] is func:
+          self.__args[idx] = args
+          self.__kwargs[idx] = kwargs
+          return
+        idx = idx + 1 if idx + 1 < capacity else 0
+
+    if self.__count == capacity:
+      self.__overflows += 1
+      if self.__overflow == InterruptMutex.DROP_NEWEST:
+        return
+      self.__head = self.__head + 1 if self.__head + 1 < capacity else 0
+      self.__count -= 1
+
+    idx = (self.__head + self.__count) % capacity
+    funcs[idx] = func
+    self.__args[idx] = args
+    self.__kwargs[idx] = kwargs
+    self.__count += 1
@@ -0,0 +1,172 @@
+from array import array
+from utime import ticks_diff
+
+class TimingHistogram:
+  """
+  A fixed-size histogram of durations in microseconds with power of 2 buckets, whose `record` is allocation free.
+
+  Bucket `0` counts durations of `0` us, bucket `i` counts durations in `[2 ** (i - 1), 2 ** i)` us,
+  and the last bucket also counts every longer duration.
+
+  To stay within MicroPython's small int range, the total behind `mean_us` is halved together with its count
+  whenever it reaches `MEAN_TOTAL_LIMIT_US`. This keeps the mean at that moment, but weighs later durations more than earlier ones.
+  """
+
+  MEAN_TOTAL_LIMIT_US = 1 << 29
+
+  def __init__(self, buckets = 16):
+    """
+    Args:
+      buckets: The optional number of buckets. Defaults to `16`, for a last bucket starting at `16384` us.
+
+    Raises:
+      ValueError: If `buckets` is less than `2`.
+    """
+    if buckets < 2:
+      raise ValueError(f"buckets must be an int greater than 1; was given {buckets}.")
+
+    self.__counts = array('i', (0 for _ in range(buckets)))
+    self.reset()
+
+  @property
+  def count(self) -> int:
+    """ The number of recorded durations. """
+    return self.__count
+
+  @property
+  def max_us(self) -> int:
+    """ The longest recorded duration in microseconds. """
+    return self.__max_us
+
+  @property
+  def mean_us(self) -> float:
+    """ The mean recorded duration in microseconds. """
+    return self.__total_us / self.__mean_count if self.__mean_count else 0.0
+
+  def record(self, duration_us: int):
+    """
+    Records a duration. Negative durations are recorded as `0`.
+
+    Args:
+      duration_us: The duration in microseconds.
+    """
+    if duration_us < 0:
+      duration_us = 0
+
+    idx = 0
+    last_idx = len(self.__counts) - 1
+    value = duration_us
+    while value and idx < last_idx:
+      value >>= 1
+      idx += 1
+
+    self.__counts[idx] += 1
+    self.__count += 1
+    self.__total_us += duration_us
+    self.__mean_count += 1
+    if self.__total_us >= TimingHistogram.MEAN_TOTAL_LIMIT_US:
+      self.__total_us >>= 1
+      self.__mean_count = (self.__mean_count + 1) >> 1
+    if duration_us > self.__max_us:
+      self.__max_us = duration_us
+
+  def buckets(self) -> list[tuple[int, int]]:
+    """
+    Gets the bucket counts.
+
+    Returns:
+      A `(lower bound in microseconds, count)` tuple per bucket, in ascending order.
+    """
+    return [(1 << (i - 1) if i else 0, count) for (i, count) in enumerate(self.__counts)]
+
+  def percentile_us(self, percentile: float) -> int:
+    """
+    Gets an upper bound of a percentile of the recorded durations, at the resolution of the buckets.
+
+    Args:
+      percentile: The percentile, in range `[0, 100]`.
+
+    Returns:
+      The upper bound in microseconds of the bucket holding the percentile, capped at `max_us`, or `0` if nothing has been recorded.
+    """
+    threshold = self.__count * percentile / 100
+    seen = 0
+    last_idx = len(self.__counts) - 1
+
+    for (i, count) in enumerate(self.__counts):
+      seen += count
+      if count and seen >= threshold:
+        return self.__max_us if i == last_idx else min(1 << i, self.__max_us)
+
+    return 0
+
+  def reset(self):
+    """ Discards all recorded durations. """
+    for i in range(len(self.__counts)):
+      self.__counts[i] = 0
+    self.__count = 0
+    self.__total_us = 0
+    self.__mean_count = 0
+    self.__max_us = 0
+
+class IrqTiming:
+  """
+  Opt-in timing instrumentation of an interrupt or timer handler, made of two `TimingHistogram`s:
+  the `latency` from IRQ entry (or the time the IRQ was due) to handler start, and the `duration` from handler start to handler end.
+
+  Components accept an optional `IrqTiming`, and only take `ticks_us` timestamps while one is given,
+  so the overhead of disabled instrumentation is a single `None` check.
+  """
+
+  def __init__(self, buckets = 16):
+    """
+    Args:
+      buckets: The optional number of buckets of each histogram. Defaults to `16`.
+    """
+    self.__latency = TimingHistogram(buckets)
+    self.__duration = TimingHistogram(buckets)
+
+  @property
+  def latency(self) -> TimingHistogram:
+    """ The histogram of microseconds from IRQ entry to handler start. """
+    return self.__latency
+
+  @property
+  def duration(self) -> TimingHistogram:
+    """ The histogram of microseconds from handler start to handler end. """
+    return self.__duration
+
+  def record(self, entry_us: int, start_us: int, end_us: int):
+    """
+    Records the timing of a single handler invocation. Allocation free, so it may be called within an IRQ.
+
+    Args:
+      entry_us: The `ticks_us` timestamp of IRQ entry, or of when the IRQ was due.
+      start_us: The `ticks_us` timestamp of handler start.
+      end_us: The `ticks_us` timestamp of handler end.
+    """
+    self.__latency.record(ticks_diff(start_us, entry_us))
+    self.__duration.record(ticks_diff(end_us, start_us))
+
+  def summary(self) -> dict[str, float]:
+    """
+    Summarizes the recorded timings.
+
+    Returns:
+      A dictionary with the `count` of recorded invocations, and the mean, 99th percentile, and max
+      of both the latency and the duration in microseconds.
+    """
+    return {
+      'count': self.__duration.count,
+      'latency_mean_us': self.__latency.mean_us,
+      'latency_p99_us': self.__latency.percentile_us(99),
+      'latency_max_us': self.__latency.max_us,
+      'duration_mean_us': self.__duration.mean_us,
+      'duration_p99_us': self.__duration.percentile_us(99),
+      'duration_max_us': self.__duration.max_us,
+    }
+
+  def reset(self):
+    """ Discards all recorded timings. """
+    self.__latency.reset()
+    self.__duration.reset()
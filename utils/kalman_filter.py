@@ -0,0 +1,126 @@
+from abstract.digital_filter import DigitalFilter
+
+class KalmanFilter(DigitalFilter):
+  """
+  A scalar (1-D) Kalman filter that tracks a slowly changing value observed through noisy measurements.
+
+  Each new value is blended into the estimate with a gain derived from the `process_noise` and `measurement_noise`
+  variances, which gives heavy smoothing once the estimate has settled. Any value lying more than `step_sigmas`
+  standard deviations from the estimate is treated as a step (e.g. a turned Potentiometer dial), and the estimate
+  jumps straight to it, so steps are followed without the lag of a low-pass filter.
+
+  When `adaptive` is set, the measurement noise variance is estimated online from the innovations (the differences
+  between new values and the predicted estimate) of all values that are not treated as steps.
+
+  All arithmetic is integer. The estimate is kept with 4 fractional bits, the gain with 12,
+  and variances are clamped to `VARIANCE_MAX`, so every intermediate value stays within MicroPython's
+  small int range and no heap allocation occurs per value. Values are truncated to ints (e.g. `read_u16` samples).
+
+  Args:
+    process_noise: The optional variance (in squared value units) by which the true value may drift between values. Defaults to `1`.
+    measurement_noise: The optional variance (in squared value units) of the noise on each value. Used as the initial estimate if `adaptive`. Defaults to `2500`.
+    adaptive: Whether to estimate `measurement_noise` online. Defaults to `False`.
+    step_sigmas: The optional number of standard deviations a value may lie from the estimate before it is treated as a step. Set to `0` to disable step detection. Defaults to `4`.
+  """
+
+  VARIANCE_MAX = 1 << 17
+
+  GAIN_BITS = 12
+  ESTIMATE_BITS = 4
+  ADAPTIVE_SHIFT = 5 # Measurement noise is estimated as an EMA of the innovations with a smoothing factor of `1 / 2^5`.
+
+  def __init__(self, process_noise = 1, measurement_noise = 2500, adaptive = False, step_sigmas = 4.0):
+    super().__init__()
+    self.__process_noise = min(max(int(process_noise), 0), KalmanFilter.VARIANCE_MAX)
+    self.__init_measurement_noise = min(max(int(measurement_noise), 1), KalmanFilter.VARIANCE_MAX)
+    self.__measurement_noise = self.__init_measurement_noise
+    self.__adaptive = adaptive
+    self.__step_sigmas_sq = round(step_sigmas * step_sigmas)
+    self.__estimate = 0 # With `ESTIMATE_BITS` fractional bits.
+    self.__variance = self.__measurement_noise
+    self.__steps = 0
+
+  @property
+  def process_noise(self) -> int:
+    """ The variance (in squared value units) by which the true value may drift between values. """
+    return self.__process_noise
+
+  @property
+  def measurement_noise(self) -> int:
+    """ The variance (in squared value units) of the noise on each value. Estimated online if `adaptive`. """
+    return self.__measurement_noise
+
+  @property
+  def adaptive(self) -> bool:
+    """ Whether `measurement_noise` is estimated online. """
+    return self.__adaptive
+
+  @property
+  def variance(self) -> int:
+    """ The current variance (in squared value units) of the estimate. """
+    return self.__variance
+
+  @property
+  def steps(self) -> int:
+    """ The number of values that have been treated as steps since construction or the last `reset`. """
+    return self.__steps
+
+  def filter(self, value: float) -> float:
+    """
+    Applies a Kalman filter to a given `value`.
+
+    Args:
+      value: The new value to apply the Kalman filter to.
+
+    Returns:
+      The resulting estimate from the Kalman filter.
+    """
+    value = int(value)
+    variance_max = KalmanFilter.VARIANCE_MAX
+    estimate_bits = KalmanFilter.ESTIMATE_BITS
+    estimate_half = 1 << (estimate_bits - 1)
+
+    if self._value is None:
+      self.__estimate = value << estimate_bits
+      self.__variance = self.__measurement_noise
+      self._value = value
+      return value
+
+    # Predict.
+    prior_variance = self.__variance + self.__process_noise
+    if prior_variance > variance_max:
+      prior_variance = variance_max
+
+    innovation = ((value << estimate_bits) - self.__estimate + estimate_half) >> estimate_bits
+    innovation_variance = prior_variance + self.__measurement_noise
+    innovation_sq = innovation * innovation if -32768 < innovation < 32768 else variance_max << 12 # Avoid long int squares.
+
+    if self.__step_sigmas_sq and innovation_sq > self.__step_sigmas_sq * innovation_variance:
+      # Step detected, so jump straight to the new value.
+      self.__steps += 1
+      self.__estimate = value << estimate_bits
+      self.__variance = self.__measurement_noise
+    else:
+      # Update.
+      gain_bits = KalmanFilter.GAIN_BITS
+      gain = (prior_variance << gain_bits) // innovation_variance
+      self.__estimate += (gain * innovation + (1 << (gain_bits - estimate_bits - 1))) >> (gain_bits - estimate_bits)
+      variance = (((1 << gain_bits) - gain) * prior_variance) >> gain_bits
+      self.__variance = variance if variance > 0 else 1
+
+      if self.__adaptive:
+        if innovation_sq > variance_max:
+          innovation_sq = variance_max
+        measurement_noise = self.__measurement_noise + ((innovation_sq - prior_variance - self.__measurement_noise) >> KalmanFilter.ADAPTIVE_SHIFT)
+        self.__measurement_noise = min(max(measurement_noise, 1), variance_max)
+
+    self._value = (self.__estimate + estimate_half) >> estimate_bits
+    return self._value
+
+  def reset(self):
+    """ Resets the filter by discarding its estimate, step count, and any online `measurement_noise` estimate. """
+    super().reset()
+    self.__measurement_noise = self.__init_measurement_noise
+    self.__variance = self.__measurement_noise
+    self.__estimate = 0
+    self.__steps = 0
@@ -0,0 +1,46 @@
+from abstract.digital_filter import DigitalFilter
+from utils.sorted_window import SortedWindow
+
+class MedianFilter(DigitalFilter):
+  """
+  A running median filter that calculates the current value as the median of the
+  last `window_size` values whenever a new value is received.
+
+  Unlike a moving average, single sample spikes are rejected outright instead of being smeared across the window.
+  The window is kept sorted with a `SortedWindow`, so each new value is inserted and the evicted one is
+  removed via binary search instead of re-sorting the window. Values are truncated to ints.
+
+  Args:
+    window_size: The optional size of the median window, or the number of recent values the median is taken over. Defaults to `5`.
+
+  Raises:
+    ValueError: If `window_size` is less than `1`.
+  """
+
+  def __init__(self, window_size = 5):
+    super().__init__()
+    self.__window = SortedWindow(window_size)
+
+  @property
+  def window_size(self) -> int:
+    """ The size of the median window, or the number of recent values the median is taken over. """
+    return self.__window.size
+
+  def filter(self, value: float) -> float:
+    """
+    Applies a running median filter to a given `value`.
+
+    Args:
+      value: The new value to apply the median filter to.
+
+    Returns:
+      The resulting value from the median filter.
+    """
+    self.__window.push(int(value))
+    self._value = self.__window.median()
+    return self._value
+
+  def reset(self):
+    """ Resets the filter by emptying the median window. """
+    super().reset()
+    self.__window.reset()
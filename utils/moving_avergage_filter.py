@@ -1,4 +1,4 @@
-from collections import deque
+from array import array
 from abstract.digital_filter import DigitalFilter
 
 class MovingAverageFilter(DigitalFilter):
@@ -6,13 +6,32 @@ class MovingAverageFilter(DigitalFilter):
   A moving average filter that calculates the current value as an average of the
   last `window_size` values whenever a new value is received.
 
+  Values are kept in a preallocated `array` ring buffer alongside a running integer sum,
+  so each filtered value costs the same regardless of `window_size`. Values are truncated
+  to integers (e.g. `read_u16` samples) so that the running sum never drifts.
+
   Args:
     window_size: The optional size of the moving average window, or the number of recent values used to compute the moving average. Defaults to `10`.
+
+  Raises:
+    ValueError: If `window_size` is less than `1`.
   """
 
   def __init__(self, window_size = 10):
     super().__init__()
-    self.__window = deque(maxlen=window_size)
+    if window_size < 1:
+      raise ValueError(f"window_size must be an int greater than 0; was given {window_size}.")
+
+    self.__window_size = window_size
+    self.__window = array('i', (0 for _ in range(window_size)))
+    self.__idx = 0
+    self.__count = 0
+    self.__sum = 0
+
+  @property
+  def window_size(self) -> int:
+    """ The size of the moving average window, or the number of recent values used to compute the moving average. """
+    return self.__window_size
 
   def filter(self, value: float) -> float:
     """
@@ -24,6 +43,73 @@ class MovingAverageFilter(DigitalFilter):
     Returns:
       The resulting value from the moving average filter.
     """
-    self.__window.append(value)
-    self._value = sum(self.__window) // len(self.__window)
+    value = int(value)
+    window = self.__window
+    idx = self.__idx
+
+    if self.__count < self.__window_size:
+      self.__count += 1
+    else:
+      self.__sum -= window[idx] # Evict the oldest value that is about to be overwritten.
+
+    window[idx] = value
+    self.__sum += value
+
+    idx += 1
+    self.__idx = 0 if idx == self.__window_size else idx
+
+    self._value = self.__sum // self.__count
     return self._value
+
+  def filter_many(self, samples, out = None, round_values = False):
+    """
+    Applies a moving average filter to a whole buffer of values.
+
+    Args:
+      samples: The buffer of values to apply the moving average filter to, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that filtered values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Unused since moving average values are always ints. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the filtered values.
+    """
+    if out is None:
+      out = samples
+
+    window = self.__window
+    window_size = self.__window_size
+    idx = self.__idx
+    count = self.__count
+    total = self.__sum
+
+    for i in range(len(samples)):
+      value = int(samples[i])
+
+      if count < window_size:
+        count += 1
+      else:
+        total -= window[idx]
+
+      window[idx] = value
+      total += value
+
+      idx += 1
+      if idx == window_size:
+        idx = 0
+
+      out[i] = total // count
+
+    self.__idx = idx
+    self.__count = count
+    self.__sum = total
+    if count:
+      self._value = total // count
+
+    return out
+
+  def reset(self):
+    """ Resets the filter by emptying the moving average window. """
+    super().reset()
+    self.__idx = 0
+    self.__count = 0
+    self.__sum = 0
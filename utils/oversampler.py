@@ -0,0 +1,124 @@
+from machine import ADC
+from utime import ticks_diff, ticks_us
+
+class Oversampler:
+  """
+  An oversampling front end for `ADC` inputs that bursts `burst_size` reads per sample and decimates them into one value.
+
+  In `'average'` mode the burst is averaged, which reduces noise by a factor of `sqrt(burst_size)`.
+  In `'bit_growth'` mode `burst_size` must be a power of `4`; the native `adc_bits` reads of the burst are summed
+  and shifted right by `log4(burst_size)`, which adds one bit of effective resolution per factor of `4`.
+  Both modes produce values in range `[0, 65535]`, just like `ADC.read_u16`.
+
+  Also measures its throughput, both as raw ADC reads per second while bursting and as decimated samples per second.
+  """
+
+  AVERAGE = 'average'
+  BIT_GROWTH = 'bit_growth'
+
+  def __init__(self, burst_size = 4, mode = AVERAGE, adc_bits = 12):
+    """
+    Args:
+      burst_size: The optional number of ADC reads per decimated sample. Defaults to `4`.
+      mode: The optional decimation mode. Either `'average'` or `'bit_growth'`. Defaults to `'average'`.
+      adc_bits: The optional native resolution of the ADC, which is `12` on the RP2040. Only used in `'bit_growth'` mode. Defaults to `12`.
+
+    Raises:
+      ValueError: If given an invalid `mode` value.
+      ValueError: If `burst_size` is less than `1`, or is not a power of `4` in `'bit_growth'` mode.
+    """
+    if mode not in (Oversampler.AVERAGE, Oversampler.BIT_GROWTH):
+      raise ValueError(f"Invalid mode value. Must be either '{Oversampler.AVERAGE}' or '{Oversampler.BIT_GROWTH}'; was given '{mode}'.")
+
+    self.__mode = mode
+    self.__adc_bits = adc_bits
+    self.__burst_size = 1
+    self.__extra_bits = 0
+    self.burst_size = burst_size
+    self.reset_stats()
+
+  @property
+  def mode(self) -> str:
+    """ The decimation mode. Either `'average'` or `'bit_growth'`. """
+    return self.__mode
+
+  @property
+  def burst_size(self) -> int:
+    """ The number of ADC reads per decimated sample. Must be a power of `4` in `'bit_growth'` mode. """
+    return self.__burst_size
+
+  @burst_size.setter
+  def burst_size(self, value: int):
+    if value < 1:
+      raise ValueError(f"burst_size must be an int greater than 0; was given {value}.")
+
+    extra_bits = 0
+    if self.__mode == Oversampler.BIT_GROWTH:
+      while (1 << (extra_bits * 2)) < value:
+        extra_bits += 1
+      if (1 << (extra_bits * 2)) != value:
+        raise ValueError(f"burst_size must be a power of 4 in '{Oversampler.BIT_GROWTH}' mode; was given {value}.")
+
+    self.__burst_size = value
+    self.__extra_bits = extra_bits
+
+  @property
+  def effective_bits(self) -> int:
+    """ The effective resolution in bits of decimated samples, not accounting for noise. """
+    return self.__adc_bits + self.__extra_bits
+
+  @property
+  def raw_samples_per_sec(self) -> float:
+    """ The measured number of raw ADC reads per second while bursting, since construction or the last `reset_stats`. """
+    return self.__raw_samples * 1000000 / self.__busy_us if self.__busy_us else 0.0
+
+  @property
+  def samples_per_sec(self) -> float:
+    """ The measured number of decimated samples per second, since construction or the last `reset_stats`. """
+    elapsed_us = ticks_diff(self.__last_tick, self.__first_tick)
+    return (self.__samples - 1) * 1000000 / elapsed_us if elapsed_us > 0 else 0.0
+
+  def read(self, adc: ADC) -> int:
+    """
+    Bursts `burst_size` reads of a given `adc` and decimates them into a single value.
+
+    Args:
+      adc: The `ADC` to read.
+
+    Returns:
+      The decimated value in range `[0, 65535]`.
+    """
+    burst_size = self.__burst_size
+    start_tick = ticks_us()
+    total = 0
+
+    if self.__mode == Oversampler.AVERAGE:
+      for _ in range(burst_size):
+        total += adc.read_u16()
+      value = (total + (burst_size >> 1)) // burst_size
+    else:
+      native_shift = 16 - self.__adc_bits
+      for _ in range(burst_size):
+        total += adc.read_u16() >> native_shift
+      value = total >> self.__extra_bits # `effective_bits` wide.
+
+      align_shift = 16 - self.effective_bits
+      value = value << align_shift if align_shift >= 0 else value >> -align_shift
+
+    end_tick = ticks_us()
+    self.__busy_us += ticks_diff(end_tick, start_tick)
+    self.__raw_samples += burst_size
+    if not self.__samples:
+      self.__first_tick = start_tick
+    self.__last_tick = start_tick
+    self.__samples += 1
+
+    return value
+
+  def reset_stats(self):
+    """ Resets all throughput measurements. """
+    self.__raw_samples = 0
+    self.__samples = 0
+    self.__busy_us = 0
+    self.__first_tick = 0
+    self.__last_tick = 0
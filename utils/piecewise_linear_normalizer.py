@@ -0,0 +1,159 @@
+from array import array
+from abstract.digital_normalizer import DigitalNormalizer
+
+class PiecewiseLinearNormalizer(DigitalNormalizer):
+  """
+  A `DigitalNormalizer` that maps sample values onto a measured calibration curve, given as a table of
+  `(raw, calibrated)` breakpoints, by linearly interpolating between the two breakpoints surrounding each value.
+  This can model nonlinear sensors such as thermistors or cheap potentiometers.
+
+  Breakpoints are kept in sorted `array`s alongside the precomputed slope of each segment, and the segment
+  containing a value is found with a binary search. For u16 values, an optional dense lookup table of
+  `2^lut_bits + 1` evenly spaced points can be precomputed instead, which makes each value cost a single
+  table index and interpolation, no matter how many breakpoints there are. Table points sit at multiples of the
+  table step, except for the last one, which sits at `65535`, so the final table cell is one shorter than the others.
+
+  Values outside of the breakpoints' raw range are clamped to the first or last calibrated value, unless `extrapolate` is set.
+  """
+
+  def __init__(self, breakpoints: list[tuple[float, float]], lut_bits: int | None = None, extrapolate = False):
+    """
+    Args:
+      breakpoints: The `(raw, calibrated)` breakpoints of the calibration curve, in any order.
+      lut_bits: The optional resolution in bits of the dense lookup table for values in range `[0, 65535]`. Must be in range `[1, 16]`. Defaults to `None` for no lookup table.
+      extrapolate: Whether to extend the first and last segments beyond the breakpoints' raw range instead of clamping. Defaults to `False`.
+
+    Raises:
+      ValueError: If given fewer than 2 `breakpoints`, or 2 breakpoints with the same raw value.
+      ValueError: If `lut_bits` is outside of range `[1, 16]`.
+    """
+    super().__init__()
+    breakpoints = sorted(breakpoints)
+    if len(breakpoints) < 2:
+      raise ValueError(f"breakpoints must contain at least 2 (raw, calibrated) pairs; was given {len(breakpoints)}.")
+    for i in range(1, len(breakpoints)):
+      if breakpoints[i][0] == breakpoints[i - 1][0]:
+        raise ValueError(f"breakpoints must have distinct raw values; was given {breakpoints[i][0]} more than once.")
+    if lut_bits is not None and (lut_bits < 1 or lut_bits > 16):
+      raise ValueError(f"lut_bits must be an int in range [1, 16]; was given {lut_bits}.")
+
+    self.__raw = array('f', (raw for (raw, _) in breakpoints))
+    self.__calibrated = array('f', (calibrated for (_, calibrated) in breakpoints))
+    self.__slopes = array('f', (
+      (breakpoints[i + 1][1] - breakpoints[i][1]) / (breakpoints[i + 1][0] - breakpoints[i][0])
+      for i in range(len(breakpoints) - 1)
+    ))
+    self.__extrapolate = extrapolate
+
+    self.__lut_bits = lut_bits
+    self.__lut: array | None = None
+    if lut_bits is not None:
+      lut_shift = 16 - lut_bits
+      self.__lut = array('f', (self.__interpolate(min(i << lut_shift, 65535)) for i in range((1 << lut_bits) + 1)))
+      self.__lut_final_idx = (1 << lut_bits) - 1 # The index of the final table cell, which ends at `65535` rather than `65536`.
+
+  @property
+  def breakpoints(self) -> list[tuple[float, float]]:
+    """ The sorted `(raw, calibrated)` breakpoints of the calibration curve. """
+    return list(zip(self.__raw, self.__calibrated))
+
+  @property
+  def lut_bits(self) -> int | None:
+    """ The resolution in bits of the dense lookup table for values in range `[0, 65535]`, or `None` if there is no lookup table. """
+    return self.__lut_bits
+
+  def normalize(self, value: float) -> float:
+    """
+    Normalizes a given `value` by linearly interpolating between the two calibration curve breakpoints surrounding it.
+    Uses the dense lookup table if there is one and `value` is an int within range `[0, 65535]`.
+
+    Args:
+      value: The value to normalize.
+
+    Returns:
+      The normalized value.
+    """
+    lut = self.__lut
+    if lut is not None and isinstance(value, int) and 0 <= value <= 65535:
+      lut_shift = 16 - self.__lut_bits
+      idx = value >> lut_shift
+      remainder = value - (idx << lut_shift)
+      if not remainder:
+        return lut[idx]
+      width = (1 << lut_shift) - 1 if idx == self.__lut_final_idx else 1 << lut_shift
+      return lut[idx] + (lut[idx + 1] - lut[idx]) * remainder / width
+
+    return self.__interpolate(value)
+
+  def normalize_many(self, samples, out = None, round_values = False):
+    """
+    Normalizes a whole buffer of values by linearly interpolating between the two calibration curve breakpoints surrounding each of them.
+    Uses the dense lookup table if there is one for each value that is an int within range `[0, 65535]`.
+
+    Args:
+      samples: The buffer of values to normalize, such as an `array('H')` of raw ADC samples.
+      out: The optional buffer that normalized values are written into in place. Must be at least as long as `samples`. Defaults to `samples`.
+      round_values: Whether to round normalized values to the nearest int before writing them into `out`. Required when `out` is an integer buffer. Defaults to `False`.
+
+    Returns:
+      The `out` buffer containing the normalized values.
+    """
+    if out is None:
+      out = samples
+
+    interpolate = self.__interpolate
+    lut = self.__lut
+    if lut is None:
+      for i in range(len(samples)):
+        value = interpolate(samples[i])
+        out[i] = round(value) if round_values else value
+      return out
+
+    lut_shift = 16 - self.__lut_bits
+    width = 1 << lut_shift
+    final_idx = self.__lut_final_idx
+    for i in range(len(samples)):
+      value = samples[i]
+      if isinstance(value, int) and 0 <= value <= 65535:
+        idx = value >> lut_shift
+        remainder = value - (idx << lut_shift)
+        if not remainder:
+          value = lut[idx]
+        else:
+          value = lut[idx] + (lut[idx + 1] - lut[idx]) * remainder / (width - 1 if idx == final_idx else width)
+      else:
+        value = interpolate(value)
+      out[i] = round(value) if round_values else value
+
+    return out
+
+  def __interpolate(self, value: float) -> float:
+    """
+    Linearly interpolates a given `value` within the calibration curve segment found via binary search.
+
+    Args:
+      value: The value to interpolate.
+
+    Returns:
+      The interpolated value.
+    """
+    raw = self.__raw
+    last = len(raw) - 1
+
+    if not self.__extrapolate:
+      if value <= raw[0]:
+        return self.__calibrated[0]
+      if value >= raw[last]:
+        return self.__calibrated[last]
+
+    # Find the segment `[raw[lo], raw[lo + 1]]` containing `value`, limited to the first and last segments.
+    lo = 0
+    hi = last - 1
+    while lo < hi:
+      mid = (lo + hi + 1) >> 1
+      if raw[mid] <= value:
+        lo = mid
+      else:
+        hi = mid - 1
+
+    return self.__calibrated[lo] + self.__slopes[lo] * (value - raw[lo])
@@ -0,0 +1,138 @@
+from machine import Pin
+from utils.sampling_scheduler import SamplingScheduler
+
+class PinDebouncer:
+  """
+  A central debounce engine that samples the levels of all registered Pins from a single `SamplingScheduler` callback,
+  and only accepts a level transition once it has been confirmed by sampling.
+
+  Each Pin has an integrator that counts up on every high sample (up to `stable_samples`) and down on every low sample (down to `0`).
+  A transition to high is accepted when the integrator reaches `stable_samples`, and a transition to low when it reaches `0`,
+  so contact bounce only delays acceptance, and the worst case latency of a clean edge is `stable_samples * sample_period_ms`
+  rather than a fixed time window.
+  """
+
+  __default: 'PinDebouncer | None' = None
+
+  def __init__(self, sample_period_ms = 10, stable_samples = 3, scheduler: SamplingScheduler | None = None, sample_phase_ms = 0):
+    """
+    Args:
+      sample_period_ms: The optional period in milliseconds at which all registered Pins are sampled. Rounded to a multiple of the scheduler's `tick_ms`. Defaults to `10`.
+      stable_samples: The optional default integrator limit, i.e. the net number of samples at a new level (beyond those at the old level) that confirm a transition. Defaults to `3`.
+      scheduler: The optional `SamplingScheduler` that periodically samples the registered Pins. Defaults to `SamplingScheduler.default()`.
+      sample_phase_ms: The optional offset in milliseconds of the sampling ticks within the sample period. Defaults to `0`.
+
+    Raises:
+      ValueError: If `sample_period_ms` or `stable_samples` is less than `1`.
+    """
+    if sample_period_ms < 1:
+      raise ValueError(f"sample_period_ms must be an int greater than 0; was given {sample_period_ms}.")
+    if stable_samples < 1:
+      raise ValueError(f"stable_samples must be an int greater than 0; was given {stable_samples}.")
+
+    self.__sample_period_ms = sample_period_ms
+    self.__sample_phase_ms = sample_phase_ms
+    self.__stable_samples = stable_samples
+    self.__scheduler = scheduler if scheduler else SamplingScheduler.default()
+    self.__sample_callback = self.__sample
+    self.__entries: list[list] = [] # [pin, callback, stable samples, integrator, debounced level]
+
+  @staticmethod
+  def default() -> 'PinDebouncer':
+    """
+    Gets the shared default `PinDebouncer` that components (e.g. `Button`) register with unless given another one.
+
+    Returns:
+      The default `PinDebouncer` instance, created on first use on the default `SamplingScheduler`.
+    """
+    if not PinDebouncer.__default:
+      PinDebouncer.__default = PinDebouncer()
+    return PinDebouncer.__default
+
+  @property
+  def sample_period_ms(self) -> int:
+    """ The period in milliseconds at which all registered Pins are sampled. """
+    return self.__sample_period_ms
+
+  @property
+  def stable_samples(self) -> int:
+    """ The default integrator limit, i.e. the net number of samples at a new level that confirm a transition. """
+    return self.__stable_samples
+
+  @property
+  def scheduler(self) -> SamplingScheduler:
+    """ The `SamplingScheduler` that periodically samples the registered Pins. """
+    return self.__scheduler
+
+  def register(self, pin: Pin, callback, stable_samples: int | None = None):
+    """
+    Registers a Pin to be debounced, starting from its current level.
+    Re-registering an already registered Pin replaces its callback and `stable_samples`.
+
+    Args:
+      pin: The Pin to debounce.
+      callback: The callback invoked from the scheduler each time a transition is accepted. Takes the new int level (`0` or `1`) as its single argument.
+      stable_samples: An optional override of the default `stable_samples` integrator limit for this Pin.
+
+    Returns:
+      The registered `callback`.
+    """
+    stable_samples = stable_samples if stable_samples else self.__stable_samples
+    level = pin.value()
+
+    was_empty = not self.__entries
+    entries = [entry for entry in self.__entries if entry[0] != pin]
+    entries.append([pin, callback, stable_samples, stable_samples if level else 0, level])
+    self.__entries = entries
+
+    if was_empty:
+      self.__scheduler.register(self.__sample_callback, self.__sample_period_ms, self.__sample_phase_ms)
+
+    return callback
+
+  def unregister(self, pin: Pin):
+    """
+    Unregisters a Pin so that it is no longer debounced. Stops sampling if no Pins remain.
+
+    Args:
+      pin: The Pin to unregister.
+    """
+    was_empty = not self.__entries
+    self.__entries = [entry for entry in self.__entries if entry[0] != pin]
+
+    if not self.__entries and not was_empty:
+      self.__scheduler.unregister(self.__sample_callback)
+
+  def level(self, pin: Pin) -> int | None:
+    """
+    Gets the debounced level of a registered Pin.
+
+    Args:
+      pin: The registered Pin.
+
+    Returns:
+      The last accepted int level (`0` or `1`) of the Pin, or `None` if the Pin is not registered.
+    """
+    for entry in self.__entries:
+      if entry[0] == pin:
+        return entry[4]
+    return None
+
+  def __sample(self):
+    """ Samples every registered Pin once, and invokes the callbacks of those whose transitions are confirmed. """
+    for entry in self.__entries:
+      integrator = entry[3]
+
+      if entry[0].value():
+        if integrator < entry[2]:
+          integrator += 1
+          entry[3] = integrator
+          if integrator == entry[2] and not entry[4]:
+            entry[4] = 1
+            entry[1](1)
+      elif integrator > 0:
+        integrator -= 1
+        entry[3] = integrator
+        if not integrator and entry[4]:
+          entry[4] = 0
+          entry[1](0)
@@ -0,0 +1,218 @@
+from machine import Timer
+from utime import ticks_add, ticks_diff, ticks_us
+from utils.irq_timing import IrqTiming
+
+class SamplingScheduler:
+  """
+  A central scheduler that samples all registered sensor components from a single timer,
+  instead of each component running its own `Timer` with callbacks firing at unrelated phases.
+
+  The timer ticks every `tick_ms` milliseconds. Each sampling callback is registered with a period and an
+  optional phase offset, both rounded to whole ticks. Phases are measured from a running tick count shared by all callbacks,
+  so a callback with period `P` and phase `Q` samples on every tick `t` where `t % P == Q`, no matter when it registered.
+  Callbacks that share a period and phase are grouped, so they sample together on the same tick, while distinct phases spread work across ticks.
+
+  Also measures how much of its tick budget is used by the sampling callbacks.
+  """
+
+  LOAD_WINDOW_TICKS = 100
+
+  __default: 'SamplingScheduler | None' = None
+
+  def __init__(self, tick_ms = 10, timer_id = -1, timing: IrqTiming | None = None):
+    """
+    Args:
+      tick_ms: The optional period in milliseconds of the driving timer; all sampling periods and phases are rounded to a multiple of it. Defaults to `10`.
+      timer_id: The optional ID of the driving `Timer`. Defaults to `-1` for a virtual timer.
+      timing: The optional `IrqTiming` that records the jitter and duration of each tick. Defaults to `None` for no instrumentation.
+
+    Raises:
+      ValueError: If `tick_ms` is less than `1`.
+    """
+    if tick_ms < 1:
+      raise ValueError(f"tick_ms must be an int greater than 0; was given {tick_ms}.")
+
+    self.__tick_ms = tick_ms
+    self.__timer_id = timer_id
+    self.__timer: Timer | None = None
+    self.__groups: list[list] = [] # [ticks until next sample, period in ticks, phase in ticks, callbacks]
+    self.__tick_count = 0
+    self.__tick_start_us: int | None = None
+    self.__last_tick_start_us: int | None = None
+    self.timing = timing
+    self.reset_stats()
+
+  @staticmethod
+  def default() -> 'SamplingScheduler':
+    """
+    Gets the shared default `SamplingScheduler` that sensor components register with unless given another one.
+
+    Returns:
+      The default `SamplingScheduler` instance, created on first use.
+    """
+    if not SamplingScheduler.__default:
+      SamplingScheduler.__default = SamplingScheduler()
+    return SamplingScheduler.__default
+
+  @property
+  def tick_ms(self) -> int:
+    """ The period in milliseconds of the driving timer. """
+    return self.__tick_ms
+
+  @property
+  def running(self) -> bool:
+    """ Whether the driving timer is running, which is the case whenever at least one callback is registered. """
+    return self.__timer is not None
+
+  @property
+  def timing(self) -> IrqTiming | None:
+    """
+    The `IrqTiming` that records the latency of each tick relative to when it was due (one `tick_ms` after the previous tick),
+    which measures timer jitter, and the duration of each tick's sampling callbacks. `None` for no instrumentation.
+    """
+    return self.__timing
+
+  @timing.setter
+  def timing(self, value: IrqTiming | None):
+    self.__timing = value
+
+  @property
+  def tick_start_us(self) -> int | None:
+    """ The `ticks_us` timestamp of the entry of the tick in progress, or `None` outside of a tick. """
+    return self.__tick_start_us
+
+  @property
+  def load(self) -> float:
+    """ The fraction of the tick budget spent in sampling callbacks, measured over the last `LOAD_WINDOW_TICKS` ticks. """
+    return self.__load_busy_us / (SamplingScheduler.LOAD_WINDOW_TICKS * self.__tick_ms * 1000)
+
+  @property
+  def max_tick_us(self) -> int:
+    """ The longest time in microseconds spent in sampling callbacks during a single tick, since the last `reset_stats`. """
+    return self.__max_tick_us
+
+  @property
+  def overruns(self) -> int:
+    """ The number of ticks whose sampling callbacks took longer than `tick_ms`, since the last `reset_stats`. """
+    return self.__overruns
+
+  def register(self, callback, period_ms: int, phase_ms = 0, delay_ms: int | None = None):
+    """
+    Registers a sampling callback that is invoked every `period_ms` milliseconds.
+    Re-registering an already registered callback changes its period and phase.
+
+    May be called from within a sampling callback, e.g. to adapt its own sampling period.
+
+    Args:
+      callback: The sampling callback to register. Takes no arguments.
+      period_ms: The sampling period in milliseconds. Rounded to a multiple of `tick_ms`, and at least one tick.
+      phase_ms: The optional offset in milliseconds of the sampling ticks within the period. Rounded to a multiple of `tick_ms`. Defaults to `0`.
+      delay_ms: The optional delay in milliseconds from now until the first invocation, after which the callback is invoked every period. Rounded to a multiple of `tick_ms`, and at least one tick. Overrides `phase_ms`. Defaults to `None` for the first tick matching `phase_ms`.
+
+    Returns:
+      The registered `callback`, which can be passed to `unregister`.
+    """
+    period = max(round(period_ms / self.__tick_ms), 1)
+    if delay_ms is None:
+      phase = round(phase_ms / self.__tick_ms) % period
+      countdown = (phase - self.__tick_count - 1) % period + 1 # Ticks until the next tick `t` where `t % period == phase`.
+    else:
+      countdown = max(round(delay_ms / self.__tick_ms), 1)
+      phase = (self.__tick_count + countdown) % period
+
+    # Groups are replaced rather than modified in place (copy-on-write), so that a tick in progress is unaffected.
+    groups = self.__without(callback)
+    for (i, group) in enumerate(groups):
+      if group[0] == countdown and group[1] == period and group[2] == phase:
+        groups[i] = [countdown, period, phase, group[3] + [callback]]
+        break
+    else:
+      groups.append([countdown, period, phase, [callback]])
+    self.__groups = groups
+
+    if not self.__timer:
+      self.__timer = Timer(self.__timer_id)
+      self.__timer.init(period = self.__tick_ms, callback = self.__on_tick)
+
+    return callback
+
+  def unregister(self, callback):
+    """
+    Unregisters a sampling callback so that it is no longer invoked. Stops the driving timer if no callbacks remain.
+
+    May be called from within a sampling callback.
+
+    Args:
+      callback: The sampling callback to unregister.
+    """
+    self.__groups = self.__without(callback)
+
+    if not self.__groups and self.__timer:
+      self.__timer.deinit()
+      self.__timer = None
+
+  def reset_stats(self):
+    """ Resets all tick budget measurements. """
+    self.__load_busy_us = 0 # Integer, so that no float is allocated within the tick.
+    self.__max_tick_us = 0
+    self.__overruns = 0
+    self.__window_ticks = 0
+    self.__window_busy_us = 0
+
+  def __on_tick(self, _: Timer):
+    """ Invokes the sampling callbacks of all groups due on this tick, and measures the time spent doing so. """
+    start_tick = ticks_us()
+    self.__tick_start_us = start_tick
+    self.__tick_count += 1
+
+    for group in self.__groups:
+      group[0] -= 1
+      if not group[0]:
+        group[0] = group[1]
+        for callback in group[3]:
+          callback()
+
+    end_tick = ticks_us()
+    self.__tick_start_us = None
+    busy_us = ticks_diff(end_tick, start_tick)
+
+    timing = self.__timing
+    if timing is not None:
+      last_start = self.__last_tick_start_us
+      due_tick = start_tick if last_start is None else ticks_add(last_start, self.__tick_ms * 1000)
+      timing.record(due_tick, start_tick, end_tick)
+    self.__last_tick_start_us = start_tick
+
+    if busy_us > self.__max_tick_us:
+      self.__max_tick_us = busy_us
+    if busy_us > self.__tick_ms * 1000:
+      self.__overruns += 1
+
+    self.__window_busy_us += busy_us
+    self.__window_ticks += 1
+    if self.__window_ticks == SamplingScheduler.LOAD_WINDOW_TICKS:
+      self.__load_busy_us = self.__window_busy_us
+      self.__window_ticks = 0
+      self.__window_busy_us = 0
+
+  def __without(self, callback) -> list[list]:
+    """
+    Copies the callback groups without a given `callback`, dropping any group that would be left empty.
+
+    Args:
+      callback: The sampling callback to leave out.
+
+    Returns:
+      The copied callback groups.
+    """
+    groups = []
+
+    for group in self.__groups:
+      if callback in group[3]:
+        callbacks = [other for other in group[3] if other != callback]
+        if callbacks:
+          groups.append([group[0], group[1], group[2], callbacks])
+      else:
+        groups.append(group)
+
+    return groups
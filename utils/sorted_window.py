@@ -0,0 +1,124 @@
+from array import array
+
+class SortedWindow:
+  """
+  A sliding window over the last `size` int values that keeps both their arrival order
+  and a sorted index of them, so order statistics (e.g. the median) can be read in O(1).
+
+  Arrival order is kept in a preallocated `array` ring buffer. The sorted index is a fixed length list
+  that is searched with a binary search, and is updated by removing the evicted value and inserting
+  the new value in place with `list.pop` and `list.insert`, rather than re-sorting it.
+
+  Each `push` is therefore O(`size`): the binary searches are O(log `size`), but `pop` and `insert` each
+  shift up to `size` list slots. Those shifts are single C `memmove`s of pointers, whose cost per slot is negligible next to
+  the interpreted bookkeeping that an O(sqrt(`size`)) bucketed structure would add to every push.
+  The windows actually used are small (`MedianFilter` defaults to 5 values and `HampelFilter` to 7), so a push shifts
+  only a handful of slots. `HampelFilter` also binary searches `sorted_values` directly to find the MAD, which relies on
+  the O(1) indexing that a bucketed structure would give up. `benchmark_examples/sorted_window.py` measures the cost
+  of a push by window size, which shows on a given board from which size the shifts start to dominate.
+  """
+
+  def __init__(self, size: int):
+    """
+    Args:
+      size: The number of most recent values kept within the window.
+
+    Raises:
+      ValueError: If `size` is less than `1`.
+    """
+    if size < 1:
+      raise ValueError(f"size must be an int greater than 0; was given {size}.")
+
+    self.__size = size
+    self.__ring = array('i', (0 for _ in range(size)))
+    self.__sorted = [0] * size # Always `size` long; only the first `count` values are live.
+    self.__idx = 0
+    self.__count = 0
+
+  @property
+  def size(self) -> int:
+    """ The number of most recent values kept within the window. """
+    return self.__size
+
+  @property
+  def count(self) -> int:
+    """ The number of values currently held within the window. Equals `size` once the window is full. """
+    return self.__count
+
+  @property
+  def sorted_values(self) -> list[int]:
+    """
+    The sorted index of the values within the window. Only the first `count` values are live.
+
+    Must not be modified.
+    """
+    return self.__sorted
+
+  def push(self, value: int):
+    """
+    Pushes a new value into the window, evicting the oldest value if the window is full.
+
+    Args:
+      value: The new int value.
+    """
+    sorted_values = self.__sorted
+    count = self.__count
+
+    if count == self.__size:
+      count -= 1
+      sorted_values.pop(self.__search(self.__ring[self.__idx], count + 1))
+    else:
+      sorted_values.pop() # Discard an unused slot so that the list length never changes.
+
+    self.__ring[self.__idx] = value
+    sorted_values.insert(self.__search(value, count), value)
+
+    self.__count = count + 1
+    self.__idx += 1
+    if self.__idx == self.__size:
+      self.__idx = 0
+
+  def median(self) -> int | None:
+    """
+    Gets the median of the values within the window. For an even `count`, this is the floored average of the two middle values.
+
+    Returns:
+      The median value, or `None` if the window is empty.
+    """
+    count = self.__count
+    if not count:
+      return None
+
+    half = count >> 1
+    if count & 1:
+      return self.__sorted[half]
+    return (self.__sorted[half - 1] + self.__sorted[half]) >> 1
+
+  def reset(self):
+    """ Empties the window. """
+    self.__idx = 0
+    self.__count = 0
+
+  def __search(self, value: int, count: int) -> int:
+    """
+    Binary searches the first `count` sorted values for the first index holding a value not less than `value`.
+
+    Args:
+      value: The value to search for.
+      count: The number of live sorted values to search.
+
+    Returns:
+      The index of `value` if present, or the index at which it should be inserted otherwise.
+    """
+    sorted_values = self.__sorted
+    lo = 0
+    hi = count
+
+    while lo < hi:
+      mid = (lo + hi) >> 1
+      if sorted_values[mid] < value:
+        lo = mid + 1
+      else:
+        hi = mid
+
+    return lo
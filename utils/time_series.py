@@ -0,0 +1,277 @@
+from array import array
+from utime import ticks_add, ticks_diff, ticks_ms
+
+class _Rollup:
+  """
+  A ring of fixed duration buckets, each holding the min, max, sum, and count of the samples recorded within it.
+
+  Sums are accumulated with compensated (Kahan) summation, since a long bucket of large samples (e.g. an hour of u16 ADC samples at 10 Hz
+  reaches about `2.4e9`) exceeds the 24-bit mantissa of the `'f'` arrays, and plain additions would drop the low bits of every sample.
+  An `array('d')` would not help on ports whose floats are single precision, where the arithmetic itself is single precision.
+  """
+
+  def __init__(self, resolution_ms: int, capacity: int):
+    """
+    Args:
+      resolution_ms: The duration in milliseconds of each bucket.
+      capacity: The number of most recent buckets kept within the ring.
+    """
+    self.resolution_ms = resolution_ms
+    self.capacity = capacity
+    self.starts = array('i', (0 for _ in range(capacity)))
+    self.mins = array('f', (0.0 for _ in range(capacity)))
+    self.maxs = array('f', (0.0 for _ in range(capacity)))
+    self.sums = array('f', (0.0 for _ in range(capacity)))
+    self.compensations = array('f', (0.0 for _ in range(capacity))) # The low-order parts lost from `sums`, negated.
+    self.counts = array('i', (0 for _ in range(capacity)))
+    self.idx = capacity - 1 # Index of the newest (open) bucket.
+    self.count = 0
+
+  def record(self, value: float, tick: int):
+    """
+    Adds a sample to the open bucket, first opening a new bucket if the sample falls after the open bucket's end.
+
+    Args:
+      value: The sample value.
+      tick: The `ticks_ms` timestamp of the sample.
+    """
+    idx = self.idx
+
+    if self.count:
+      elapsed_ms = ticks_diff(tick, self.starts[idx])
+      if elapsed_ms < self.resolution_ms:
+        if value < self.mins[idx]:
+          self.mins[idx] = value
+        if value > self.maxs[idx]:
+          self.maxs[idx] = value
+        compensated_value = value - self.compensations[idx]
+        previous_sum = self.sums[idx]
+        self.sums[idx] = previous_sum + compensated_value
+        self.compensations[idx] = (self.sums[idx] - previous_sum) - compensated_value
+        self.counts[idx] += 1
+        return
+      start = ticks_add(self.starts[idx], elapsed_ms - elapsed_ms % self.resolution_ms)
+    else:
+      start = tick
+
+    idx = self.idx = (idx + 1) % self.capacity
+    if self.count < self.capacity:
+      self.count += 1
+    self.starts[idx] = start
+    self.mins[idx] = value
+    self.maxs[idx] = value
+    self.sums[idx] = value
+    self.compensations[idx] = 0.0
+    self.counts[idx] = 1
+
+  def total(self, idx: int) -> float:
+    """
+    Gets the compensated sum of the samples within a bucket.
+
+    Args:
+      idx: The index of the bucket.
+
+    Returns:
+      The sum of the samples.
+    """
+    return self.sums[idx] - self.compensations[idx]
+
+class TimeSeries:
+  """
+  A fixed memory store of timestamped sensor samples, for keeping history (e.g. for graphing) without growing the heap.
+
+  Raw samples are kept in a preallocated `array` ring of `raw_capacity` samples.
+  Every sample is also rolled up into a ring of `rollup_capacity` buckets per resolution (by default 1 s, 1 min, and 1 h),
+  each bucket holding the min, max, and mean of the samples within it, so range queries over long spans read a few buckets
+  instead of rescanning raw samples. All memory is allocated at construction; see `nbytes`.
+
+  Timestamps are `ticks_ms` values, so spans must stay well below the `ticks_ms` wrap period.
+  """
+
+  def __init__(
+    self,
+    raw_capacity = 240,
+    rollup_capacity = 60,
+    resolutions_ms: tuple[int, ...] = (1000, 60000, 3600000),
+  ):
+    """
+    Args:
+      raw_capacity: The optional number of most recent raw samples kept. Defaults to `240`.
+      rollup_capacity: The optional number of most recent buckets kept for each rollup resolution. Defaults to `60`.
+      resolutions_ms: The optional ascending bucket durations in milliseconds of the rollups. Defaults to 1 s, 1 min, and 1 h.
+
+    Raises:
+      ValueError: If `raw_capacity` or `rollup_capacity` is less than `1`.
+      ValueError: If `resolutions_ms` is not strictly ascending, or holds a value less than `1`.
+    """
+    if raw_capacity < 1:
+      raise ValueError(f"raw_capacity must be an int greater than 0; was given {raw_capacity}.")
+    if rollup_capacity < 1:
+      raise ValueError(f"rollup_capacity must be an int greater than 0; was given {rollup_capacity}.")
+    if any(resolution_ms < 1 for resolution_ms in resolutions_ms) \
+        or any(resolutions_ms[i] >= resolutions_ms[i + 1] for i in range(len(resolutions_ms) - 1)):
+      raise ValueError(f"resolutions_ms must be strictly ascending ints greater than 0; was given {resolutions_ms}.")
+
+    self.__raw_capacity = raw_capacity
+    self.__raw_ticks = array('i', (0 for _ in range(raw_capacity)))
+    self.__raw_values = array('f', (0.0 for _ in range(raw_capacity)))
+    self.__raw_idx = raw_capacity - 1 # Index of the newest raw sample.
+    self.__raw_count = 0
+    self.__rollups = [_Rollup(resolution_ms, rollup_capacity) for resolution_ms in resolutions_ms]
+
+  @property
+  def nbytes(self) -> int:
+    """ The number of bytes preallocated for raw samples and rollup buckets, which stays fixed for the lifetime of the store. """
+    return self.__raw_capacity * 8 + sum(rollup.capacity * 24 for rollup in self.__rollups)
+
+  @property
+  def resolutions_ms(self) -> tuple[int, ...]:
+    """ The bucket durations in milliseconds of the rollups. """
+    return tuple(rollup.resolution_ms for rollup in self.__rollups)
+
+  def __len__(self) -> int:
+    """ The number of raw samples currently held. """
+    return self.__raw_count
+
+  def record(self, value: float, tick: int | None = None):
+    """
+    Records a sample, overwriting the oldest raw sample and rollup bucket once their rings are full.
+
+    Args:
+      value: The sample value.
+      tick: The optional `ticks_ms` timestamp of the sample. Defaults to now. Must not precede the last recorded sample.
+    """
+    if tick is None:
+      tick = ticks_ms()
+
+    idx = self.__raw_idx = (self.__raw_idx + 1) % self.__raw_capacity
+    self.__raw_ticks[idx] = tick
+    self.__raw_values[idx] = value
+    if self.__raw_count < self.__raw_capacity:
+      self.__raw_count += 1
+
+    for rollup in self.__rollups:
+      rollup.record(value, tick)
+
+  def clear(self):
+    """ Discards all recorded samples and rollup buckets. """
+    self.__raw_count = 0
+    for rollup in self.__rollups:
+      rollup.count = 0
+
+  def samples(self, span_ms: int | None = None):
+    """
+    Iterates over the raw samples, oldest first.
+
+    Args:
+      span_ms: The optional span in milliseconds before now to limit the samples to. Defaults to `None` for all raw samples.
+
+    Yields:
+      A `(tick, value)` tuple for each raw sample.
+    """
+    ticks = self.__raw_ticks
+    values = self.__raw_values
+    capacity = self.__raw_capacity
+    idx = (self.__raw_idx - self.__raw_count + 1) % capacity
+    now = ticks_ms()
+
+    for _ in range(self.__raw_count):
+      if span_ms is None or ticks_diff(now, ticks[idx]) < span_ms:
+        yield (ticks[idx], values[idx])
+      idx = (idx + 1) % capacity
+
+  def buckets(self, resolution_ms: int, span_ms: int | None = None):
+    """
+    Iterates over the rollup buckets of a given resolution, oldest first.
+
+    Args:
+      resolution_ms: The bucket duration in milliseconds of the rollup. Must be one of `resolutions_ms`.
+      span_ms: The optional span in milliseconds before now to limit the buckets to. Defaults to `None` for all buckets.
+
+    Raises:
+      ValueError: If `resolution_ms` is not one of `resolutions_ms`.
+
+    Yields:
+      A `(start_tick, min, max, mean)` tuple for each bucket.
+    """
+    rollup = self.__rollup(resolution_ms)
+    capacity = rollup.capacity
+    idx = (rollup.idx - rollup.count + 1) % capacity
+    now = ticks_ms()
+
+    for _ in range(rollup.count):
+      if span_ms is None or ticks_diff(now, rollup.starts[idx]) < span_ms + rollup.resolution_ms:
+        yield (rollup.starts[idx], rollup.mins[idx], rollup.maxs[idx], rollup.total(idx) / rollup.counts[idx])
+      idx = (idx + 1) % capacity
+
+  def summary(self, span_ms: int) -> tuple[float, float, float] | None:
+    """
+    Gets the min, max, and mean of the samples recorded within a span before now.
+
+    Reads the finest rollup whose ring covers the span, so the span is rounded out to whole buckets of that rollup.
+    Falls back to the coarsest rollup if none covers the span.
+
+    Args:
+      span_ms: The span in milliseconds before now.
+
+    Returns:
+      A `(min, max, mean)` tuple, or `None` if no samples were recorded within the span.
+    """
+    if not self.__rollups:
+      return self.__summarize_samples(span_ms)
+
+    rollup = self.__rollups[-1]
+    for candidate in self.__rollups:
+      if candidate.resolution_ms * candidate.capacity >= span_ms:
+        rollup = candidate
+        break
+
+    min_value = max_value = total = 0.0
+    count = 0
+    idx = rollup.idx
+    now = ticks_ms()
+
+    for _ in range(rollup.count): # Newest bucket first, stopping at the first bucket that ends before the span.
+      if ticks_diff(now, rollup.starts[idx]) >= span_ms + rollup.resolution_ms:
+        break
+      if not count or rollup.mins[idx] < min_value:
+        min_value = rollup.mins[idx]
+      if not count or rollup.maxs[idx] > max_value:
+        max_value = rollup.maxs[idx]
+      total += rollup.total(idx)
+      count += rollup.counts[idx]
+      idx = (idx - 1) % rollup.capacity
+
+    return (min_value, max_value, total / count) if count else None
+
+  def __summarize_samples(self, span_ms: int) -> tuple[float, float, float] | None:
+    """
+    Gets the min, max, and mean of the raw samples recorded within a span before now.
+
+    Args:
+      span_ms: The span in milliseconds before now.
+
+    Returns:
+      A `(min, max, mean)` tuple, or `None` if no raw samples were recorded within the span.
+    """
+    values = [value for _, value in self.samples(span_ms)]
+    return (min(values), max(values), sum(values) / len(values)) if values else None
+
+  def __rollup(self, resolution_ms: int) -> _Rollup:
+    """
+    Gets the rollup of a given resolution.
+
+    Args:
+      resolution_ms: The bucket duration in milliseconds of the rollup.
+
+    Raises:
+      ValueError: If `resolution_ms` is not one of `resolutions_ms`.
+
+    Returns:
+      The rollup.
+    """
+    for rollup in self.__rollups:
+      if rollup.resolution_ms == resolution_ms:
+        return rollup
+
+    raise ValueError(f"Invalid resolution_ms value. Must be one of {self.resolutions_ms}; was given {resolution_ms}.")